@@ -0,0 +1,82 @@
+"""
+Measures the cold import time of chio, using `python -X importtime`
+inside fresh interpreter processes.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--version 20250306]
+
+Next to `import chio` itself, it also measures the import followed by
+selecting a single client, which loads that client's module chain.
+"""
+from typing import Dict, List
+
+import statistics
+import argparse
+import subprocess
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(code: str) -> Dict[str, int]:
+    """
+    Run the code in a fresh interpreter and return the cumulative import
+    time in µs of every top-level import, i.e. one that was not nested
+    inside of another import.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        cwd=ROOT,
+        check=True,
+        text=True
+    )
+    times = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        if not cumulative.strip().isdigit():
+            continue
+
+        if name.startswith("  "):
+            # Nested imports are already part of their parent
+            continue
+
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+def run(code: str, runs: int) -> List[Dict[str, int]]:
+    # Warm up the filesystem cache & bytecode, so that only the import is measured
+    measure(code)
+    return [measure(code) for _ in range(runs)]
+
+def report(title: str, results: List[Dict[str, int]]) -> None:
+    totals = [
+        sum(time for name, time in result.items() if name.split(".")[0] == "chio")
+        for result in results
+    ]
+
+    print(f"{title}:")
+    print(f"  median: {statistics.median(totals) / 1000:.2f}ms")
+    print(f"  min:    {min(totals) / 1000:.2f}ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the import time of chio")
+    parser.add_argument("--runs", type=int, default=10, help="Number of interpreter processes per measurement")
+    parser.add_argument("--version", type=int, default=20250306, help="Client version to select after importing")
+    args = parser.parse_args()
+
+    report("import chio", run("import chio", args.runs))
+    report(
+        f"import chio + select_client({args.version})",
+        run(f"import chio; chio.select_client({args.version})", args.runs)
+    )
+
+if __name__ == "__main__":
+    main()
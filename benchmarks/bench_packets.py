@@ -0,0 +1,182 @@
+"""
+Measures the per-packet encoding & decoding time for every client
+version inside `ClientDict`.
+
+Usage:
+    python benchmarks/bench_packets.py [--save results.json] [--compare results.json]
+
+Run it with `--save` on one revision and with `--compare` on another,
+to get the speedup of every packet for each client version.
+"""
+from typing import Any, Callable, Dict, List, Tuple
+
+import argparse
+import logging
+import timeit
+import gzip
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+from chio import *
+from chio.clients import ClientDict
+
+def create_user() -> UserInfo:
+    return UserInfo(
+        id=2,
+        name="peppy",
+        presence=UserPresence(timezone=1, country_index=14, permissions=Permissions.Supporter),
+        stats=UserStats(rank=1, rscore=1234567890, tscore=9876543210, accuracy=0.9876, playcount=1234, pp=4321),
+        status=UserStatus(action=Status.Playing, text="Artist - Title [Insane]", beatmap_checksum="a" * 32, beatmap_id=75)
+    )
+
+def create_match() -> Match:
+    slots = [MatchSlot() for _ in range(16)]
+    slots[0] = MatchSlot(user_id=2, status=SlotStatus.NotReady, team=SlotTeam.Red)
+    slots[1] = MatchSlot(user_id=3, status=SlotStatus.Ready, team=SlotTeam.Blue)
+    return Match(
+        id=5, name="Test match", beatmap_text="Artist - Title [Insane]",
+        beatmap_id=75, beatmap_checksum="a" * 32, slots=slots, host_id=2
+    )
+
+def create_score_frame() -> ScoreFrame:
+    return ScoreFrame(
+        time=1000, id=0, total_300=100, total_100=10, total_50=1, total_geki=20,
+        total_katu=5, total_miss=2, total_score=1234567, max_combo=300,
+        current_combo=120, perfect=False, hp=200, tag_byte=0
+    )
+
+def create_bundle() -> ReplayFrameBundle:
+    frames = [ReplayFrame(ButtonState.Left1, 0, 256.0, 192.0, index * 16) for index in range(32)]
+    return ReplayFrameBundle(ReplayAction.Standard, frames, create_score_frame(), sequence=1)
+
+def server_packets() -> List[Tuple[str, PacketType, Tuple[Any, ...]]]:
+    user = create_user()
+    return [
+        ("stats", PacketType.BanchoUserStats, (user,)),
+        ("presence", PacketType.BanchoUserPresence, (user,)),
+        ("message", PacketType.BanchoMessage, (Message("peppy", "Hello, World!", "#osu", 2),)),
+        ("match", PacketType.BanchoMatchUpdate, (create_match(),)),
+        ("frames", PacketType.BanchoSpectateFrames, (create_bundle(),)),
+        ("score", PacketType.BanchoMatchScoreUpdate, (create_score_frame(),)),
+        ("ping", PacketType.BanchoPing, ()),
+    ]
+
+def resolve_packet_id(client: BanchoIO, packet: PacketType) -> int:
+    for packet_id in range(0x100):
+        try:
+            if client.convert_input_packet(packet_id) is packet:
+                return packet_id
+        except ValueError:
+            continue
+
+    return -1
+
+def encode_client_packet(client: BanchoIO, packet: PacketType, data: bytes) -> bytes:
+    packet_id = resolve_packet_id(client, packet)
+
+    if client.header_size == 6:
+        data = gzip.compress(data)
+        return packet_id.to_bytes(2, "little") + len(data).to_bytes(4, "little") + data
+
+    return packet_id.to_bytes(2, "little") + b"\x00" + len(data).to_bytes(4, "little") + data
+
+def client_packets(client: BanchoIO) -> List[Tuple[str, bytes]]:
+    packets = []
+    user = create_user()
+
+    if client.implements_packet(PacketType.OsuUserStatus):
+        data = bytes(client.write_status_update(user.status))
+        packets.append(("status", encode_client_packet(client, PacketType.OsuUserStatus, data)))
+
+    if client.implements_packet(PacketType.OsuSpectateFrames):
+        _, data = next(iter(client.write_spectate_frames(create_bundle())))
+        packets.append(("frames", encode_client_packet(client, PacketType.OsuSpectateFrames, bytes(data))))
+
+    if client.implements_packet(PacketType.OsuMatchScoreUpdate):
+        _, data = next(iter(client.write_match_score_update(create_score_frame())))
+        packets.append(("score", encode_client_packet(client, PacketType.OsuMatchScoreUpdate, bytes(data))))
+
+    if client.implements_packet(PacketType.OsuMatchChangeSettings):
+        match = create_match()
+        match.slots = match.slots[:client.slot_size]
+        data = bytes(client.write_match(match))
+        packets.append(("match", encode_client_packet(client, PacketType.OsuMatchChangeSettings, data)))
+
+    return packets
+
+def measure(function: Callable, number: int) -> float:
+    # Take the best of three runs, in microseconds per call
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1_000_000
+
+def run(number: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    seen = set()
+
+    for version, client in ClientDict.items():
+        if type(client) in seen:
+            continue
+
+        seen.add(type(client))
+        timings = results.setdefault(f"b{client.version}", {})
+
+        for name, packet, args in server_packets():
+            if not client.implements_packet(packet):
+                continue
+
+            timings[f"write:{name}"] = measure(
+                lambda: client.write_packet_to_bytes(packet, *args),
+                number
+            )
+
+        for name, data in client_packets(client):
+            timings[f"read:{name}"] = measure(
+                lambda: client.read_packet_from_bytes(data),
+                number
+            )
+
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-packet benchmark for every client version")
+    parser.add_argument("--number", type=int, default=500, help="iterations per measurement")
+    parser.add_argument("--save", help="save the results to a json file")
+    parser.add_argument("--compare", help="compare the results against a json file")
+    args = parser.parse_args()
+
+    results = run(args.number)
+    baseline = {}
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    speedups = []
+
+    for version, timings in results.items():
+        columns = []
+
+        for name, value in timings.items():
+            previous = baseline.get(version, {}).get(name)
+
+            if not previous:
+                columns.append(f"{name}={value:.2f}us")
+                continue
+
+            speedups.append(previous / value)
+            columns.append(f"{name}={value:.2f}us ({previous / value:.2f}x)")
+
+        print(f"{version:>10}: " + ", ".join(columns))
+
+    if speedups:
+        print(f"\nAverage speedup: {sum(speedups) / len(speedups):.2f}x over {len(speedups)} packets")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measures `chio.transcode` across client versions, compared to decoding the
+client packet into objects and encoding the server packet again.
+
+Usage:
+    python benchmarks/bench_transcode.py [--number 2000] [--frames 32] [--versions 282 334 20121212 20160404 20250306]
+
+Each cell shows the time per transcoded packet, along with the speedup
+over the object-level conversion. Pairs marked with '*' share a layout,
+so their bodies are forwarded with a new header.
+"""
+from typing import Callable, List, Tuple
+
+import argparse
+import logging
+import timeit
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+from chio import *
+from chio.relay import TranscodePackets, encode_body, layouts_match
+from chio.io import MemoryStream, compress, write_boolean, write_u16, write_u32
+
+def create_bundle(frames: int) -> ReplayFrameBundle:
+    return ReplayFrameBundle(
+        ReplayAction.Standard,
+        [ReplayFrame(ButtonState.Left1, 0, 256.0 + index, 192.0, 16 * index) for index in range(frames)],
+        ScoreFrame(0, 0, 100, 10, 1, 20, 5, 2, 1234567, 300, 120, False, 200, 0),
+        extra=0, sequence=1
+    )
+
+def create_match(io: BanchoIO) -> Match:
+    slots = [MatchSlot() for _ in range(io.slot_size)]
+    slots[0] = MatchSlot(2, SlotStatus.NotReady)
+    slots[1] = MatchSlot(3, SlotStatus.Ready)
+    return Match(id=5, name="Test match", beatmap_text="Artist - Title [Insane]", slots=slots, host_id=2)
+
+def encode_client_packet(io: BanchoIO, packet: PacketType, output_packet: PacketType, value) -> bytes:
+    """Encode a packet as the client would send it, i.e. in the same layout as the server packet"""
+    packet_data = encode_body(type(io), output_packet, value)
+    packet_id = type(io).packet_tables().input_packets.index(packet)
+    stream = MemoryStream()
+    write_u16(stream, packet_id)
+
+    if io.header_size == 6:
+        packet_data = compress(packet_data)
+    else:
+        write_boolean(stream, False)
+
+    write_u32(stream, len(packet_data))
+    stream.write(packet_data)
+    return stream.data
+
+def decode_encode(source: BanchoIO, target: BanchoIO, packet_bytes: bytes) -> Callable[[], bytes]:
+    def convert() -> bytes:
+        packet, value = source.read_packet(MemoryStream(packet_bytes))
+        return target.write_packet_to_bytes(TranscodePackets[packet], value)
+
+    return convert
+
+def measure_time(function: Callable[[], object], number: int) -> float:
+    """Return the best time per call in µs"""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1_000_000
+
+def cases(io: BanchoIO, frames: int) -> List[Tuple[str, PacketType, PacketType, object]]:
+    return [
+        ("spectate frames", PacketType.OsuSpectateFrames, PacketType.BanchoSpectateFrames, create_bundle(frames)),
+        ("match settings", PacketType.OsuMatchChangeSettings, PacketType.BanchoMatchUpdate, create_match(io))
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark version-to-version packet transcoding")
+    parser.add_argument("--number", type=int, default=2000, help="Number of calls per measurement")
+    parser.add_argument("--frames", type=int, default=32, help="Number of replay frames per spectate packet")
+    parser.add_argument("--versions", type=int, nargs="+", default=[282, 334, 20121212, 20160404, 20250306])
+    args = parser.parse_args()
+
+    clients = [select_client(version) for version in args.versions]
+    names = [str(version) for version in args.versions]
+
+    case_names = [case[0] for case in cases(clients[0], args.frames)]
+
+    for index, case_name in enumerate(case_names):
+        print(f"{case_name} (from \\ to)")
+        print(f"{'':<10}" + "".join(f"{version:>20}" for version in names))
+
+        for source, source_name in zip(clients, names):
+            _, packet, output_packet, value = cases(source, args.frames)[index]
+
+            if not source.implements_packet(packet):
+                continue
+
+            packet_bytes = encode_client_packet(source, packet, output_packet, value)
+            row = f"{source_name:<10}"
+
+            for target in clients:
+                if not target.implements_packet(output_packet):
+                    row += f"{'-':>20}"
+                    continue
+
+                transcode_time = measure_time(lambda: transcode(packet_bytes, source, target), args.number)
+                object_time = measure_time(decode_encode(source, target, packet_bytes), args.number)
+                marker = "*" if layouts_match(source, target, packet) else " "
+                row += f"{transcode_time:>9.1f}µs {object_time / transcode_time:>5.1f}x{marker}"
+
+            print(row)
+
+        print()
+
+if __name__ == "__main__":
+    main()
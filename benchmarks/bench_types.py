@@ -0,0 +1,111 @@
+"""
+Compares the regular datatypes of chio with their slotted variants, by
+measuring the memory used per object and the encoding & decoding throughput.
+
+Usage:
+    python benchmarks/bench_types.py [--objects 100000] [--number 2000] [--version 20250306]
+
+The memory is measured with tracemalloc while keeping the objects alive,
+so it includes nested objects like the presence, stats & status of a user.
+"""
+from typing import Callable, List, Tuple
+
+import tracemalloc
+import argparse
+import logging
+import timeit
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+logging.disable(logging.CRITICAL)
+
+from chio import *
+
+def create_user(user_info=UserInfo) -> UserInfo:
+    user = user_info(id=2, name="peppy")
+    user.stats.rank = 1
+    user.stats.rscore = 1234567890
+    user.stats.accuracy = 0.9876
+    user.status.action = Status.Playing
+    user.status.text = "Artist - Title [Insane]"
+    return user
+
+def create_match(match=Match, match_slot=MatchSlot) -> Match:
+    return match(id=5, name="Test match", slots=[match_slot() for _ in range(16)])
+
+def create_frame(replay_frame=ReplayFrame) -> ReplayFrame:
+    return replay_frame(ButtonState.Left1, 0, 256.0, 192.0, 16)
+
+def create_score_frame(score_frame=ScoreFrame) -> ScoreFrame:
+    return score_frame(1000, 0, 100, 10, 1, 20, 5, 2, 1234567, 300, 120, False, 200, 0)
+
+def measure_memory(factory: Callable[[], object], count: int) -> float:
+    """Return the average amount of bytes allocated per object"""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Don't count the list that keeps the objects alive
+    return (end - start - sys.getsizeof(objects)) / count
+
+def measure_time(function: Callable[[], object], number: int) -> float:
+    """Return the best time per call in µs"""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1_000_000
+
+def memory_cases() -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    return [
+        ("UserInfo", create_user, lambda: create_user(SlottedUserInfo)),
+        ("Match (16 slots)", create_match, lambda: create_match(SlottedMatch, SlottedMatchSlot)),
+        ("ReplayFrame", create_frame, lambda: create_frame(SlottedReplayFrame)),
+        ("ScoreFrame", create_score_frame, lambda: create_score_frame(SlottedScoreFrame)),
+        ("Message", lambda: Message("peppy", "hello", "#osu"), lambda: SlottedMessage("peppy", "hello", "#osu"))
+    ]
+
+def throughput_cases(io: BanchoIO) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    user, slotted_user = create_user(), create_user(SlottedUserInfo)
+    match, slotted_match = create_match(), create_match(SlottedMatch, SlottedMatchSlot)
+    frames = [create_frame() for _ in range(32)]
+    slotted_frames = [create_frame(SlottedReplayFrame) for _ in range(32)]
+    bundle = ReplayFrameBundle(frames=frames, frame=create_score_frame())
+    slotted_bundle = ReplayFrameBundle(frames=slotted_frames, frame=create_score_frame(SlottedScoreFrame))
+
+    def write(packet: PacketType, *args) -> Callable[[], bytes]:
+        return lambda: io.write_packet_to_bytes(packet, *args)
+
+    return [
+        ("write stats", write(PacketType.BanchoUserStats, user), write(PacketType.BanchoUserStats, slotted_user)),
+        ("write match", write(PacketType.BanchoMatchUpdate, match), write(PacketType.BanchoMatchUpdate, slotted_match)),
+        ("write frames", write(PacketType.BanchoSpectateFrames, bundle), write(PacketType.BanchoSpectateFrames, slotted_bundle)),
+        ("create user", create_user, lambda: create_user(SlottedUserInfo)),
+        ("read stats", lambda: user.stats.rscore + user.stats.rank, lambda: slotted_user.stats.rscore + slotted_user.stats.rank)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare regular & slotted datatypes")
+    parser.add_argument("--objects", type=int, default=100000, help="Number of objects for the memory measurement")
+    parser.add_argument("--number", type=int, default=2000, help="Number of calls per throughput measurement")
+    parser.add_argument("--version", type=int, default=20250306, help="Client version to encode the packets with")
+    args = parser.parse_args()
+
+    print(f"{'memory per object':<20} {'dataclass':>12} {'slotted':>12} {'saved':>8}")
+
+    for name, regular, slotted in memory_cases():
+        regular_size = measure_memory(regular, args.objects)
+        slotted_size = measure_memory(slotted, args.objects)
+        saved = 1 - slotted_size / regular_size
+        print(f"{name:<20} {regular_size:>11.0f}B {slotted_size:>11.0f}B {saved:>7.1%}")
+
+    io = select_client(args.version)
+    print()
+    print(f"{'throughput':<20} {'dataclass':>12} {'slotted':>12} {'speedup':>8}")
+
+    for name, regular, slotted in throughput_cases(io):
+        regular_time = measure_time(regular, args.number)
+        slotted_time = measure_time(slotted, args.number)
+        print(f"{name:<20} {regular_time:>10.2f}µs {slotted_time:>10.2f}µs {regular_time / slotted_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
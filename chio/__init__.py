@@ -4,9 +4,27 @@ __email__ = "contact@lekuru.xyz"
 __version__ = "1.1.20"
 __license__ = "MIT"
 
-from .utils import select_client, select_latest_client, select_initial_client, resolve_country_index
+from .utils import select_client, select_latest_client, select_initial_client, client_version_ranges, resolve_country_index
 from .patching import patch, set_protocol_version, set_slot_size
-from .chio import BanchoIO
+from .chio import BanchoIO, PacketFrame
+from .decoder import PacketDecoder
+from .broadcast import Broadcaster, encode_for_clients, encode_for_sessions, fanout_message
+from .presence import PresenceSnapshot
+from .lobby import LobbySnapshot
+from .login import LoginBundle
+from .frames import ReplayFrameArray
+from .relay import relay_spectate_frames, relay_spectate_frames_for_clients, transcode
+from .lazy import LazyPacket
+from .capture import CaptureWriter, CaptureReader
 from .io import Stream
 from .constants import *
 from .types import *
+
+def __getattr__(name: str):
+    # The asyncio protocol is imported on demand, as
+    # importing asyncio itself takes a considerable amount of time
+    if name == "BanchoProtocol":
+        from .protocol import BanchoProtocol
+        return BanchoProtocol
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,218 @@
+
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from dataclasses import dataclass, field
+from types import CodeType, FunctionType
+from .chio import BanchoIO, BanchoIOMeta
+from .clients import ClientDict
+from .constants import PacketType
+
+# Attributes every encoded/decoded packet depends on, next to its handler.
+# These cover the packet id conversion, header format & compression.
+WriteAttributes = ("write_packet",)
+ReadAttributes = ("read_packet",)
+
+# Attributes that don't affect the encoded or decoded data, as
+# the version is only referenced inside of error messages
+IgnoredAttributes = frozenset(("version",))
+
+# Cached equivalence keys for each client class & packet, along
+# with the packet tables they were computed for
+EquivalenceKeys: Dict[Tuple[type, PacketType], Tuple[Any, Tuple]] = {}
+
+def resolve_client_class(client: Union[BanchoIO, Type[BanchoIO]]) -> Type[BanchoIO]:
+    return client if isinstance(client, type) else type(client)
+
+def iter_code_names(code: CodeType) -> Iterator[str]:
+    """Yield every global & attribute name that a code object, or any code nested inside of it, refers to"""
+    yield from code.co_names
+
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            yield from iter_code_names(constant)
+
+def resolve_function(value: Any) -> Union[FunctionType, None]:
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+
+    if not isinstance(value, FunctionType):
+        return None
+
+    return value
+
+def unwrap_function(function: FunctionType) -> FunctionType:
+    """Follow the `__wrapped__` attribute of decorated functions, e.g. patched handlers"""
+    while hasattr(function, "__wrapped__"):
+        function = function.__wrapped__
+
+    return function
+
+def iter_definitions(client_class: type, name: str) -> Iterator[Any]:
+    """Yield every definition of an attribute along the MRO of a class"""
+    for base in client_class.__mro__:
+        if name in base.__dict__:
+            yield base.__dict__[name]
+
+def resolve_dependencies(client_class: type, names: Iterable[str]) -> Tuple[Tuple[str, Hashable], ...]:
+    """
+    Resolve every class attribute that the given attributes depend on, by following
+    the names referenced inside of their code. Methods are resolved to the functions
+    that implement them, including the ones reached through `super()` calls, and
+    data attributes are resolved to their value.
+    """
+    dependencies: Dict[str, Hashable] = {}
+    pending: List[str] = list(names)
+
+    while pending:
+        name = pending.pop()
+
+        if name in dependencies or name in IgnoredAttributes or name.startswith("_"):
+            continue
+
+        definitions = iter_definitions(client_class, name)
+        value = next(definitions, None)
+        function = resolve_function(value)
+
+        if function is None:
+            dependencies[name] = getattr(client_class, name, None)
+            continue
+
+        functions = [function]
+
+        # Follow `super()` calls to the next definitions along the MRO
+        while "super" in set(iter_code_names(unwrap_function(function).__code__)):
+            function = resolve_function(next(definitions, None))
+
+            if function is None:
+                break
+
+            functions.append(function)
+
+        dependencies[name] = tuple(functions)
+
+        for function in functions:
+            code = unwrap_function(function).__code__
+
+            pending.extend(
+                referenced_name
+                for referenced_name in iter_code_names(code)
+                if hasattr(client_class, referenced_name)
+            )
+
+    return tuple(sorted(dependencies.items(), key=lambda item: item[0]))
+
+def equivalence_key(client: Union[BanchoIO, Type[BanchoIO]], packet: PacketType) -> Tuple:
+    """
+    Return a key for the given client & packet, which is equal for every client
+    that encodes (or decodes) the packet the same way, given the same arguments.
+    """
+    client_class = resolve_client_class(client)
+    tables = client_class.packet_tables()
+    cached = EquivalenceKeys.get((client_class, packet))
+
+    # The packet tables get rebuilt when a client is patched,
+    # which also means that the key needs to be recomputed
+    if cached is not None and cached[0] is tables:
+        return cached[1]
+
+    attributes = WriteAttributes if packet.is_server_packet else ReadAttributes
+    key = resolve_dependencies(client_class, (*attributes, packet.handler_name))
+    EquivalenceKeys[(client_class, packet)] = (tables, key)
+    return key
+
+@dataclass
+class EquivalenceClass:
+    id: int
+    key: Tuple
+    handler_owner: Optional[type] = None
+    clients: List[Type[BanchoIO]] = field(default_factory=list)
+    versions: List[int] = field(default_factory=list)
+
+    @property
+    def client(self) -> Type[BanchoIO]:
+        """The oldest client class, that represents this equivalence class"""
+        return self.clients[0]
+
+    @property
+    def dependencies(self) -> Dict[str, Hashable]:
+        """The attributes that the handler depends on, with their resolved values"""
+        return dict(self.key)
+
+class EquivalenceTable:
+    """
+    EquivalenceTable groups every client inside of `ClientDict` into equivalence
+    classes for a single packet. Clients inside the same class encode & decode the
+    packet in the same way, so they can share cached bytes under a small class id.
+    """
+
+    def __init__(self, packet: PacketType) -> None:
+        self.packet = packet
+        self.classes: List[EquivalenceClass] = []
+        self.class_ids: Dict[Type[BanchoIO], int] = {}
+        self.key_ids: Dict[Tuple, int] = {}
+        self.version_ids: Dict[int, int] = {}
+
+        for version in sorted(ClientDict):
+            client_class = resolve_client_class(ClientDict[version])
+            class_id = self.class_id(client_class)
+            self.classes[class_id].versions.append(version)
+            self.version_ids[version] = class_id
+
+    def __len__(self) -> int:
+        return len(self.classes)
+
+    def __iter__(self) -> Iterator[EquivalenceClass]:
+        return iter(self.classes)
+
+    def class_id(self, client: Union[BanchoIO, Type[BanchoIO]]) -> int:
+        """Return the equivalence class id of a client, which may also be a client outside of `ClientDict`"""
+        client_class = resolve_client_class(client)
+
+        if client_class in self.class_ids:
+            return self.class_ids[client_class]
+
+        key = equivalence_key(client_class, self.packet)
+
+        if key not in self.key_ids:
+            # The class in the MRO that defines the handler of this packet
+            handler_owner = next(
+                (base for base in client_class.__mro__ if self.packet.handler_name in base.__dict__),
+                None
+            )
+            self.key_ids[key] = len(self.classes)
+            self.classes.append(EquivalenceClass(len(self.classes), key, handler_owner))
+
+        class_id = self.class_ids[client_class] = self.key_ids[key]
+        self.classes[class_id].clients.append(client_class)
+        return class_id
+
+# Cached equivalence tables for each packet, along with
+# the revision of the clients they were computed for
+EquivalenceTables: Dict[PacketType, Tuple[Tuple[int, int], EquivalenceTable]] = {}
+
+def equivalence_table(packet: PacketType) -> EquivalenceTable:
+    """
+    Return the equivalence classes of every client for the given packet.
+    The table is cached until any client is patched or `ClientDict` changes.
+    """
+    revision = (BanchoIOMeta.revision, ClientDict.revision)
+    cached = EquivalenceTables.get(packet)
+
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    table = EquivalenceTable(packet)
+    EquivalenceTables[packet] = (revision, table)
+    return table
+
+def refresh_equivalence_table(packet: PacketType, table: Optional[EquivalenceTable]) -> Tuple[EquivalenceTable, bool]:
+    """
+    Return the current equivalence table of a packet, and whether it differs from the given one.
+    Class ids are only valid for a single table, which gets rebuilt whenever any of the clients
+    were patched, so everything that was cached by class id has to be discarded once it changed.
+    """
+    current = equivalence_table(packet)
+    return current, current is not table
+
+def equivalence_class_id(client: Union[BanchoIO, Type[BanchoIO]], packet: PacketType) -> int:
+    """Return the equivalence class id of a client for the given packet"""
+    return equivalence_table(packet).class_id(client)
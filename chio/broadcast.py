@@ -0,0 +1,123 @@
+
+from typing import Any, Dict, Iterable, List, Tuple, Type
+from .analysis import equivalence_table, resolve_client_class
+from .constants import PacketType
+from .types import Message
+from .chio import BanchoIO
+
+def encode_for_clients(clients: Iterable[BanchoIO], packet: PacketType, *args) -> Dict[Type[BanchoIO], bytes]:
+    """
+    Encode a packet for multiple clients, and return the encoded bytes for each client class.
+    The packet is only encoded once for every group of clients, that produce the same output.
+    """
+    table = equivalence_table(packet)
+    encoded: Dict[int, bytes] = {}
+    result: Dict[Type[BanchoIO], bytes] = {}
+
+    for client in clients:
+        client_class = resolve_client_class(client)
+
+        if client_class in result:
+            continue
+
+        class_id = table.class_id(client_class)
+
+        if class_id not in encoded:
+            encoded[class_id] = client_class.write_packet_to_bytes(packet, *args)
+
+        result[client_class] = encoded[class_id]
+
+    return result
+
+def encode_for_sessions(sessions: Iterable[Tuple[BanchoIO, Any]], packet: PacketType, *args) -> Dict[Type[BanchoIO], bytes]:
+    """
+    Encode a packet for multiple sessions, each consisting of a client & its stream,
+    and return the encoded bytes for each client class.
+    """
+    return encode_for_clients((client for client, _ in sessions), packet, *args)
+
+def fanout_message(
+    sessions: Iterable[Tuple[BanchoIO, Any]],
+    message: Message,
+    sender: Any = None
+) -> List[Tuple[BanchoIO, Any]]:
+    """
+    Write a chat message to every session, except for the stream of the sender.
+    The message is only encoded once per group of clients that format & encode it
+    the same way, e.g. by chat link format. Returns the sessions whose client can
+    not receive the message, e.g. b282 for channels that it does not join automatically.
+    """
+    sessions = [session for session in sessions if session[1] is not sender]
+    encoded = encode_for_sessions(sessions, PacketType.BanchoMessage, message)
+    unreachable = []
+
+    for client, stream in sessions:
+        packet_data = encoded[resolve_client_class(client)]
+
+        if not packet_data:
+            unreachable.append((client, stream))
+            continue
+
+        stream.write(packet_data)
+
+    return unreachable
+
+class Broadcaster:
+    """
+    Broadcaster keeps track of multiple sessions, each consisting of a client
+    and its stream, and writes packets to all of them at once. Every packet is
+    only encoded once per group of clients, that produce the same output.
+    """
+
+    def __init__(self) -> None:
+        self.sessions: Dict[Any, BanchoIO] = {}
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def __contains__(self, stream: Any) -> bool:
+        return stream in self.sessions
+
+    def add(self, client: BanchoIO, stream: Any) -> None:
+        """Add a session to the broadcaster"""
+        self.sessions[stream] = client
+
+    def remove(self, stream: Any) -> None:
+        """Remove a session from the broadcaster, if it exists"""
+        self.sessions.pop(stream, None)
+
+    def encode(self, packet: PacketType, *args) -> Dict[Type[BanchoIO], bytes]:
+        """Encode a packet for every client class inside of the broadcaster"""
+        return encode_for_clients(self.sessions.values(), packet, *args)
+
+    def broadcast(self, packet: PacketType, *args) -> None:
+        """Encode a packet and write it to every session"""
+        encoded = self.encode(packet, *args)
+
+        for stream, client in self.sessions.items():
+            packet_data = encoded[resolve_client_class(client)]
+
+            if packet_data:
+                stream.write(packet_data)
+
+    def broadcast_message(self, message: Message, sender: Any = None) -> List[Any]:
+        """
+        Write a chat message to every session except for the sender's stream,
+        and return the streams whose client can not receive the message
+        """
+        unreachable = fanout_message(
+            ((client, stream) for stream, client in self.sessions.items()),
+            message, sender
+        )
+        return [stream for _, stream in unreachable]
+
+    async def broadcast_async(self, packet: PacketType, *args) -> None:
+        """Encode a packet and write it to every session, asynchronously"""
+        encoded = self.encode(packet, *args)
+
+        # Copy the sessions, in case they are modified while writing
+        for stream, client in list(self.sessions.items()):
+            packet_data = encoded[resolve_client_class(client)]
+
+            if packet_data:
+                await stream.write(packet_data)
@@ -0,0 +1,571 @@
+
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+from enum import IntEnum
+from struct import Struct
+from array import array
+from mmap import mmap, ACCESS_READ
+
+import time
+import os
+
+from .io import Stream, AsyncStream
+from .constants import PacketType
+from .utils import select_client
+from .chio import BanchoIO
+
+__all__ = [
+    "CaptureWriter",
+    "CaptureReader",
+    "CaptureStream",
+    "AsyncCaptureStream",
+    "CaptureSession",
+    "CaptureRecord",
+    "CapturedPacket",
+    "RecordKind"
+]
+
+# A capture file starts with the magic & format version, followed by records:
+#   kind (u8), session (u32), time in nanoseconds (u64), length (u32), data
+# Sessions are opened with a record containing the client version (s32) & address,
+# and every other record holds a raw chunk of bytes that was read from or written
+# to the session, i.e. packets may be split across multiple records.
+CaptureMagic = b"CHIOCAP"
+CaptureVersion = 1
+FileHeader = Struct("<7sB")
+RecordHeader = Struct("<BIQI")
+SessionHeader = Struct("<i")
+
+class RecordKind(IntEnum):
+    SessionOpen  = 0
+    Incoming     = 1 # Sent by the client
+    Outgoing     = 2 # Sent by the server
+    SessionClose = 3
+
+class CaptureSession:
+    """
+    A single recorded connection, along with the client version that its packets are framed with.
+    """
+
+    def __init__(self, id: int, version: int, address: str, start: float) -> None:
+        self.id = id
+        self.version = version
+        self.address = address
+        self.start = start
+        self.end: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<CaptureSession {self.id} (b{self.version}, {self.address or 'unknown'})>"
+
+    @property
+    def io(self) -> Optional[BanchoIO]:
+        return select_client(self.version) if self.version > 0 else None
+
+class CaptureRecord(NamedTuple):
+    kind: RecordKind
+    session: int
+    time: float
+    data: bytes
+    time_ns: int
+
+class CapturedPacket(NamedTuple):
+    """
+    A single packet of a capture, including its header.
+    """
+    session: CaptureSession
+    direction: RecordKind
+    time: float
+    packet: PacketType
+    data: bytes
+    time_ns: int
+
+    def decode(self) -> Tuple[PacketType, Any]:
+        """Decode the packet the same way the server or client of the session would"""
+        if self.direction == RecordKind.Incoming:
+            return self.session.io.read_packet_from_bytes(self.data)
+
+        return self.session.io.read_server_packet_from_bytes(self.data)
+
+def scan_records(file: BinaryIO) -> Tuple[int, int, int]:
+    """
+    Walk over the record headers of a capture file, and return the highest session id,
+    the latest record time, as well as the end of the last complete record.
+    """
+    header = file.read(FileHeader.size)
+
+    if len(header) < FileHeader.size or FileHeader.unpack(header)[0] != CaptureMagic:
+        raise ValueError("File is not a capture file")
+
+    size = os.fstat(file.fileno()).st_size
+    last_session = 0
+    last_time = 0
+    end = file.tell()
+
+    while True:
+        header = file.read(RecordHeader.size)
+
+        if len(header) < RecordHeader.size:
+            break
+
+        _, session, timestamp, length = RecordHeader.unpack(header)
+        file.seek(length, os.SEEK_CUR)
+
+        if file.tell() > size:
+            break
+
+        last_session = max(last_session, session)
+        last_time = max(last_time, timestamp)
+        end = file.tell()
+
+    return last_session, last_time, end
+
+class CaptureWriter:
+    """
+    CaptureWriter appends the raw byte streams of sessions to a capture file. When opening an
+    existing capture, a record that was only partially written, e.g. after a crash, is cut off,
+    and new sessions continue after the existing ones.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = path
+        self.last_session = 0
+        self.last_time = 0
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "r+b") as file:
+                self.last_session, self.last_time, end = scan_records(file)
+                file.truncate(end)
+
+            self.file = open(path, "ab")
+        else:
+            self.file = open(path, "wb")
+            self.file.write(FileHeader.pack(CaptureMagic, CaptureVersion))
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def timestamp(self) -> int:
+        # Records are kept in order, even if the system clock goes backwards
+        self.last_time = max(self.last_time, time.time_ns())
+        return self.last_time
+
+    def write_record(self, kind: RecordKind, session: int, data: bytes) -> None:
+        self.file.write(RecordHeader.pack(kind, session, self.timestamp(), len(data)))
+        self.file.write(data)
+
+    def open_session(self, version: int, address: str = "") -> int:
+        """
+        Start recording a new session for the given client version, and return its id.
+        """
+        self.last_session += 1
+        self.write_record(
+            RecordKind.SessionOpen,
+            self.last_session,
+            SessionHeader.pack(version) + address.encode()
+        )
+        return self.last_session
+
+    def close_session(self, session: int) -> None:
+        self.write_record(RecordKind.SessionClose, session, b"")
+
+    def record_incoming(self, session: int, data: bytes) -> None:
+        """Record bytes that were received from the client"""
+        if data:
+            self.write_record(RecordKind.Incoming, session, data)
+
+    def record_outgoing(self, session: int, data: bytes) -> None:
+        """Record bytes that were sent to the client"""
+        if data:
+            self.write_record(RecordKind.Outgoing, session, data)
+
+    def stream(self, stream: Stream, version: int, address: str = "") -> "CaptureStream":
+        """Open a new session, that records everything read from & written to the stream"""
+        return CaptureStream(stream, self, self.open_session(version, address))
+
+    def stream_async(self, stream: AsyncStream, version: int, address: str = "") -> "AsyncCaptureStream":
+        """Open a new session, that records everything read from & written to the asynchronous stream"""
+        return AsyncCaptureStream(stream, self, self.open_session(version, address))
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+class CaptureStream(Stream):
+    """
+    Stream wrapper that records every read as incoming & every write as outgoing data of a session.
+    """
+
+    def __init__(self, stream: Stream, capture: CaptureWriter, session: int) -> None:
+        self.stream = stream
+        self.capture = capture
+        self.session = session
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.capture.record_incoming(self.session, data)
+        return data
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self.capture.record_outgoing(self.session, data)
+
+    def close(self) -> None:
+        self.capture.close_session(self.session)
+
+class AsyncCaptureStream(AsyncStream):
+    """
+    Asynchronous version of `CaptureStream`.
+    """
+
+    def __init__(self, stream: AsyncStream, capture: CaptureWriter, session: int) -> None:
+        self.stream = stream
+        self.capture = capture
+        self.session = session
+
+    async def read(self, size: int = -1) -> bytes:
+        data = await self.stream.read(size)
+        self.capture.record_incoming(self.session, data)
+        return data
+
+    async def write(self, data: bytes) -> None:
+        await self.stream.write(data)
+        self.capture.record_outgoing(self.session, data)
+
+    def close(self) -> None:
+        self.capture.close_session(self.session)
+
+class FrameState:
+    """
+    Tracks the packet that is currently being read from the byte stream of one direction of a session.
+    """
+    __slots__ = ("io", "records", "header", "remaining", "start_record", "start_offset", "start_position", "packet", "length", "login_lines", "broken")
+
+    def __init__(self, io: Optional[BanchoIO], incoming: bool) -> None:
+        self.io = io
+        self.records = array("I")
+        self.header = bytearray()
+        self.remaining = 0
+        self.start_record = 0
+        self.start_offset = 0
+        self.start_position = 0
+        self.packet = 0
+        self.length = 0
+        # Incoming streams may start with the plaintext login request, which is only
+        # known once its first bytes were read. Afterwards, this holds the amount of
+        # login lines that still need to be skipped.
+        self.login_lines: Optional[int] = None if incoming else 0
+        # Streams without a known client version, or with an invalid header, can't be framed
+        self.broken = io is None
+
+class CaptureReader:
+    """
+    CaptureReader memory-maps a capture file and indexes every packet inside of it by session,
+    packet type & time. Only the record & packet offsets are kept in memory, while the packet
+    data is read from the mapped file on access.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        self.buffer = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+
+        if self.buffer[:len(CaptureMagic)] != CaptureMagic:
+            raise ValueError("File is not a capture file")
+
+        self.sessions: Dict[int, CaptureSession] = {}
+        self.invalid_streams = 0
+
+        # Records, by their position in the file
+        self.record_offsets = array("Q")
+        self.record_lengths = array("I")
+        self.record_times = array("Q")
+        self.record_sessions = array("I")
+        self.record_kinds = array("B")
+
+        # Packets, in the order they were completed
+        self.packet_records = array("I")
+        self.packet_offsets = array("I")
+        self.packet_positions = array("I")
+        self.packet_lengths = array("I")
+        self.packet_times = array("Q")
+        self.packet_types = array("H")
+
+        self.session_packets: Dict[int, array] = {}
+        self.type_packets: Dict[PacketType, array] = {}
+        self.streams: Dict[Tuple[int, int], FrameState] = {}
+        self.build_index()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.packet_records)
+
+    def close(self) -> None:
+        self.buffer.close()
+        self.file.close()
+
+    def build_index(self) -> None:
+        offset = FileHeader.size
+        size = len(self.buffer)
+
+        while offset + RecordHeader.size <= size:
+            kind, session, timestamp, length = RecordHeader.unpack_from(self.buffer, offset)
+            data_offset = offset + RecordHeader.size
+
+            if data_offset + length > size:
+                # The last record was not written completely
+                break
+
+            record = len(self.record_offsets)
+            self.record_offsets.append(data_offset)
+            self.record_lengths.append(length)
+            self.record_times.append(timestamp)
+            self.record_sessions.append(session)
+            self.record_kinds.append(kind)
+            offset = data_offset + length
+
+            if kind == RecordKind.SessionOpen:
+                version, = SessionHeader.unpack_from(self.buffer, data_offset)
+                address = self.buffer[data_offset + SessionHeader.size:offset].decode(errors="replace")
+                self.sessions[session] = CaptureSession(session, version, address, timestamp / 1e9)
+                continue
+
+            if session not in self.sessions:
+                continue
+
+            if kind == RecordKind.SessionClose:
+                self.sessions[session].end = timestamp / 1e9
+                continue
+
+            self.index_record(record, session, kind, data_offset, length, timestamp)
+
+    def index_record(self, record: int, session: int, kind: int, offset: int, length: int, timestamp: int) -> None:
+        state = self.streams.get((session, kind))
+
+        if state is None:
+            state = self.streams[(session, kind)] = FrameState(self.sessions[session].io, kind == RecordKind.Incoming)
+
+        position = len(state.records)
+        state.records.append(record)
+
+        if state.broken:
+            return
+
+        io = state.io
+        header_size = io.header_size
+        end = offset + length
+        cursor = offset
+
+        while cursor < end:
+            if state.login_lines:
+                # Skip the login request, which ends with its third line
+                newline = self.buffer.find(b"\n", cursor, end)
+
+                if newline < 0:
+                    break
+
+                cursor = newline + 1
+                state.login_lines -= 1
+                continue
+
+            if state.remaining:
+                skipped = min(state.remaining, end - cursor)
+                state.remaining -= skipped
+                cursor += skipped
+
+                if not state.remaining:
+                    self.add_packet(state, session, timestamp)
+
+                continue
+
+            if not state.header:
+                state.start_record = record
+                state.start_offset = cursor - offset
+                state.start_position = position
+
+            try:
+                if not state.header and cursor + header_size <= end:
+                    if state.login_lines is None and self.buffer[cursor + 1]:
+                        state.login_lines = 3
+                        continue
+
+                    # The whole header is inside of this record, so it can be read in place
+                    packet_id, _, packet_length = io.read_packet_header(self.buffer, cursor)
+                    cursor += header_size
+                else:
+                    missing = header_size - len(state.header)
+                    state.header += self.buffer[cursor:min(cursor + missing, end)]
+                    cursor = min(cursor + missing, end)
+
+                    if len(state.header) < header_size:
+                        break
+
+                    if state.login_lines is None and state.header[1]:
+                        state.login_lines = 3 - state.header.count(b"\n")
+                        state.header.clear()
+                        continue
+
+                    packet_id, _, packet_length = io.read_packet_header(bytes(state.header))
+                    state.header.clear()
+
+                packet = io.resolve_input_packet(packet_id)
+            except Exception:
+                state.broken = True
+                self.invalid_streams += 1
+                return
+
+            state.login_lines = 0
+            state.packet = packet
+            state.length = header_size + packet_length
+            state.remaining = packet_length
+
+            if not packet_length:
+                self.add_packet(state, session, timestamp)
+
+    def add_packet(self, state: FrameState, session: int, timestamp: int) -> None:
+        index = len(self.packet_records)
+        self.packet_records.append(state.start_record)
+        self.packet_offsets.append(state.start_offset)
+        self.packet_positions.append(state.start_position)
+        self.packet_lengths.append(state.length)
+        self.packet_times.append(timestamp)
+        self.packet_types.append(state.packet)
+
+        if session not in self.session_packets:
+            self.session_packets[session] = array("I")
+
+        if state.packet not in self.type_packets:
+            self.type_packets[state.packet] = array("I")
+
+        self.session_packets[session].append(index)
+        self.type_packets[state.packet].append(index)
+
+    def records(self, session: Optional[int] = None) -> Iterator[CaptureRecord]:
+        """
+        Iterate over the raw records of the capture, or of a single session.
+        """
+        for record in range(len(self.record_offsets)):
+            if session is not None and self.record_sessions[record] != session:
+                continue
+
+            offset = self.record_offsets[record]
+            yield CaptureRecord(
+                RecordKind(self.record_kinds[record]),
+                self.record_sessions[record],
+                self.record_times[record] / 1e9,
+                self.buffer[offset:offset + self.record_lengths[record]],
+                self.record_times[record]
+            )
+
+    def packet_data(self, index: int) -> bytes:
+        """
+        Read the data of a packet including its header, which may be spread across multiple records.
+        """
+        record = self.packet_records[index]
+        remaining = self.packet_lengths[index]
+        offset = self.record_offsets[record] + self.packet_offsets[index]
+        available = self.record_offsets[record] + self.record_lengths[record] - offset
+
+        if remaining <= available:
+            return self.buffer[offset:offset + remaining]
+
+        state = self.streams[(self.record_sessions[record], self.record_kinds[record])]
+        position = self.packet_positions[index]
+        chunks = []
+
+        while remaining:
+            size = min(remaining, available)
+            chunks.append(self.buffer[offset:offset + size])
+            remaining -= size
+            position += 1
+
+            if remaining:
+                record = state.records[position]
+                offset = self.record_offsets[record]
+                available = self.record_lengths[record]
+
+        return b"".join(chunks)
+
+    def packet(self, index: int) -> CapturedPacket:
+        record = self.packet_records[index]
+        return CapturedPacket(
+            self.sessions[self.record_sessions[record]],
+            RecordKind(self.record_kinds[record]),
+            self.packet_times[index] / 1e9,
+            PacketType(self.packet_types[index]),
+            self.packet_data(index),
+            self.packet_times[index]
+        )
+
+    def seek(self, timestamp: float, indices: Optional[Sequence[int]] = None) -> int:
+        """
+        Return the position of the first packet at or after the given time, either
+        inside of the whole capture or inside of the given packet indices.
+        """
+        low, high = 0, len(self) if indices is None else len(indices)
+
+        while low < high:
+            middle = (low + high) // 2
+            index = middle if indices is None else indices[middle]
+
+            # Seconds can't hold every nanosecond timestamp, so the packet times are
+            # converted the same way as `CapturedPacket.time`, instead of the other way round
+            if self.packet_times[index] / 1e9 < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def packets(
+        self,
+        session: Optional[int] = None,
+        packet: Optional[PacketType] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        direction: Optional[RecordKind] = None
+    ) -> Iterator[CapturedPacket]:
+        """
+        Iterate over the packets of the capture in the order they were received, optionally filtered
+        by session, packet type, direction and a time range, whose end is exclusive.
+        """
+        indices: Optional[Sequence[int]] = None
+
+        if session is not None:
+            indices = self.session_packets.get(session, ())
+
+        if packet is not None:
+            packets = self.type_packets.get(packet, ())
+
+            if indices is None or len(packets) < len(indices):
+                indices = packets
+
+        first = self.seek(start, indices) if start is not None else 0
+        last = self.seek(end, indices) if end is not None else (len(self) if indices is None else len(indices))
+
+        for position in range(first, last):
+            index = position if indices is None else indices[position]
+            record = self.packet_records[index]
+
+            if session is not None and self.record_sessions[record] != session:
+                continue
+
+            if packet is not None and self.packet_types[index] != packet:
+                continue
+
+            if direction is not None and self.record_kinds[record] != direction:
+                continue
+
+            yield self.packet(index)
+
+    def packet_counts(self) -> Dict[PacketType, int]:
+        """Return the amount of packets of each packet type"""
+        return {packet: len(indices) for packet, indices in self.type_packets.items()}
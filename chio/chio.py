@@ -1,10 +1,159 @@
 
-from typing import Any, Tuple, Iterable
-from abc import ABC, abstractmethod
-from .io import Stream, MemoryStream, AsyncStream
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, FrozenSet, Iterator, NamedTuple, Optional, Tuple, Iterable
+from abc import ABCMeta, abstractmethod
+from .io import Stream, MemoryStream, AsyncStream, decompress
+from .decoder import PacketDecoder
 from .constants import PacketType
+from .types import Tracked, UserStatus
+from .lazy import LazyPacket
 
-class BanchoIO(ABC):
+if TYPE_CHECKING:
+    from asyncio import StreamReader
+
+# Wire ids below this value are resolved through a lookup table,
+# everything else falls back to `convert_input_packet`
+MaxPacketId = max(packet.value for packet in PacketType if packet.value < 0xFF) + 8
+
+# Packets whose encoded bytes can be cached on their argument, see `Tracked`
+CachedPackets = frozenset((
+    PacketType.BanchoUserStats,
+    PacketType.BanchoUserPresence,
+    PacketType.BanchoUserPresenceSingle
+))
+
+class PacketFrame(NamedTuple):
+    """
+    The header of a single packet inside a buffer, along with the byte
+    offsets of the packet and its (possibly compressed) body.
+    """
+    packet: PacketType
+    compressed: bool
+    length: int
+    offset: int
+    data_offset: int
+
+    @property
+    def end(self) -> int:
+        """The offset right after the body, where the next packet starts"""
+        return self.data_offset + self.length
+
+    def data(self, buffer: bytes) -> memoryview:
+        """Return the raw body of the packet, without copying it"""
+        return memoryview(buffer)[self.data_offset:self.end]
+
+    def raw(self, buffer: bytes) -> memoryview:
+        """Return the whole packet including its header, without copying it"""
+        return memoryview(buffer)[self.offset:self.end]
+
+class PacketTables:
+    """
+    PacketTables holds the precomputed packet lookups of a client class,
+    so that packets don't need to be converted & resolved on every call.
+    """
+
+    def __init__(self, client: type) -> None:
+        self.client = client
+        self.input_packets: Tuple[Optional[PacketType], ...] = tuple(
+            self.try_resolve(client.convert_input_packet, packet_id)
+            for packet_id in range(MaxPacketId)
+        )
+        self.output_packets: Dict[PacketType, int] = {
+            packet: packet_id
+            for packet in PacketType
+            if (packet_id := self.try_resolve(client.convert_output_packet, packet)) is not None
+        }
+        self.handlers: Dict[PacketType, Callable] = {
+            packet: handler
+            for packet in PacketType
+            if (handler := getattr(client, packet.handler_name, None)) is not None
+        }
+        self.implemented: FrozenSet[PacketType] = frozenset(self.handlers)
+
+        # Handlers for the opposite direction, i.e. writers for client packets and
+        # readers for server packets, which are used to act as the client itself
+        self.client_handlers: Dict[PacketType, Callable] = {
+            packet: handler
+            for packet in PacketType
+            if (handler := getattr(client, packet.client_handler_name, None)) is not None
+            and self.is_resolvable(packet)
+        }
+
+        # Pre-encoded packets, whose writers don't depend on their arguments.
+        # They are filled on first use, with `None` for every other packet.
+        self.static_packets: Dict[PacketType, Optional[bytes]] = {}
+
+    def is_resolvable(self, packet: PacketType) -> bool:
+        """
+        Check if the packet id of a packet type resolves back to the same packet type,
+        since the id conversions of a client are shared between both directions.
+        """
+        packet_id = self.output_packets.get(packet)
+
+        if packet_id is None or packet_id >= MaxPacketId:
+            return False
+
+        return self.input_packets[packet_id] is packet
+
+    @staticmethod
+    def is_static_writer(writer: Callable) -> bool:
+        """
+        Check if a writer can be pre-encoded, i.e. it takes no arguments besides
+        the client class, so that a writer receiving any value is always called with it.
+        """
+        function = getattr(writer, "__func__", writer)
+
+        # Patched writers are wrapped, so check the actual implementation
+        while hasattr(function, "__wrapped__"):
+            function = function.__wrapped__
+
+        code = function.__code__
+
+        if code.co_flags & 0x0C:
+            # Writers with *args or **kwargs are never static
+            return False
+
+        return code.co_argcount + code.co_kwonlyargcount == 1
+
+    @staticmethod
+    def try_resolve(converter: Callable, packet: Any) -> Optional[Any]:
+        try:
+            return converter(packet)
+        except Exception:
+            # Invalid packets are resolved at runtime, to raise the original error
+            return None
+
+class BanchoIOMeta(ABCMeta):
+    """
+    Metaclass for client implementations, that discards the packet
+    tables of a client and all of its subclasses whenever one of
+    its attributes is modified, e.g. through `chio.patch`.
+    """
+
+    # Incremented on every modification of any client, so
+    # that caches across all clients can be invalidated
+    revision: int = 0
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name in cls.__dict__ and cls.__dict__[name] is value:
+            return
+
+        super().__setattr__(name, value)
+
+        if not name.startswith("_"):
+            cls.invalidate_packet_tables()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        cls.invalidate_packet_tables()
+
+    def invalidate_packet_tables(cls) -> None:
+        BanchoIOMeta.revision += 1
+        type.__setattr__(cls, "_packet_tables", None)
+
+        for subclass in cls.__subclasses__():
+            subclass.invalidate_packet_tables()
+
+class BanchoIO(metaclass=BanchoIOMeta):
     """
     BanchoIO is an interface that wraps the basic methods for
     reading and writing packets to a Bancho client.
@@ -16,7 +165,10 @@ class BanchoIO(ABC):
     format_chat_links: bool = True
     disable_compression: bool = False
     requires_status_updates: bool = True
+    replay_frame_arrays: bool = False
+    lazy_packets: bool = False
     autojoin_channels: Tuple[str, ...] = ("#osu", "#announce")
+    _packet_tables: Optional[PacketTables] = None
 
     @classmethod
     @abstractmethod
@@ -35,6 +187,21 @@ class BanchoIO(ABC):
         """
         ...
 
+    @classmethod
+    @abstractmethod
+    def write_frame(cls, stream: MemoryStream, packet_id: int, packet_data: bytes) -> None:
+        """
+        Writes the header and the (compressed) data of a single encoded packet id to the stream.
+        """
+        ...
+
+    @classmethod
+    def write_packet_frame(cls, stream: MemoryStream, packet: PacketType, packet_data: bytes) -> None:
+        """
+        Writes the header and the (compressed) data of a single encoded packet to the stream.
+        """
+        cls.write_frame(stream, cls.resolve_output_packet(packet), packet_data)
+
     @classmethod
     @abstractmethod
     async def read_packet_async(cls, stream: AsyncStream) -> Tuple[PacketType, Any]:
@@ -49,9 +216,58 @@ class BanchoIO(ABC):
     async def write_packet_async(cls, stream: AsyncStream, packet: PacketType, *args) -> None:
         """
         Encodes a packet and writes it to the stream, asynchronously.
+        All sub-packets of the packet are written at once.
         """
         ...
 
+    @classmethod
+    @abstractmethod
+    def read_packet_header(cls, buffer: bytes, offset: int = 0) -> Tuple[int, bool, int]:
+        """
+        Decodes a packet header from the buffer at the given offset, and returns
+        the packet id, whether the body is compressed and the body length.
+        """
+        ...
+
+    @classmethod
+    def peek_header(cls, buffer: bytes, offset: int = 0) -> Optional[PacketFrame]:
+        """
+        Decodes the header of a client packet at the given offset, without touching its body.
+        Returns `None` if the buffer does not contain the complete header yet.
+        """
+        if len(buffer) - offset < cls.header_size:
+            return None
+
+        packet_id, compression, packet_length = cls.read_packet_header(buffer, offset)
+        packet = cls.resolve_input_packet(packet_id)
+
+        if not packet.is_client_packet:
+            raise ValueError(f"Packet '{packet.name}' is not a client packet")
+
+        if not cls.implements_packet(packet):
+            raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
+
+        if packet_length >= packet.max_size:
+            raise ValueError(f"Packet '{packet.name}' with length '{packet_length}' is too large")
+
+        return PacketFrame(packet, compression, packet_length, offset, offset + cls.header_size)
+
+    @classmethod
+    def iter_frames(cls, buffer: bytes, offset: int = 0) -> Iterator[PacketFrame]:
+        """
+        Yields the header & offsets of every complete client packet inside the buffer.
+        An incomplete packet at the end is not yielded, so the `end` of the last frame
+        is the amount of bytes that can be consumed from the buffer.
+        """
+        while True:
+            frame = cls.peek_header(buffer, offset)
+
+            if frame is None or frame.end > len(buffer):
+                break
+
+            yield frame
+            offset = frame.end
+
     @classmethod
     @abstractmethod
     def format_chat_link(cls, text: str, url: str) -> str:
@@ -63,7 +279,146 @@ class BanchoIO(ABC):
         """
         Returns whether the current client version implements the given packet.
         """
-        return getattr(cls, packet.handler_name, None) is not None
+        return packet in cls.packet_tables().implemented
+
+    @classmethod
+    def packet_tables(cls) -> PacketTables:
+        """
+        Returns the packet lookup tables of this client, which are built on first use.
+        """
+        tables = cls._packet_tables
+
+        # Subclasses inherit the attribute, but need their own tables
+        if tables is None or tables.client is not cls:
+            tables = PacketTables(cls)
+            type.__setattr__(cls, "_packet_tables", tables)
+
+        return tables
+
+    @classmethod
+    def resolve_input_packet(cls, packet_id: int) -> PacketType:
+        """
+        Resolves the packet type of a packet id sent by the client.
+        """
+        if packet_id < MaxPacketId:
+            packet = cls.packet_tables().input_packets[packet_id]
+
+            if packet is not None:
+                return packet
+
+        return cls.convert_input_packet(packet_id)
+
+    @classmethod
+    def resolve_output_packet(cls, packet: PacketType) -> int:
+        """
+        Resolves the packet id that the client uses for the given packet type.
+        """
+        packet_id = cls.packet_tables().output_packets.get(packet)
+
+        if packet_id is None:
+            return cls.convert_output_packet(packet)
+
+        return packet_id
+
+    @classmethod
+    def packet_handler(cls, packet: PacketType) -> Optional[Callable]:
+        """
+        Returns the reader or writer of this client for the given packet, if it implements it.
+        """
+        return cls.packet_tables().handlers.get(packet)
+
+    @classmethod
+    def client_packet_handler(cls, packet: PacketType) -> Optional[Callable]:
+        """
+        Returns the writer of a client packet or the reader of a server packet,
+        as they are used by the client itself, if this client implements it.
+        """
+        return cls.packet_tables().client_handlers.get(packet)
+
+    @classmethod
+    def implements_client_packet(cls, packet: PacketType) -> bool:
+        """
+        Returns whether the client-side codec of this client version implements the given packet.
+        """
+        return packet in cls.packet_tables().client_handlers
+
+    @classmethod
+    def static_packet(cls, packet: PacketType, args: Tuple[Any, ...]) -> Optional[bytes]:
+        """
+        Returns the pre-encoded bytes of a server packet, if its writer doesn't take any
+        arguments, e.g. `BanchoPing`. They are encoded on first use.
+        """
+        if args:
+            # Writers receiving arguments are always called
+            return None
+
+        static_packets = cls.packet_tables().static_packets
+
+        if packet not in static_packets:
+            static_packets[packet] = cls.encode_static_packet(packet)
+
+        return static_packets[packet]
+
+    @classmethod
+    def encode_static_packet(cls, packet: PacketType) -> Optional[bytes]:
+        packet_writer = cls.packet_handler(packet)
+
+        if not packet_writer or not PacketTables.is_static_writer(packet_writer):
+            return None
+
+        return cls.encode_packet(packet)
+
+    @classmethod
+    def cached_packet(cls, packet: PacketType, args: Tuple[Any, ...]) -> Optional[bytes]:
+        """
+        Returns the encoded bytes of a user stats or presence packet, if the cache of
+        the user info is enabled. They are only encoded again once the info has changed.
+        """
+        if packet not in CachedPackets or len(args) != 1:
+            return None
+
+        info = args[0]
+
+        if not isinstance(info, Tracked) or not info.cache_enabled:
+            return None
+
+        return info.cached((cls, packet), cls.encode_packet, packet, info)
+
+    @classmethod
+    def encode_packet(cls, packet: PacketType, *args) -> bytes:
+        """
+        Encodes a packet including all of its sub-packets, without checking for cached bytes.
+        """
+        packet_writer = cls.packet_handler(packet)
+
+        if not packet_writer:
+            return b""
+
+        output_stream = MemoryStream()
+
+        for packet, packet_data in packet_writer(*args):
+            cls.write_packet_frame(output_stream, packet, packet_data)
+
+        return output_stream.data
+
+    @classmethod
+    def decode_packet(cls, packet: PacketType, packet_data: bytes) -> Any:
+        """
+        Decodes the body of a client packet, or wraps it into a `LazyPacket` if `lazy_packets`
+        is enabled, which only decodes it once any of its fields are accessed.
+        """
+        if cls.lazy_packets:
+            return LazyPacket(cls, packet, packet_data)
+
+        packet_reader = cls.packet_handler(packet)
+        return packet_reader(MemoryStream(packet_data))
+
+    @classmethod
+    def encode_status_update(cls, status: UserStatus) -> bytes:
+        """
+        Returns the encoded status of a user, which is cached on the status if its cache is enabled.
+        """
+        return status.cached(cls, cls.write_status_update, status)
 
     @classmethod
     def read_packet_from_bytes(cls, data: bytes) -> Tuple[PacketType, Any]:
@@ -81,8 +436,35 @@ class BanchoIO(ABC):
         stream = MemoryStream(data)
 
         while stream.available() >= cls.header_size:
+            *_, packet_length = cls.read_packet_header(stream.buffer, stream.position)
+
+            if stream.available() < cls.header_size + packet_length:
+                # The body of the last packet was truncated
+                break
+
             yield cls.read_packet(stream)
 
+    @classmethod
+    async def iter_packets(cls, reader: "StreamReader", chunk_size: int = 65536) -> AsyncIterator[Tuple[PacketType, Any]]:
+        """
+        Reads packets from an asyncio stream reader, and yields the packet type and decoded data.
+        Every packet that is complete after a single read is decoded without awaiting again.
+        """
+        decoder = PacketDecoder(cls)
+
+        while True:
+            if decoder.pending:
+                # Wait for the rest of the partially received packet
+                data = await reader.readexactly(decoder.remaining)
+            else:
+                data = await reader.read(chunk_size)
+
+            if not data:
+                break
+
+            for packet in decoder.feed(data):
+                yield packet
+
     @classmethod
     def write_packet_to_bytes(cls, packet: PacketType, *args) -> bytes:
         """
@@ -103,3 +485,124 @@ class BanchoIO(ABC):
             cls.write_packet(stream, packet, *args)
 
         return stream.data
+
+    @classmethod
+    async def write_packets_async(cls, stream: AsyncStream, packets: Iterable[Tuple[PacketType, Any]]) -> None:
+        """
+        Encodes multiple packets and writes them to the stream at once, asynchronously.
+        """
+        packet_data = cls.write_many_packets_to_bytes(packets)
+
+        if packet_data:
+            await stream.write(packet_data)
+
+    @classmethod
+    def write_client_packet(cls, stream: Stream, packet: PacketType, *args) -> None:
+        """
+        Encodes a client packet the way this client version would send it, and writes it to the stream.
+        """
+        if not packet.is_client_packet:
+            raise ValueError(f"Packet '{packet.name}' is not a client packet")
+
+        packet_writer = cls.client_packet_handler(packet)
+
+        if not packet_writer:
+            raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
+
+        output_stream = MemoryStream()
+
+        for packet, packet_data in packet_writer(*args):
+            cls.write_frame(output_stream, cls.resolve_output_packet(packet), packet_data)
+
+        if len(output_stream):
+            stream.write(output_stream.data)
+
+    @classmethod
+    def write_client_packet_to_bytes(cls, packet: PacketType, *args) -> bytes:
+        """
+        Encodes a client packet and returns it as bytes.
+        """
+        stream = MemoryStream()
+        cls.write_client_packet(stream, packet, *args)
+        return stream.data
+
+    @classmethod
+    def write_many_client_packets_to_bytes(cls, packets: Iterable[Tuple[PacketType, Any]]) -> bytes:
+        """
+        Encodes multiple client packets and returns them as bytes.
+        """
+        stream = MemoryStream()
+
+        for packet, *args in packets:
+            cls.write_client_packet(stream, packet, *args)
+
+        return stream.data
+
+    @classmethod
+    async def write_client_packet_async(cls, stream: AsyncStream, packet: PacketType, *args) -> None:
+        """
+        Encodes a client packet and writes it to the stream, asynchronously.
+        """
+        packet_data = cls.write_client_packet_to_bytes(packet, *args)
+
+        if packet_data:
+            await stream.write(packet_data)
+
+    @classmethod
+    def decode_server_packet(cls, packet_id: int, compression: bool, packet_data: bytes) -> Tuple[PacketType, Any]:
+        packet = cls.resolve_input_packet(packet_id)
+
+        if not packet.is_server_packet:
+            raise ValueError(f"Packet '{packet.name}' is not a server packet")
+
+        packet_reader = cls.client_packet_handler(packet)
+
+        if not packet_reader:
+            raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
+
+        if compression:
+            packet_data = decompress(packet_data)
+
+        return packet, packet_reader(MemoryStream(packet_data))
+
+    @classmethod
+    def read_server_packet(cls, stream: Stream) -> Tuple[PacketType, Any]:
+        """
+        Reads a server packet from the stream the way this client version would,
+        and returns the packet type and decoded data.
+        """
+        packet_id, compression, packet_length = cls.read_packet_header(stream.read(cls.header_size))
+        return cls.decode_server_packet(packet_id, compression, stream.read(packet_length))
+
+    @classmethod
+    async def read_server_packet_async(cls, stream: AsyncStream) -> Tuple[PacketType, Any]:
+        """
+        Reads a server packet from the stream asynchronously, and returns the packet type and decoded data.
+        """
+        header = await stream.read(cls.header_size)
+        packet_id, compression, packet_length = cls.read_packet_header(header)
+        packet_data = await stream.read(packet_length)
+        return cls.decode_server_packet(packet_id, compression, packet_data)
+
+    @classmethod
+    def read_server_packet_from_bytes(cls, data: bytes) -> Tuple[PacketType, Any]:
+        """
+        Reads a server packet from the given bytes, and returns the packet type and decoded data.
+        """
+        return cls.read_server_packet(MemoryStream(data))
+
+    @classmethod
+    def read_many_server_packets_from_bytes(cls, data: bytes) -> Iterable[Tuple[PacketType, Any]]:
+        """
+        Reads multiple server packets from the given bytes, and yields the packet type and decoded data.
+        """
+        stream = MemoryStream(data)
+
+        while stream.available() >= cls.header_size:
+            *_, packet_length = cls.read_packet_header(stream.buffer, stream.position)
+
+            if stream.available() < cls.header_size + packet_length:
+                # The body of the last packet was truncated
+                break
+
+            yield cls.read_server_packet(stream)
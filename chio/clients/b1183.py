@@ -22,12 +22,15 @@ class b1183(b695):
 
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Full)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, Stats,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
         write_string(stream, info.name)
         write_string(stream, info.avatar_filename)
         write_u8(stream, info.presence.timezone+24)
@@ -39,3 +42,11 @@ class b1183(b695):
             write_f32(stream, info.presence.latitude)
 
         yield PacketType.BanchoUserStats, stream.data
+
+    @classmethod
+    def read_user_presence_tail(cls, stream: MemoryStream, info: UserInfo) -> None:
+        super().read_user_presence_tail(stream, info)
+
+        if cls.protocol_version >= 5:
+            info.presence.longitude = read_f32(stream)
+            info.presence.latitude = read_f32(stream)
@@ -16,3 +16,7 @@ class b1365(b1183):
         stream = MemoryStream()
         write_u32(stream, slot_id)
         yield PacketType.BanchoMatchPlayerSkipped, stream.data
+
+    @classmethod
+    def read_bancho_match_player_skipped(cls, stream: MemoryStream) -> int:
+        return read_u32(stream)
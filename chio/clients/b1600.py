@@ -1,4 +1,6 @@
+from typing import Iterable, Tuple
 from .b1365 import b1365
+from ..constants import *
 from ..types import *
 from ..io import *
 
@@ -11,3 +13,8 @@ class b1600(b1365):
     @classmethod
     def read_set_irc_away_message(cls, stream: MemoryStream) -> Message:
         return cls.read_message(stream)
+
+    @classmethod
+    def write_osu_set_irc_away_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        _, packet_data = next(cls.write_osu_message(message))
+        yield PacketType.OsuSetIrcAwayMessage, packet_data
@@ -35,12 +35,15 @@ class b1788(b1600):
     def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
         stream = MemoryStream()
         write_s32(stream, info.id)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, Stats,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
         yield PacketType.BanchoUserStats, stream.data
 
     @classmethod
@@ -51,9 +54,12 @@ class b1788(b1600):
         write_u8(stream, AvatarExtension.Png)
         write_u8(stream, info.presence.timezone+24)
         write_string(stream, info.presence.country_string)
-        write_u8(stream, info.presence.permissions)
-        write_f32(stream, info.presence.longitude)
-        write_f32(stream, info.presence.latitude)
+        write_struct(
+            stream, PresenceTail,
+            info.presence.permissions,
+            info.presence.longitude,
+            info.presence.latitude
+        )
         yield PacketType.BanchoUserPresence, stream.data
 
     @classmethod
@@ -62,9 +68,9 @@ class b1788(b1600):
         status.action = Status(read_u8(stream))
         status.text = read_string(stream)
         status.beatmap_checksum = read_string(stream)
-        status.mods = Mods(read_u16(stream))
-        status.mode = Mode(read_u8(stream))
-        status.beatmap_id = read_s32(stream)
+        status.mods, status.mode, status.beatmap_id = read_struct(stream, StatusBeatmap)
+        status.mods = Mods(status.mods)
+        status.mode = Mode(status.mode)
         return status
 
     @classmethod
@@ -73,9 +79,12 @@ class b1788(b1600):
         write_u8(stream, status.action)
         write_string(stream, status.text)
         write_string(stream, status.beatmap_checksum)
-        write_u16(stream, status.mods)
-        write_u8(stream, status.mode)
-        write_s32(stream, status.beatmap_id)
+        write_struct(
+            stream, StatusBeatmap,
+            status.mods,
+            status.mode,
+            status.beatmap_id
+        )
         return stream.data
 
     @classmethod
@@ -105,3 +114,54 @@ class b1788(b1600):
     @classmethod
     def read_exit(cls, stream: MemoryStream) -> bool:
         return read_s32(stream) == 1
+
+    @classmethod
+    def write_osu_exit(cls, updating: bool = False) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, int(updating))
+        yield PacketType.OsuExit, stream.data
+
+    @classmethod
+    def write_osu_user_stats_request(cls, user_ids: Iterable[int]) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_list_s16(stream, list(user_ids))
+        yield PacketType.OsuUserStatsRequest, stream.data
+
+    @classmethod
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        info.id = read_s32(stream)
+        info.status = cls.read_status_update(stream)
+        cls.read_stats(stream, info.stats)
+        return info
+
+    @classmethod
+    def read_bancho_user_presence(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        cls.read_user_id(stream, info)
+        info.name = read_string(stream)
+        avatar_extension = AvatarExtension(read_u8(stream))
+        info.presence.timezone = read_u8(stream) - 24
+        cls.parse_country_string(info.presence, read_string(stream))
+        (
+            info.presence.permissions,
+            info.presence.longitude,
+            info.presence.latitude
+        ) = read_struct(stream, PresenceTail)
+        info.presence.permissions = Permissions(info.presence.permissions)
+        return info
+
+    @classmethod
+    def read_user_id(cls, stream: MemoryStream, info: UserInfo) -> None:
+        # IRC users are sent with negative user ids
+        user_id = read_s32(stream)
+        info.id = abs(user_id)
+        info.presence.is_irc = user_id < 0
+
+    @classmethod
+    def read_bancho_friends_list(cls, stream: MemoryStream) -> List[int]:
+        return read_list_s16(stream)
+
+    @classmethod
+    def read_bancho_restart(cls, stream: MemoryStream) -> int:
+        return read_u32(stream)
@@ -25,22 +25,31 @@ class b1796(b1788):
         stream = MemoryStream()
         write_s32(stream, cls.convert_user_id(info))
         write_string(stream, info.name)
-        write_u8(stream, AvatarExtension.Png)
-        write_u8(stream, info.presence.timezone+24)
-        write_u8(stream, info.presence.country_index)
+        write_struct(
+            stream, PresenceLocale,
+            AvatarExtension.Png,
+            info.presence.timezone+24,
+            info.presence.country_index
+        )
         write_string(stream, info.presence.city)
-        write_u8(stream, info.presence.permissions)
-        write_f32(stream, info.presence.longitude)
-        write_f32(stream, info.presence.latitude)
+        write_struct(
+            stream, PresenceTail,
+            info.presence.permissions,
+            info.presence.longitude,
+            info.presence.latitude
+        )
         yield PacketType.BanchoUserPresence, stream.data
 
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u16(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeader,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.password)
         write_string(stream, match.beatmap_text)
@@ -70,10 +79,9 @@ class b1796(b1788):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u16(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeader)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.password = read_string(stream)
         match.beatmap_text = read_string(stream)
@@ -101,3 +109,23 @@ class b1796(b1788):
         match.scoring_type = ScoringType(read_u8(stream))
         match.team_type = TeamType(read_u8(stream))
         return match
+
+    @classmethod
+    def read_bancho_user_presence(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        cls.read_user_id(stream, info)
+        info.name = read_string(stream)
+        (
+            avatar_extension,
+            info.presence.timezone,
+            info.presence.country_index
+        ) = read_struct(stream, PresenceLocale)
+        info.presence.timezone -= 24
+        info.presence.city = read_string(stream)
+        (
+            info.presence.permissions,
+            info.presence.longitude,
+            info.presence.latitude
+        ) = read_struct(stream, PresenceTail)
+        info.presence.permissions = Permissions(info.presence.permissions)
+        return info
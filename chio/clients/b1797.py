@@ -17,15 +17,30 @@ class b1797(b1796):
         stream = MemoryStream()
         write_s32(stream, cls.convert_user_id(info))
         write_string(stream, info.name)
-        write_u8(stream, AvatarExtension.Png)
-        write_u8(stream, info.presence.timezone+24)
-        write_u8(stream, info.presence.country_index)
+        write_struct(
+            stream, PresenceLocale,
+            AvatarExtension.Png,
+            info.presence.timezone+24,
+            info.presence.country_index
+        )
         write_string(stream, info.presence.city)
-        write_u8(stream, info.presence.permissions)
-        write_f32(stream, info.presence.longitude)
-        write_f32(stream, info.presence.latitude)
+        write_struct(
+            stream, PresenceTail,
+            info.presence.permissions,
+            info.presence.longitude,
+            info.presence.latitude
+        )
 
         if cls.protocol_version >= 7:
             write_s32(stream, info.stats.rank)
 
         yield PacketType.BanchoUserPresence, stream.data
+
+    @classmethod
+    def read_bancho_user_presence(cls, stream: MemoryStream) -> UserInfo:
+        info = super().read_bancho_user_presence(stream)
+
+        if cls.protocol_version >= 7:
+            info.stats.rank = read_s32(stream)
+
+        return info
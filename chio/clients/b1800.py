@@ -11,47 +11,6 @@ class b1800(b1797):
     version = 1800
 
     @classmethod
-    def write_packet(cls, stream: Stream, packet: PacketType, *args) -> None:
-        if not packet.is_server_packet:
-            raise ValueError(f"Packet '{packet.name}' is not a server packet")
-
-        packet_writer = getattr(cls, packet.handler_name, None)
-
-        if not packet_writer:
-            return
-
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
-
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            compression_enabled = False
-            write_u16(output_stream, packet_id)
-            write_boolean(output_stream, compression_enabled)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            stream.write(output_stream.data)
-            output_stream.clear()
-
-    @classmethod
-    async def write_packet_async(cls, stream: AsyncStream, packet: PacketType, *args) -> None:
-        if not packet.is_server_packet:
-            raise ValueError(f"Packet '{packet.name}' is not a server packet")
-
-        packet_writer = getattr(cls, packet.handler_name, None)
-
-        if not packet_writer:
-            return
-
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
-
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            compression_enabled = False
-            write_u16(output_stream, packet_id)
-            write_boolean(output_stream, compression_enabled)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            await stream.write(output_stream.data)
-            output_stream.clear()
+    def write_frame(cls, stream: MemoryStream, packet_id: int, packet_data: bytes) -> None:
+        write_struct(stream, PacketHeaderCompressed, packet_id, False, len(packet_data))
+        stream.write(packet_data)
@@ -19,3 +19,13 @@ class b1817(b1800):
     @classmethod
     def read_invite(cls, stream: MemoryStream) -> int:
         return read_s32(stream)
+
+    @classmethod
+    def write_osu_invite(cls, user_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, user_id)
+        yield PacketType.OsuInvite, stream.data
+
+    @classmethod
+    def read_bancho_invite(cls, stream: MemoryStream) -> Message:
+        return cls.read_bancho_message(stream)
@@ -19,3 +19,7 @@ class b1820(b1817):
         stream = MemoryStream()
         write_string(stream, update.image_url)
         yield PacketType.BanchoTitleUpdate, stream.data
+
+    @classmethod
+    def read_bancho_title_update(cls, stream: MemoryStream) -> TitleUpdate:
+        return TitleUpdate(read_string(stream))
@@ -3,6 +3,7 @@ from typing import Iterable, Tuple
 
 from .b1820 import b1820
 from ..constants import *
+from ..io import *
 
 class b20120518(b1820):
     """
@@ -13,3 +14,7 @@ class b20120518(b1820):
     @classmethod
     def write_channel_info_complete(cls) -> Iterable[Tuple[PacketType, bytes]]:
         yield PacketType.BanchoChannelInfoComplete, b""
+
+    @classmethod
+    def read_bancho_channel_info_complete(cls, stream: MemoryStream) -> None:
+        pass
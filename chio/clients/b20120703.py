@@ -20,3 +20,11 @@ class b20120703(b20120518):
         stream = MemoryStream()
         write_string(stream, password)
         yield PacketType.BanchoMatchChangePassword, stream.data
+
+    @classmethod
+    def write_osu_match_change_password(cls, match: Match) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchChangePassword, cls.write_match(match)
+
+    @classmethod
+    def read_bancho_match_change_password(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
@@ -16,14 +16,26 @@ class b20120723(b20120703):
     def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
         stream = MemoryStream()
         write_s32(stream, info.id)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, Stats,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
 
         if cls.protocol_version >= 8:
             write_s16(stream, info.stats.pp)
 
         yield PacketType.BanchoUserStats, stream.data
+
+    @classmethod
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = super().read_bancho_user_stats(stream)
+
+        if cls.protocol_version >= 8:
+            info.stats.pp = read_s16(stream)
+
+        return info
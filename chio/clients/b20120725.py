@@ -33,3 +33,13 @@ class b20120725(b20120723):
             write_s16(stream, channel.user_count)
 
         yield PacketType.BanchoChannelAvailableAutojoin, stream.data
+
+    @classmethod
+    def read_bancho_channel_available(cls, stream: MemoryStream) -> Channel:
+        channel = Channel(read_string(stream))
+
+        if cls.protocol_version >= 9:
+            channel.topic = read_string(stream)
+            channel.user_count = read_s16(stream)
+
+        return channel
@@ -70,10 +70,13 @@ class b20120818(b20120806):
             if slot.has_player:
                 write_s32(stream, slot.user_id)
 
-        write_s32(stream, match.host_id)
-        write_u8(stream, match.mode)
-        write_u8(stream, match.scoring_type)
-        write_u8(stream, match.team_type)
+        write_struct(
+            stream, MatchFooter,
+            match.host_id,
+            match.mode,
+            match.scoring_type,
+            match.team_type
+        )
         return stream.data
 
     @classmethod
@@ -105,8 +108,13 @@ class b20120818(b20120806):
             if slot.has_player:
                 slot.user_id = read_s32(stream)
 
-        match.host_id = read_s32(stream)
-        match.mode = Mode(read_u8(stream))
-        match.scoring_type = ScoringType(read_u8(stream))
-        match.team_type = TeamType(read_u8(stream))
+        (
+            match.host_id,
+            match.mode,
+            match.scoring_type,
+            match.team_type
+        ) = read_struct(stream, MatchFooter)
+        match.mode = Mode(match.mode)
+        match.scoring_type = ScoringType(match.scoring_type)
+        match.team_type = TeamType(match.team_type)
         return match
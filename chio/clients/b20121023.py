@@ -20,3 +20,7 @@ class b20121023(b20120818):
         stream = MemoryStream()
         write_s32(stream, length_seconds)
         yield PacketType.BanchoSilenceInfo, stream.data
+
+    @classmethod
+    def read_bancho_silence_info(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
@@ -18,14 +18,17 @@ class b20121028(b20121023):
         write_u32(stream, len(reply.beatmaps))
 
         for info in reply.beatmaps:
-            write_s16(stream, info.index)
-            write_s32(stream, info.beatmap_id)
-            write_s32(stream, info.beatmapset_id)
-            write_s32(stream, info.thread_id)
-            write_s8(stream, info.ranked_status)
-            write_s8(stream, info.osu_rank)
-            write_s8(stream, info.fruits_rank)
-            write_s8(stream, info.taiko_rank)
+            write_struct(
+                stream, BeatmapInfoModeRanks,
+                info.index,
+                info.beatmap_id,
+                info.beatmapset_id,
+                info.thread_id,
+                info.ranked_status,
+                info.osu_rank,
+                info.fruits_rank,
+                info.taiko_rank
+            )
 
             if cls.protocol_version >= 12:
                 write_s8(stream, info.mania_rank)
@@ -33,3 +36,33 @@ class b20121028(b20121023):
             write_string(stream, info.checksum)
 
         yield PacketType.BanchoBeatmapInfoReply, stream.data
+
+    @classmethod
+    def read_bancho_beatmap_info_reply(cls, stream: MemoryStream) -> BeatmapInfoReply:
+        reply = BeatmapInfoReply()
+
+        for _ in range(read_u32(stream)):
+            (
+                index,
+                beatmap_id,
+                beatmapset_id,
+                thread_id,
+                ranked_status,
+                osu_rank,
+                fruits_rank,
+                taiko_rank
+            ) = read_struct(stream, BeatmapInfoModeRanks)
+
+            info = BeatmapInfo(
+                index, beatmap_id, beatmapset_id, thread_id,
+                RankedStatus(ranked_status), "",
+                Rank(osu_rank), Rank(taiko_rank), Rank(fruits_rank)
+            )
+
+            if cls.protocol_version >= 12:
+                info.mania_rank = Rank(read_s8(stream))
+
+            info.checksum = read_string(stream)
+            reply.beatmaps.append(info)
+
+        return reply
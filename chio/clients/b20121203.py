@@ -17,11 +17,33 @@ class b20121203(b20121028):
         stream = MemoryStream()
         write_s32(stream, cls.convert_user_id(info))
         write_string(stream, info.name)
-        write_u8(stream, info.presence.timezone+24)
-        write_u8(stream, info.presence.country_index)
-        write_u8(stream, info.presence.permissions | info.status.mode << 5)
-        write_f32(stream, info.presence.longitude)
-        write_f32(stream, info.presence.latitude)
-        write_s32(stream, info.stats.rank)
-        write_u8(stream, info.status.mode)
+        write_struct(
+            stream, PresenceCompact,
+            info.presence.timezone+24,
+            info.presence.country_index,
+            info.presence.permissions | info.status.mode << 5,
+            info.presence.longitude,
+            info.presence.latitude,
+            info.stats.rank,
+            info.status.mode
+        )
         yield PacketType.BanchoUserPresence, stream.data
+
+    @classmethod
+    def read_bancho_user_presence(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        cls.read_user_id(stream, info)
+        info.name = read_string(stream)
+        (
+            info.presence.timezone,
+            info.presence.country_index,
+            permissions,
+            info.presence.longitude,
+            info.presence.latitude,
+            info.stats.rank,
+            info.status.mode
+        ) = read_struct(stream, PresenceCompact)
+        info.presence.timezone -= 24
+        info.presence.permissions = Permissions(permissions & 0x1F)
+        info.status.mode = Mode(info.status.mode)
+        return info
@@ -1,4 +1,6 @@
+from typing import Iterable, Tuple
 from .b20121203 import b20121203
+from ..constants import *
 from ..io import *
 
 class b20121207(b20121203):
@@ -10,3 +12,9 @@ class b20121207(b20121203):
     @classmethod
     def read_tournament_match_info(cls, stream: MemoryStream) -> int:
         return read_s32(stream)
+
+    @classmethod
+    def write_osu_tournament_match_info(cls, match_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, match_id)
+        yield PacketType.OsuTournamentMatchInfo, stream.data
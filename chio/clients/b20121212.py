@@ -20,3 +20,7 @@ class b20121212(b20121211):
         stream = MemoryStream()
         write_s32(stream, user_id)
         yield PacketType.BanchoUserSilenced, stream.data
+
+    @classmethod
+    def read_bancho_user_silenced(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
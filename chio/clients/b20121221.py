@@ -16,3 +16,8 @@ class b20121221(b20121212):
         stream = MemoryStream()
         write_string(stream, f"{update.image_url or ''}|{update.redirect_url or ''}")
         yield PacketType.BanchoTitleUpdate, stream.data
+
+    @classmethod
+    def read_bancho_title_update(cls, stream: MemoryStream) -> TitleUpdate:
+        image_url, _, redirect_url = read_string(stream).partition("|")
+        return TitleUpdate(image_url, redirect_url)
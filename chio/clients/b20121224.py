@@ -39,3 +39,28 @@ class b20121224(b20121221):
     @classmethod
     def read_presence_request_all(cls, stream: MemoryStream) -> None:
         pass
+
+    @classmethod
+    def write_osu_presence_request(cls, user_ids: List[int]) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_list_s16(stream, list(user_ids))
+        yield PacketType.OsuPresenceRequest, stream.data
+
+    @classmethod
+    def write_osu_presence_request_all(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuPresenceRequestAll, b""
+
+    @classmethod
+    def read_bancho_user_quit(cls, stream: MemoryStream) -> UserQuit:
+        quit = UserQuit()
+        quit.info.id = read_s32(stream)
+        quit.state = QuitState(read_u8(stream))
+        return quit
+
+    @classmethod
+    def read_bancho_user_presence_single(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_user_presence_bundle(cls, stream: MemoryStream) -> List[int]:
+        return read_list_s16(stream)
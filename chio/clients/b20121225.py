@@ -37,3 +37,15 @@ class b20121225(b20121224):
             message.sender_id = read_s32(stream)
 
         return message
+
+    @classmethod
+    def write_osu_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, message.sender)
+        write_string(stream, message.content)
+        write_string(stream, message.target)
+
+        if cls.protocol_version >= 15:
+            write_s32(stream, message.sender_id)
+
+        yield PacketType.OsuMessage, stream.data
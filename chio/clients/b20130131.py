@@ -19,3 +19,13 @@ class b20130131(b20130118):
     @classmethod
     def read_change_friend_only_dms(cls, stream: MemoryStream) -> bool:
         return read_s32(stream) == 1
+
+    @classmethod
+    def write_osu_change_friend_only_dms(cls, enabled: bool) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, int(enabled))
+        yield PacketType.OsuChangeFriendOnlyDms, stream.data
+
+    @classmethod
+    def read_bancho_user_dms_blocked(cls, stream: MemoryStream) -> str:
+        return cls.read_message(stream).target
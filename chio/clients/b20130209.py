@@ -4,6 +4,7 @@ from typing import Iterable, Tuple
 from .b20130131 import b20130131
 from ..constants import *
 from ..types import *
+from ..io import *
 
 class b20130209(b20130131):
     """
@@ -16,3 +17,7 @@ class b20130209(b20130131):
     def write_target_is_silenced(cls, username: str) -> Iterable[Tuple[PacketType, bytes]]:
         _, data = next(cls.write_message(Message("", "", username)))
         yield PacketType.BanchoTargetIsSilenced, data
+
+    @classmethod
+    def read_bancho_target_is_silenced(cls, stream: MemoryStream) -> str:
+        return cls.read_message(stream).target
@@ -13,10 +13,13 @@ class b20130303(b20130209):
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u16(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u32(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderFullMods,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.password)
         write_string(stream, match.beatmap_text)
@@ -33,10 +36,13 @@ class b20130303(b20130209):
             if slot.has_player:
                 write_s32(stream, slot.user_id)
 
-        write_s32(stream, match.host_id)
-        write_u8(stream, match.mode)
-        write_u8(stream, match.scoring_type)
-        write_u8(stream, match.team_type)
+        write_struct(
+            stream, MatchFooter,
+            match.host_id,
+            match.mode,
+            match.scoring_type,
+            match.team_type
+        )
 
         if cls.protocol_version >= 16:
             write_boolean(stream, match.freemod)
@@ -50,10 +56,14 @@ class b20130303(b20130209):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u16(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u32(stream))
+        (
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods
+        ) = read_struct(stream, MatchHeaderFullMods)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.password = read_string(stream)
         match.beatmap_text = read_string(stream)
@@ -71,10 +81,15 @@ class b20130303(b20130209):
             if slot.has_player:
                 slot.user_id = read_s32(stream)
 
-        match.host_id = read_s32(stream)
-        match.mode = Mode(read_u8(stream))
-        match.scoring_type = ScoringType(read_u8(stream))
-        match.team_type = TeamType(read_u8(stream))
+        (
+            match.host_id,
+            match.mode,
+            match.scoring_type,
+            match.team_type
+        ) = read_struct(stream, MatchFooter)
+        match.mode = Mode(match.mode)
+        match.scoring_type = ScoringType(match.scoring_type)
+        match.team_type = TeamType(match.team_type)
 
         if cls.protocol_version >= 16:
             match.freemod = read_boolean(stream)
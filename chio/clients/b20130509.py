@@ -3,6 +3,7 @@ from typing import Iterable, Tuple
 
 from .b20130418 import b20130418
 from ..constants import *
+from ..io import *
 
 class b20130509(b20130418):
     """
@@ -14,3 +15,7 @@ class b20130509(b20130418):
     @classmethod
     def write_version_update_forced(cls) -> Iterable[Tuple[PacketType, bytes]]:
         yield PacketType.BanchoVersionUpdateForced, b""
+
+    @classmethod
+    def read_bancho_version_update_forced(cls, stream: MemoryStream) -> None:
+        pass
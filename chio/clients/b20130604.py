@@ -17,3 +17,7 @@ class b20130604(b20130509):
         stream = MemoryStream()
         write_s32(stream, after_idle_time)
         yield PacketType.BanchoSwitchServer, stream.data
+
+    @classmethod
+    def read_bancho_switch_server(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
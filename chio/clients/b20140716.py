@@ -3,6 +3,7 @@ from typing import Iterable, Tuple
 
 from .b20140528 import b20140528
 from ..constants import *
+from ..io import *
 
 class b20140716(b20140528):
     """
@@ -13,3 +14,7 @@ class b20140716(b20140528):
     @classmethod
     def write_account_restricted(cls) -> Iterable[Tuple[PacketType, bytes]]:
         yield PacketType.BanchoAccountRestricted, b""
+
+    @classmethod
+    def read_bancho_account_restricted(cls, stream: MemoryStream) -> None:
+        pass
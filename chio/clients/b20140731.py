@@ -16,3 +16,7 @@ class b20140731(b20140716):
         stream = MemoryStream()
         write_string(stream, message)
         yield PacketType.BanchoRTX, stream.data
+
+    @classmethod
+    def read_bancho_rtx(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
@@ -20,3 +20,11 @@ class b20141104(b20140731):
     @classmethod
     def write_match_abort(cls) -> Iterable[Tuple[PacketType, bytes]]:
         yield PacketType.BanchoMatchAbort, b''
+
+    @classmethod
+    def read_bancho_switch_tournament_server(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
+
+    @classmethod
+    def read_bancho_match_abort(cls, stream: MemoryStream) -> None:
+        pass
@@ -1,4 +1,6 @@
+from typing import Iterable, Tuple
 from .b20151106 import b20151106
+from ..constants import *
 from ..io import *
 
 class b20151107(b20151106):
@@ -14,3 +16,15 @@ class b20151107(b20151106):
     @classmethod
     def read_tournament_leave_match_channel(cls, stream: MemoryStream) -> int:
         return read_s32(stream)
+
+    @classmethod
+    def write_osu_tournament_join_match_channel(cls, match_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, match_id)
+        yield PacketType.OsuTournamentJoinMatchChannel, stream.data
+
+    @classmethod
+    def write_osu_tournament_leave_match_channel(cls, match_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, match_id)
+        yield PacketType.OsuTournamentLeaveMatchChannel, stream.data
@@ -19,10 +19,7 @@ class b20160404(b20151107):
         if cls.protocol_version >= 18:
             extra = read_u32(stream)
 
-        frames = [
-            cls.read_replay_frame(stream)
-            for _ in range(read_u16(stream))
-        ]
+        frames = cls.read_replay_frames(stream, read_u16(stream))
         action = ReplayAction(read_u8(stream))
         frame = None
 
@@ -41,8 +38,7 @@ class b20160404(b20151107):
 
         write_u16(stream, len(bundle.frames))
 
-        for frame in bundle.frames:
-            stream.write(cls.write_replay_frame(frame))
+        stream.write(cls.write_replay_frames(bundle.frames))
 
         write_u8(stream, bundle.action)
 
@@ -18,11 +18,29 @@ class b20250306(b20161101):
     def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
         stream = MemoryStream()
         write_s32(stream, info.id)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
-        write_u16(stream, info.stats.pp)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsUnsignedPP,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank,
+            info.stats.pp
+        )
         yield PacketType.BanchoUserStats, stream.data
+
+    @classmethod
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        info.id = read_s32(stream)
+        info.status = cls.read_status_update(stream)
+        (
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank,
+            info.stats.pp
+        ) = read_struct(stream, StatsUnsignedPP)
+        return info
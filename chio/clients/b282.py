@@ -1,6 +1,7 @@
 
 from typing import Any, Tuple, Iterable, Union
 
+from ..frames import ReplayFrameArray
 from ..chio import BanchoIO
 from ..constants import *
 from ..types import *
@@ -16,12 +17,12 @@ class b282(BanchoIO):
     @classmethod
     def read_packet(cls, stream: Stream) -> Tuple[PacketType, Any]:
         packet_id = read_u16(stream)
-        packet = cls.convert_input_packet(packet_id)
+        packet = cls.resolve_input_packet(packet_id)
 
         if not packet.is_client_packet:
             raise ValueError(f"Packet '{packet.name}' is not a client packet")
 
-        packet_reader = getattr(cls, packet.handler_name, None)
+        packet_reader = cls.packet_handler(packet)
 
         if not packet_reader:
             raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
@@ -32,29 +33,36 @@ class b282(BanchoIO):
             raise ValueError(f"Packet '{packet.name}' with length '{packet_length}' is too large")
 
         packet_data = read_gzip(stream, packet_length)
-        return packet, packet_reader(MemoryStream(packet_data))
+        return packet, cls.decode_packet(packet, packet_data)
+
+    @classmethod
+    def read_packet_header(cls, buffer: bytes, offset: int = 0) -> Tuple[int, bool, int]:
+        # Packets are always compressed in this version
+        packet_id, packet_length = PacketHeader.unpack_from(buffer, offset)
+        return packet_id, True, packet_length
 
     @classmethod
     def write_packet(cls, stream: Stream, packet: PacketType, *args) -> None:
         if not packet.is_server_packet:
             raise ValueError(f"Packet '{packet.name}' is not a server packet")
 
-        packet_writer = getattr(cls, packet.handler_name, None)
+        packet_data = cls.static_packet(packet, args)
 
-        if not packet_writer:
-            return
+        if packet_data is None:
+            packet_data = cls.cached_packet(packet, args)
 
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
+        if packet_data is None:
+            # Encode every sub-packet first, so that they are written at once
+            packet_data = cls.encode_packet(packet, *args)
 
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            packet_data = compress(packet_data)
-            write_u16(output_stream, packet_id)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            stream.write(output_stream.data)
-            output_stream.clear()
+        if packet_data:
+            stream.write(packet_data)
+
+    @classmethod
+    def write_frame(cls, stream: MemoryStream, packet_id: int, packet_data: bytes) -> None:
+        packet_data = compress(packet_data)
+        write_struct(stream, PacketHeader, packet_id, len(packet_data))
+        stream.write(packet_data)
 
     @classmethod
     async def read_packet_async(cls, stream: AsyncStream) -> Tuple[PacketType, Any]:
@@ -62,12 +70,12 @@ class b282(BanchoIO):
         input_stream.write(await stream.read(cls.header_size))
 
         packet_id = read_u16(input_stream)
-        packet = cls.convert_input_packet(packet_id)
+        packet = cls.resolve_input_packet(packet_id)
 
         if not packet.is_client_packet:
             raise ValueError(f"Packet '{packet.name}' is not a client packet")
         
-        packet_reader = getattr(cls, packet.handler_name, None)
+        packet_reader = cls.packet_handler(packet)
 
         if not packet_reader:
             raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
@@ -79,29 +87,14 @@ class b282(BanchoIO):
 
         packet_data = await stream.read(packet_length)
         packet_data = decompress(packet_data)
-        return packet, packet_reader(MemoryStream(packet_data))
+        return packet, cls.decode_packet(packet, packet_data)
 
     @classmethod
     async def write_packet_async(cls, stream: AsyncStream, packet: PacketType, *args) -> None:
-        if not packet.is_server_packet:
-            raise ValueError(f"Packet '{packet.name}' is not a server packet")
-
-        packet_writer = getattr(cls, packet.handler_name, None)
-
-        if not packet_writer:
-            return
-
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
+        packet_data = cls.write_packet_to_bytes(packet, *args)
 
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            packet_data = compress(packet_data)
-            write_u16(output_stream, packet_id)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            await stream.write(output_stream.data)
-            output_stream.clear()
+        if packet_data:
+            await stream.write(packet_data)
 
     @classmethod
     def convert_input_packet(cls, packet: int) -> PacketType:
@@ -206,13 +199,16 @@ class b282(BanchoIO):
 
         write_u32(stream, info.id)
         write_string(stream, info.name)
-        write_u64(stream, info.stats.rscore)
-        write_f64(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        write_struct(
+            stream, StatsLegacy,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
         write_string(stream, info.avatar_filename)
-        stream.write(cls.write_status_update(info.status))
+        stream.write(cls.encode_status_update(info.status))
         write_u8(stream, info.presence.timezone+24)
         write_string(stream, info.presence.country_string)
         yield PacketType.BanchoUserStats, stream.data
@@ -273,22 +269,31 @@ class b282(BanchoIO):
         stream = MemoryStream()
         write_u16(stream, len(bundle.frames))
 
-        for frame in bundle.frames:
-            stream.write(cls.write_replay_frame(frame))
+        stream.write(cls.write_replay_frames(bundle.frames))
 
         write_u8(stream, bundle.action)
         yield PacketType.BanchoSpectateFrames, stream.data
 
+    @classmethod
+    def write_replay_frames(cls, frames: List[ReplayFrame]) -> bytes:
+        if isinstance(frames, ReplayFrameArray):
+            return frames.to_bytes(legacy=True)
+
+        return b"".join(cls.write_replay_frame(frame) for frame in frames)
+
     @classmethod
     def write_replay_frame(cls, frame: ReplayFrame) -> bytes:
         stream = MemoryStream()
         left_mouse = ButtonState.Left1 in frame.button_state or ButtonState.Left2 in frame.button_state
         right_mouse = ButtonState.Right1 in frame.button_state or ButtonState.Right2 in frame.button_state
-        write_boolean(stream, left_mouse)
-        write_boolean(stream, right_mouse)
-        write_f32(stream, frame.mouse_x)
-        write_f32(stream, frame.mouse_y)
-        write_s32(stream, frame.time)
+        write_struct(
+            stream, ReplayFrameLegacy,
+            left_mouse,
+            right_mouse,
+            frame.mouse_x,
+            frame.mouse_y,
+            frame.time
+        )
         return stream.data
 
     @classmethod
@@ -371,21 +376,27 @@ class b282(BanchoIO):
 
     @classmethod
     def read_spectate_frames(cls, stream: MemoryStream) -> ReplayFrameBundle:
-        frames = [
-            cls.read_replay_frame(stream)
-            for _ in range(read_u16(stream))
-        ]
+        frames = cls.read_replay_frames(stream, read_u16(stream))
         action = ReplayAction(read_u8(stream))
         return ReplayFrameBundle(action, frames)
 
+    @classmethod
+    def read_replay_frames(cls, stream: MemoryStream, count: int) -> List[ReplayFrame]:
+        if cls.replay_frame_arrays:
+            return ReplayFrameArray.from_bytes(stream.read(count * ReplayFrameLegacy.size), legacy=True)
+
+        return [cls.read_replay_frame(stream) for _ in range(count)]
+
     @classmethod
     def read_replay_frame(cls, stream: MemoryStream) -> ReplayFrame:
         frame = ReplayFrame()
-        mouse_left = read_boolean(stream)
-        mouse_right = read_boolean(stream)
-        frame.mouse_x = read_f32(stream)
-        frame.mouse_y = read_f32(stream)
-        frame.time = read_s32(stream)
+        (
+            mouse_left,
+            mouse_right,
+            frame.mouse_x,
+            frame.mouse_y,
+            frame.time
+        ) = read_struct(stream, ReplayFrameLegacy)
 
         if mouse_left:
             frame.button_state |= ButtonState.Left1
@@ -401,3 +412,149 @@ class b282(BanchoIO):
     @classmethod
     def read_cant_spectate(cls, stream: MemoryStream) -> None:
         pass
+
+    @classmethod
+    def parse_country_string(cls, presence: UserPresence, country: str) -> None:
+        name, _, presence.city = country.partition(" / ")
+        presence.country_index = CountryNames.index(name) if name in CountryNames else 0
+
+    @classmethod
+    def read_status_update(cls, stream: MemoryStream) -> UserStatus:
+        status = UserStatus()
+        action = read_u8(stream)
+
+        # Reverse of `convert_output_status`
+        if action == Status.StatsUpdate:
+            status.update_stats = True
+        elif action > 10:
+            status.action = Status(action + 1)
+        else:
+            status.action = Status(action)
+
+        if status.action != Status.Unknown:
+            status.text = read_string(stream)
+            status.beatmap_checksum = read_string(stream)
+            status.mods = Mods(read_u16(stream))
+
+        return status
+
+    @classmethod
+    def write_osu_user_status(cls, status: UserStatus) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuUserStatus, cls.encode_status_update(status)
+
+    @classmethod
+    def write_osu_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, message.content)
+        yield PacketType.OsuMessage, stream.data
+
+    @classmethod
+    def write_osu_exit(cls, updating: bool = False) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuExit, b""
+
+    @classmethod
+    def write_osu_status_update_request(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuStatusUpdateRequest, b""
+
+    @classmethod
+    def write_osu_pong(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuPong, b""
+
+    @classmethod
+    def write_osu_start_spectating(cls, user_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, user_id)
+        yield PacketType.OsuStartSpectating, stream.data
+
+    @classmethod
+    def write_osu_stop_spectating(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuStopSpectating, b""
+
+    @classmethod
+    def write_osu_spectate_frames(cls, bundle: ReplayFrameBundle) -> Iterable[Tuple[PacketType, bytes]]:
+        # Clients send their frames in the same layout as they receive them
+        _, packet_data = next(cls.write_spectate_frames(bundle))
+        yield PacketType.OsuSpectateFrames, packet_data
+
+    @classmethod
+    def write_osu_error_report(cls, report: str) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, report)
+        yield PacketType.OsuErrorReport, stream.data
+
+    @classmethod
+    def write_osu_cant_spectate(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuCantSpectate, b""
+
+    @classmethod
+    def read_bancho_login_reply(cls, stream: MemoryStream) -> Union[int, LoginError]:
+        reply = read_s32(stream)
+        return LoginError(reply) if reply < 0 else reply
+
+    @classmethod
+    def read_bancho_ping(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_message(cls, stream: MemoryStream) -> Message:
+        # Private messages & channels have not been implemented yet
+        return Message(
+            sender=read_string(stream),
+            content=read_string(stream),
+            target="#osu"
+        )
+
+    @classmethod
+    def read_bancho_irc_change_username(cls, stream: MemoryStream) -> Tuple[str, str]:
+        old_name, _, new_name = read_string(stream).partition(">>>>")
+        return old_name, new_name
+
+    @classmethod
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        info.id = read_u32(stream)
+        info.name = read_string(stream)
+        (
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        ) = read_struct(stream, StatsLegacy)
+        avatar_filename = read_string(stream)
+        info.status = cls.read_status_update(stream)
+        info.presence.timezone = read_u8(stream) - 24
+        cls.parse_country_string(info.presence, read_string(stream))
+        return info
+
+    @classmethod
+    def read_bancho_user_quit(cls, stream: MemoryStream) -> UserQuit:
+        return UserQuit(cls.read_bancho_user_stats(stream))
+
+    @classmethod
+    def read_bancho_irc_join(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
+
+    @classmethod
+    def read_bancho_irc_quit(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
+
+    @classmethod
+    def read_bancho_spectator_joined(cls, stream: MemoryStream) -> int:
+        return read_u32(stream)
+
+    @classmethod
+    def read_bancho_spectator_left(cls, stream: MemoryStream) -> int:
+        return read_u32(stream)
+
+    @classmethod
+    def read_bancho_spectate_frames(cls, stream: MemoryStream) -> ReplayFrameBundle:
+        return cls.read_spectate_frames(stream)
+
+    @classmethod
+    def read_bancho_version_update(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_spectator_cant_spectate(cls, stream: MemoryStream) -> int:
+        return read_u32(stream)
@@ -25,3 +25,11 @@ class b291(b282):
         # NOTE: This is a backport of the actual restart packet, that
         #       simply announces the server restart to the user.
         return cls.write_announce(f"Bancho is restarting, please wait...")
+
+    @classmethod
+    def read_bancho_get_attention(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_announce(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
@@ -54,8 +54,7 @@ class b294(b291):
         stream = MemoryStream()
         write_u16(stream, len(bundle.frames))
 
-        for frame in bundle.frames:
-            stream.write(cls.write_replay_frame(frame))
+        stream.write(cls.write_replay_frames(bundle.frames))
 
         write_u8(stream, bundle.action)
 
@@ -66,10 +65,7 @@ class b294(b291):
 
     @classmethod
     def read_spectate_frames(cls, stream: MemoryStream) -> ReplayFrameBundle:
-        frames = [
-            cls.read_replay_frame(stream)
-            for _ in range(read_u16(stream))
-        ]
+        frames = cls.read_replay_frames(stream, read_u16(stream))
         action = ReplayAction(read_u8(stream))
         frame = None
 
@@ -81,18 +77,21 @@ class b294(b291):
     @classmethod
     def write_score_frame(cls, stream: MemoryStream, frame: ScoreFrame) -> None:
         write_string(stream, frame.checksum)
-        write_u8(stream, frame.id)
-        write_u16(stream, frame.total_300)
-        write_u16(stream, frame.total_100)
-        write_u16(stream, frame.total_50)
-        write_u16(stream, frame.total_geki)
-        write_u16(stream, frame.total_katu)
-        write_u16(stream, frame.total_miss)
-        write_u32(stream, frame.total_score)
-        write_u16(stream, frame.max_combo)
-        write_u16(stream, frame.current_combo)
-        write_boolean(stream, frame.perfect)
-        write_u8(stream, frame.hp)
+        write_struct(
+            stream, ScoreFrameBase,
+            frame.id,
+            frame.total_300,
+            frame.total_100,
+            frame.total_50,
+            frame.total_geki,
+            frame.total_katu,
+            frame.total_miss,
+            frame.total_score,
+            frame.max_combo,
+            frame.current_combo,
+            frame.perfect,
+            frame.hp
+        )
 
     @classmethod
     def read_score_frame(cls, stream: MemoryStream) -> ScoreFrame:
@@ -100,18 +99,23 @@ class b294(b291):
         frame_checksum = read_string(stream)
 
         return ScoreFrame(
-            time=0,
-            id=read_u8(stream),
-            total_300=read_u16(stream),
-            total_100=read_u16(stream),
-            total_50=read_u16(stream),
-            total_geki=read_u16(stream),
-            total_katu=read_u16(stream),
-            total_miss=read_u16(stream),
-            total_score=read_u32(stream),
-            max_combo=read_u16(stream),
-            current_combo=read_u16(stream),
-            perfect=read_boolean(stream),
-            hp=read_u8(stream),
+            0, *read_struct(stream, ScoreFrameBase),
             tag_byte=0
         )
+
+    @classmethod
+    def write_osu_private_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, message.target)
+        write_string(stream, message.content)
+        write_boolean(stream, True)
+        yield PacketType.OsuPrivateMessage, stream.data
+
+    @classmethod
+    def read_bancho_message(cls, stream: MemoryStream) -> Message:
+        sender = read_string(stream)
+        content = read_string(stream)
+        is_direct_message = read_boolean(stream)
+
+        # The recipient of a direct message is not sent to the client
+        return Message(sender, content, "" if is_direct_message else "#osu")
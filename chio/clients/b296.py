@@ -12,19 +12,22 @@ class b296(b294):
     @classmethod
     def write_score_frame(cls, stream: MemoryStream, frame: ScoreFrame) -> None:
         write_string(stream, frame.checksum)
-        write_s32(stream, frame.time)
-        write_u8(stream, frame.id)
-        write_u16(stream, frame.total_300)
-        write_u16(stream, frame.total_100)
-        write_u16(stream, frame.total_50)
-        write_u16(stream, frame.total_geki)
-        write_u16(stream, frame.total_katu)
-        write_u16(stream, frame.total_miss)
-        write_u32(stream, frame.total_score)
-        write_u16(stream, frame.max_combo)
-        write_u16(stream, frame.current_combo)
-        write_boolean(stream, frame.perfect)
-        write_u8(stream, frame.hp)
+        write_struct(
+            stream, ScoreFrameTimed,
+            frame.time,
+            frame.id,
+            frame.total_300,
+            frame.total_100,
+            frame.total_50,
+            frame.total_geki,
+            frame.total_katu,
+            frame.total_miss,
+            frame.total_score,
+            frame.max_combo,
+            frame.current_combo,
+            frame.perfect,
+            frame.hp
+        )
 
     @classmethod
     def read_score_frame(cls, stream):
@@ -32,18 +35,6 @@ class b296(b294):
         frame_checksum = read_string(stream)
 
         return ScoreFrame(
-            time=read_s32(stream),
-            id=read_u8(stream),
-            total_300=read_u16(stream),
-            total_100=read_u16(stream),
-            total_50=read_u16(stream),
-            total_geki=read_u16(stream),
-            total_katu=read_u16(stream),
-            total_miss=read_u16(stream),
-            total_score=read_u32(stream),
-            max_combo=read_u16(stream),
-            current_combo=read_u16(stream),
-            perfect=read_boolean(stream),
-            hp=read_u8(stream),
+            *read_struct(stream, ScoreFrameTimed),
             tag_byte=0
         )
@@ -165,3 +165,81 @@ class b298(b296):
             match.slots.append(slot)
 
         return match
+
+    @classmethod
+    def write_osu_lobby_join(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuLobbyJoin, b""
+
+    @classmethod
+    def write_osu_lobby_part(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuLobbyPart, b""
+
+    @classmethod
+    def write_osu_match_create(cls, match: Match) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchCreate, cls.write_match(match)
+
+    @classmethod
+    def write_osu_match_join(cls, join: MatchJoin) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, join.match_id)
+        yield PacketType.OsuMatchJoin, stream.data
+
+    @classmethod
+    def write_osu_match_part(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchPart, b""
+
+    @classmethod
+    def write_osu_match_change_slot(cls, slot_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, slot_id)
+        yield PacketType.OsuMatchChangeSlot, stream.data
+
+    @classmethod
+    def write_osu_match_ready(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchReady, b""
+
+    @classmethod
+    def write_osu_match_lock(cls, slot_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, slot_id)
+        yield PacketType.OsuMatchLock, stream.data
+
+    @classmethod
+    def write_osu_match_change_settings(cls, match: Match) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchChangeSettings, cls.write_match(match)
+
+    @classmethod
+    def read_bancho_match_update(cls, stream: MemoryStream) -> Match:
+        return cls.read_match(stream)
+
+    @classmethod
+    def read_bancho_match_new(cls, stream: MemoryStream) -> Match:
+        return cls.read_match(stream)
+
+    @classmethod
+    def read_bancho_match_disband(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_lobby_join(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_lobby_part(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_match_join_success(cls, stream: MemoryStream) -> Match:
+        return cls.read_match(stream)
+
+    @classmethod
+    def read_bancho_match_join_fail(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_fellow_spectator_joined(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_fellow_spectator_left(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
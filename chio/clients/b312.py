@@ -97,3 +97,25 @@ class b312(b298):
             match.slots.append(slot)
 
         return match
+
+    @classmethod
+    def write_osu_match_start(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchStart, b""
+
+    @classmethod
+    def write_osu_match_score_update(cls, frame: ScoreFrame) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        cls.write_score_frame(stream, frame)
+        yield PacketType.OsuMatchScoreUpdate, stream.data
+
+    @classmethod
+    def write_osu_match_complete(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchComplete, b""
+
+    @classmethod
+    def read_bancho_match_start(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_match_score_update(cls, stream: MemoryStream) -> ScoreFrame:
+        return cls.read_score_frame(stream)
@@ -36,3 +36,20 @@ class b320(b312):
     @classmethod
     def read_private_message(cls, stream: MemoryStream) -> Message:
         return cls.read_message(stream)
+
+    @classmethod
+    def write_osu_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, message.sender)
+        write_string(stream, message.content)
+        write_string(stream, message.target)
+        yield PacketType.OsuMessage, stream.data
+
+    @classmethod
+    def write_osu_private_message(cls, message: Message) -> Iterable[Tuple[PacketType, bytes]]:
+        _, packet_data = next(cls.write_osu_message(message))
+        yield PacketType.OsuPrivateMessage, packet_data
+
+    @classmethod
+    def read_bancho_message(cls, stream: MemoryStream) -> Message:
+        return cls.read_message(stream)
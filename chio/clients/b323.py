@@ -1,5 +1,6 @@
 
 from typing import Iterable, Tuple
+from copy import copy
 from .b320 import b320
 from ..constants import *
 from ..types import *
@@ -44,44 +45,83 @@ class b323(b320):
 
     @classmethod
     def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
-        stream = MemoryStream()
-        write_stats = info.status.update_stats
+        if info.presence.is_irc:
+            yield next(cls.write_irc_join(info.name))
+            return
 
+        yield PacketType.BanchoUserStats, cls.encode_user_stats(info, info.status)
+
+    @classmethod
+    def write_user_presence(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
         if info.presence.is_irc:
             yield next(cls.write_irc_join(info.name))
             return
 
+        # We assume that the client has not seen this user before, so
+        # we send two packets: one for the user stats, and one for the "presence".
+        # A copy of the status is used, to leave the info itself untouched.
+        status = copy(info.status)
+        status.disable_cache()
+
+        status.update_stats = True
+        yield PacketType.BanchoUserStats, cls.encode_user_stats(info, status)
+
+        status.update_stats = False
+        yield PacketType.BanchoUserStats, cls.encode_user_stats(info, status)
+
+    @classmethod
+    def encode_user_stats(cls, info: UserInfo, status: UserStatus) -> bytes:
+        stream = MemoryStream()
+        write_stats = status.update_stats
+
         write_u32(stream, info.id)
         write_boolean(stream, write_stats)
 
         if write_stats:
             write_string(stream, info.name)
-            write_u64(stream, info.stats.rscore)
-            write_f32(stream, info.stats.accuracy)
-            write_u32(stream, info.stats.playcount)
-            write_u64(stream, info.stats.tscore)
-            write_u32(stream, info.stats.rank)
+            write_struct(
+                stream, Stats,
+                info.stats.rscore,
+                info.stats.accuracy,
+                info.stats.playcount,
+                info.stats.tscore,
+                info.stats.rank
+            )
             write_string(stream, info.avatar_filename)
             write_u8(stream, info.presence.timezone+24)
             write_string(stream, info.presence.country_string)
 
-        stream.write(cls.write_status_update(info.status))
-        yield PacketType.BanchoUserStats, stream.data
+        stream.write(cls.encode_status_update(status))
+        return stream.data
 
     @classmethod
-    def write_user_presence(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
-        if info.presence.is_irc:
-            yield next(cls.write_irc_join(info.name))
-            return
-
-        # We assume that the client has not seen this user before, so
-        # we send two packets: one for the user stats, and one for the "presence".
-        info.status.update_stats = True
-        yield next(cls.write_user_stats(info))
+    def read_match_change_beatmap(cls, stream: MemoryStream) -> Match:
+        return cls.read_match(stream)
 
-        info.status.update_stats = False
-        yield next(cls.write_user_stats(info))
+    @classmethod
+    def write_osu_match_change_beatmap(cls, match: Match) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchChangeBeatmap, cls.write_match(match)
 
     @classmethod
-    def read_match_change_beatmap(cls, stream: MemoryStream) -> Match:
-        return cls.read_match(stream)
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        info.id = read_u32(stream)
+        info.status.update_stats = read_boolean(stream)
+
+        if info.status.update_stats:
+            info.name = read_string(stream)
+            (
+                info.stats.rscore,
+                info.stats.accuracy,
+                info.stats.playcount,
+                info.stats.tscore,
+                info.stats.rank
+            ) = read_struct(stream, Stats)
+            avatar_filename = read_string(stream)
+            info.presence.timezone = read_u8(stream) - 24
+            cls.parse_country_string(info.presence, read_string(stream))
+
+        update_stats = info.status.update_stats
+        info.status = cls.read_status_update(stream)
+        info.status.update_stats = update_stats
+        return info
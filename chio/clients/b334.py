@@ -19,12 +19,12 @@ class b334(b323):
     @classmethod
     def read_packet(cls, stream: Stream) -> Tuple[PacketType, Any]:
         packet_id = read_u16(stream)
-        packet = cls.convert_input_packet(packet_id)
+        packet = cls.resolve_input_packet(packet_id)
 
         if not packet.is_client_packet:
             raise ValueError(f"Packet '{packet.name}' is not a client packet")
 
-        packet_reader = getattr(cls, packet.handler_name, None)
+        packet_reader = cls.packet_handler(packet)
 
         if not packet_reader:
             raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
@@ -40,34 +40,21 @@ class b334(b323):
         if compression:
             packet_data = decompress(packet_data)
 
-        return packet, packet_reader(MemoryStream(packet_data))
+        return packet, cls.decode_packet(packet, packet_data)
 
     @classmethod
-    def write_packet(cls, stream: Stream, packet: PacketType, *args) -> None:
-        if not packet.is_server_packet:
-            raise ValueError(f"Packet '{packet.name}' is not a server packet")
+    def read_packet_header(cls, buffer: bytes, offset: int = 0) -> Tuple[int, bool, int]:
+        return PacketHeaderCompressed.unpack_from(buffer, offset)
 
-        packet_writer = getattr(cls, packet.handler_name, None)
-
-        if not packet_writer:
-            return
-
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
-
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            compression_enabled = len(packet_data) > 150 and not cls.disable_compression
+    @classmethod
+    def write_frame(cls, stream: MemoryStream, packet_id: int, packet_data: bytes) -> None:
+        compression_enabled = len(packet_data) > 150 and not cls.disable_compression
 
-            if compression_enabled:
-                packet_data = compress(packet_data)
+        if compression_enabled:
+            packet_data = compress(packet_data)
 
-            write_u16(output_stream, packet_id)
-            write_boolean(output_stream, compression_enabled)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            stream.write(output_stream.data)
-            output_stream.clear()
+        write_struct(stream, PacketHeaderCompressed, packet_id, compression_enabled, len(packet_data))
+        stream.write(packet_data)
 
     @classmethod
     async def read_packet_async(cls, stream: AsyncStream) -> Tuple[PacketType, Any]:
@@ -75,12 +62,12 @@ class b334(b323):
         input_stream.write(await stream.read(cls.header_size))
 
         packet_id = read_u16(input_stream)
-        packet = cls.convert_input_packet(packet_id)
+        packet = cls.resolve_input_packet(packet_id)
 
         if not packet.is_client_packet:
             raise ValueError(f"Packet '{packet.name}' is not a client packet")
 
-        packet_reader = getattr(cls, packet.handler_name, None)
+        packet_reader = cls.packet_handler(packet)
 
         if not packet_reader:
             raise NotImplementedError(f"Version '{cls.version}' does not implement packet '{packet.name}'")
@@ -96,34 +83,7 @@ class b334(b323):
         if compression:
             packet_data = decompress(packet_data)
 
-        return packet, packet_reader(MemoryStream(packet_data))
-
-    @classmethod
-    async def write_packet_async(cls, stream: AsyncStream, packet: PacketType, *args) -> None:
-        if not packet.is_server_packet:
-            raise ValueError(f"Packet '{packet.name}' is not a server packet")
-
-        packet_writer = getattr(cls, packet.handler_name, None)
-
-        if not packet_writer:
-            return
-
-        packets = packet_writer(*args)
-        output_stream = MemoryStream()
-
-        for packet, packet_data in packets:
-            packet_id = cls.convert_output_packet(packet)
-            compression_enabled = len(packet_data) > 150
-
-            if compression_enabled:
-                packet_data = compress(packet_data)
-
-            write_u16(output_stream, packet_id)
-            write_boolean(output_stream, compression_enabled)
-            write_u32(output_stream, len(packet_data))
-            output_stream.write(packet_data)
-            await stream.write(output_stream.data)
-            output_stream.clear()
+        return packet, cls.decode_packet(packet, packet_data)
 
     @classmethod
     def convert_input_packet(cls, packet: int) -> PacketType:
@@ -207,46 +167,40 @@ class b334(b323):
 
     @classmethod
     def write_score_frame(cls, stream: MemoryStream, frame: ScoreFrame) -> None:
-        write_s32(stream, frame.time)
-        write_u8(stream, frame.id)
-        write_u16(stream, frame.total_300)
-        write_u16(stream, frame.total_100)
-        write_u16(stream, frame.total_50)
-        write_u16(stream, frame.total_geki)
-        write_u16(stream, frame.total_katu)
-        write_u16(stream, frame.total_miss)
-        write_u32(stream, frame.total_score)
-        write_u16(stream, frame.max_combo)
-        write_u16(stream, frame.current_combo)
-        write_boolean(stream, frame.perfect)
-        write_u8(stream, frame.hp)
+        write_struct(
+            stream, ScoreFrameTimed,
+            frame.time,
+            frame.id,
+            frame.total_300,
+            frame.total_100,
+            frame.total_50,
+            frame.total_geki,
+            frame.total_katu,
+            frame.total_miss,
+            frame.total_score,
+            frame.max_combo,
+            frame.current_combo,
+            frame.perfect,
+            frame.hp
+        )
 
     @classmethod
     def read_score_frame(cls, stream: MemoryStream) -> ScoreFrame:
         return ScoreFrame(
-            time=read_s32(stream),
-            id=read_u8(stream),
-            total_300=read_u16(stream),
-            total_100=read_u16(stream),
-            total_50=read_u16(stream),
-            total_geki=read_u16(stream),
-            total_katu=read_u16(stream),
-            total_miss=read_u16(stream),
-            total_score=read_u32(stream),
-            max_combo=read_u16(stream),
-            current_combo=read_u16(stream),
-            perfect=read_boolean(stream),
-            hp=read_u8(stream),
+            *read_struct(stream, ScoreFrameTimed),
             tag_byte=0
         )
 
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderLegacy,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.beatmap_text)
         write_s32(stream, match.beatmap_id)
@@ -264,10 +218,9 @@ class b334(b323):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u8(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeaderLegacy)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.beatmap_text = read_string(stream)
         match.beatmap_id = read_s32(stream)
@@ -282,3 +235,45 @@ class b334(b323):
                 slot.user_id = read_s32(stream)
 
         return match
+
+    @classmethod
+    def write_osu_match_change_mods(cls, mods: Mods) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, mods)
+        yield PacketType.OsuMatchChangeMods, stream.data
+
+    @classmethod
+    def write_osu_match_load_complete(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchLoadComplete, b""
+
+    @classmethod
+    def write_osu_match_no_beatmap(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchNoBeatmap, b""
+
+    @classmethod
+    def write_osu_match_not_ready(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchNotReady, b""
+
+    @classmethod
+    def write_osu_match_failed(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchFailed, b""
+
+    @classmethod
+    def read_bancho_match_transfer_host(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_match_all_players_loaded(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_match_player_failed(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
+
+    @classmethod
+    def read_bancho_match_complete(cls, stream: MemoryStream) -> None:
+        pass
+
+    @classmethod
+    def read_bancho_match_start(cls, stream: MemoryStream) -> Match:
+        return cls.read_match(stream)
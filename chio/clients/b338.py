@@ -12,6 +12,11 @@ class b338(b334):
     """
     version = 338
 
+    @classmethod
+    def total_score(cls, stats: UserStats) -> int:
+        """Returns the total score that gets sent to the client"""
+        return stats.tscore
+
     @classmethod
     def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
         stream = MemoryStream()
@@ -22,12 +27,15 @@ class b338(b334):
 
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Statistics)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u16(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsRankShort,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            cls.total_score(info.stats),
+            info.stats.rank
+        )
         yield PacketType.BanchoUserStats, stream.data
 
     @classmethod
@@ -40,12 +48,15 @@ class b338(b334):
 
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Full)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u16(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsRankShort,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            cls.total_score(info.stats),
+            info.stats.rank
+        )
         write_string(stream, info.name)
         write_string(stream, info.avatar_filename)
         write_u8(stream, info.presence.timezone+24)
@@ -84,3 +95,38 @@ class b338(b334):
             status.action = Status.Playing
 
         return status
+
+    @classmethod
+    def read_bancho_user_stats(cls, stream: MemoryStream) -> UserInfo:
+        info = UserInfo()
+        info.id = read_u32(stream)
+        completeness = Completeness(read_u8(stream))
+        info.status = cls.read_status_update(stream)
+        cls.read_stats(stream, info.stats)
+
+        if completeness >= Completeness.Full:
+            cls.read_user_presence_tail(stream, info)
+
+        return info
+
+    @classmethod
+    def read_stats(cls, stream: MemoryStream, stats: UserStats) -> None:
+        (
+            stats.rscore,
+            stats.accuracy,
+            stats.playcount,
+            stats.tscore,
+            stats.rank
+        ) = read_struct(stream, StatsRankShort)
+
+    @classmethod
+    def read_user_presence_tail(cls, stream: MemoryStream, info: UserInfo) -> None:
+        info.name = read_string(stream)
+        avatar_filename = read_string(stream)
+        info.presence.timezone = read_u8(stream) - 24
+        cls.parse_country_string(info.presence, read_string(stream))
+
+    @classmethod
+    def read_status_update(cls, stream: MemoryStream) -> UserStatus:
+        # Statuses are sent in the same layout as they are received
+        return cls.read_user_status(stream)
@@ -1,4 +1,6 @@
 
+from typing import Iterable, Tuple
+
 from .b338 import b338
 from ..constants import *
 from ..io import *
@@ -38,3 +40,7 @@ class b340(b338):
     @classmethod
     def read_match_has_beatmap(cls, stream: MemoryStream) -> None:
         pass
+
+    @classmethod
+    def write_osu_match_has_beatmap(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchHasBeatmap, b""
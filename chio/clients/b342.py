@@ -18,3 +18,11 @@ class b342(b340):
     @classmethod
     def read_match_skip_request(cls, stream: MemoryStream) -> None:
         pass
+
+    @classmethod
+    def write_osu_match_skip_request(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchSkipRequest, b""
+
+    @classmethod
+    def read_bancho_match_skip(cls, stream: MemoryStream) -> None:
+        pass
@@ -38,3 +38,25 @@ class b349(b342):
         stream = MemoryStream()
         write_string(stream, channel.name)
         yield PacketType.BanchoChannelAvailableAutojoin, stream.data
+
+    @classmethod
+    def write_osu_channel_join(cls, channel: str) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, channel)
+        yield PacketType.OsuChannelJoin, stream.data
+
+    @classmethod
+    def read_bancho_channel_join_success(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
+
+    @classmethod
+    def read_bancho_channel_revoked(cls, stream: MemoryStream) -> str:
+        return read_string(stream)
+
+    @classmethod
+    def read_bancho_channel_available(cls, stream: MemoryStream) -> Channel:
+        return Channel(read_string(stream))
+
+    @classmethod
+    def read_bancho_channel_available_autojoin(cls, stream: MemoryStream) -> Channel:
+        return cls.read_bancho_channel_available(stream)
@@ -21,12 +21,48 @@ class b354(b349):
         write_u32(stream, len(reply.beatmaps))
 
         for info in reply.beatmaps:
-            write_s16(stream, info.index)
-            write_s32(stream, info.beatmap_id)
-            write_s32(stream, info.beatmapset_id)
-            write_s32(stream, info.thread_id)
-            write_boolean(stream, info.is_ranked)
-            write_s8(stream, info.osu_rank)
+            write_struct(
+                stream, BeatmapInfoLegacy,
+                info.index,
+                info.beatmap_id,
+                info.beatmapset_id,
+                info.thread_id,
+                info.is_ranked,
+                info.osu_rank
+            )
             write_string(stream, info.checksum)
 
         yield PacketType.BanchoBeatmapInfoReply, stream.data
+
+    @classmethod
+    def write_osu_beatmap_info_request(cls, request: BeatmapInfoRequest) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_u32(stream, len(request.filenames))
+
+        for filename in request.filenames:
+            write_string(stream, filename)
+
+        yield PacketType.OsuBeatmapInfoRequest, stream.data
+
+    @classmethod
+    def read_bancho_beatmap_info_reply(cls, stream: MemoryStream) -> BeatmapInfoReply:
+        reply = BeatmapInfoReply()
+
+        for _ in range(read_u32(stream)):
+            (
+                index,
+                beatmap_id,
+                beatmapset_id,
+                thread_id,
+                is_ranked,
+                osu_rank
+            ) = read_struct(stream, BeatmapInfoLegacy)
+
+            reply.beatmaps.append(BeatmapInfo(
+                index, beatmap_id, beatmapset_id, thread_id,
+                RankedStatus.Ranked if is_ranked else RankedStatus.Pending,
+                read_string(stream),
+                Rank(osu_rank)
+            ))
+
+        return reply
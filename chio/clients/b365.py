@@ -1,7 +1,4 @@
 
-from copy import copy
-from typing import Iterable, Tuple
-
 from .b354 import b354
 from ..constants import *
 from ..types import *
@@ -14,23 +11,6 @@ class b365(b354):
     version = 365
 
     @classmethod
-    def write_user_stats(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
-        total_score = copy(info.stats.tscore)
-
-        # Cap total score & write stats
-        info.stats.tscore = min(info.stats.tscore, 17705429348)
-        yield next(super().write_user_stats(info))
-
-        # Re-apply original value
-        info.stats.tscore = total_score
-    
-    @classmethod
-    def write_user_presence(cls, info: UserInfo) -> Iterable[Tuple[PacketType, bytes]]:
-        total_score = copy(info.stats.tscore)
-
-        # Cap total score & write presence
-        info.stats.tscore = min(info.stats.tscore, 17705429348)
-        yield next(super().write_user_presence(info))
-
-        # Re-apply original value
-        info.stats.tscore = total_score
+    def total_score(cls, stats: UserStats) -> int:
+        # Cap total score, without modifying the stats themselves
+        return min(stats.tscore, 17705429348)
@@ -1,4 +1,5 @@
 from .b365 import b365
+from ..frames import ReplayFrameArray
 from ..constants import *
 from ..types import *
 from ..io import *
@@ -10,24 +11,44 @@ class b374(b365):
     """
     version = 374
 
+    @classmethod
+    def write_replay_frames(cls, frames: List[ReplayFrame]) -> bytes:
+        if isinstance(frames, ReplayFrameArray):
+            return frames.to_bytes()
+
+        return b"".join(cls.write_replay_frame(frame) for frame in frames)
+
     @classmethod
     def write_replay_frame(cls, frame: ReplayFrame) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, frame.button_state)
-        write_boolean(stream, False)
-        write_f32(stream, frame.mouse_x)
-        write_f32(stream, frame.mouse_y)
-        write_s32(stream, frame.time)
+        write_struct(
+            stream, ReplayFrameButtons,
+            frame.button_state,
+            False,
+            frame.mouse_x,
+            frame.mouse_y,
+            frame.time
+        )
         return stream.data
 
+    @classmethod
+    def read_replay_frames(cls, stream: MemoryStream, count: int) -> List[ReplayFrame]:
+        if cls.replay_frame_arrays:
+            return ReplayFrameArray.from_bytes(stream.read(count * ReplayFrameButtons.size))
+
+        return [cls.read_replay_frame(stream) for _ in range(count)]
+
     @classmethod
     def read_replay_frame(cls, stream: MemoryStream) -> ReplayFrame:
         frame = ReplayFrame()
-        frame.button_state = ButtonState(read_u8(stream))
-        legacy_mouse_right = read_boolean(stream)
-        frame.mouse_x = read_f32(stream)
-        frame.mouse_y = read_f32(stream)
-        frame.time = read_s32(stream)
+        (
+            button_state,
+            legacy_mouse_right,
+            frame.mouse_x,
+            frame.mouse_y,
+            frame.time
+        ) = read_struct(stream, ReplayFrameButtons)
+        frame.button_state = ButtonState(button_state)
 
         if legacy_mouse_right:
             frame.button_state |= ButtonState.Right1
@@ -34,12 +34,38 @@ class b388(b374):
         write_u32(stream, len(reply.beatmaps))
 
         for info in reply.beatmaps:
-            write_s16(stream, info.index)
-            write_s32(stream, info.beatmap_id)
-            write_s32(stream, info.beatmapset_id)
-            write_s32(stream, info.thread_id)
-            write_s8(stream, cls.convert_ranked_status(info.ranked_status))
-            write_s8(stream, info.osu_rank)
+            write_struct(
+                stream, BeatmapInfoRanks,
+                info.index,
+                info.beatmap_id,
+                info.beatmapset_id,
+                info.thread_id,
+                cls.convert_ranked_status(info.ranked_status),
+                info.osu_rank
+            )
             write_string(stream, info.checksum)
 
         yield PacketType.BanchoBeatmapInfoReply, stream.data
+
+    @classmethod
+    def read_bancho_beatmap_info_reply(cls, stream: MemoryStream) -> BeatmapInfoReply:
+        reply = BeatmapInfoReply()
+
+        for _ in range(read_u32(stream)):
+            (
+                index,
+                beatmap_id,
+                beatmapset_id,
+                thread_id,
+                ranked_status,
+                osu_rank
+            ) = read_struct(stream, BeatmapInfoRanks)
+
+            reply.beatmaps.append(BeatmapInfo(
+                index, beatmap_id, beatmapset_id, thread_id,
+                RankedStatus(ranked_status),
+                read_string(stream),
+                Rank(osu_rank)
+            ))
+
+        return reply
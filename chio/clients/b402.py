@@ -1,3 +1,4 @@
+from typing import Iterable, Tuple
 from .b388 import b388
 from ..constants import *
 from ..types import *
@@ -16,10 +17,13 @@ class b402(b388):
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderLegacy,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.beatmap_text)
         write_s32(stream, match.beatmap_id)
@@ -38,10 +42,9 @@ class b402(b388):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u8(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeaderLegacy)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.beatmap_text = read_string(stream)
         match.beatmap_id = read_s32(stream)
@@ -57,3 +60,9 @@ class b402(b388):
 
         match.host_id = read_s32(stream)
         return match
+
+    @classmethod
+    def write_osu_match_transfer_host(cls, slot_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, slot_id)
+        yield PacketType.OsuMatchTransferHost, stream.data
@@ -16,3 +16,7 @@ class b425(b402):
         stream = MemoryStream()
         write_s32(stream, permissions.value)
         yield PacketType.BanchoLoginPermissions, stream.data
+
+    @classmethod
+    def read_bancho_login_permissions(cls, stream: MemoryStream) -> Permissions:
+        return Permissions(read_s32(stream))
@@ -22,12 +22,15 @@ class b452(b425):
         # NOTE: See b365 for the level overflow bug
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Full)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, min(info.stats.tscore, 17705429348))
-        write_u16(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsRankShort,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            min(info.stats.tscore, 17705429348),
+            info.stats.rank
+        )
         write_string(stream, info.name)
         write_string(stream, info.avatar_filename)
         write_u8(stream, info.presence.timezone+24)
@@ -48,3 +51,24 @@ class b452(b425):
     @classmethod
     def read_friends_remove(cls, stream: MemoryStream) -> int:
         return read_s32(stream)
+
+    @classmethod
+    def write_osu_friends_add(cls, user_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, user_id)
+        yield PacketType.OsuFriendsAdd, stream.data
+
+    @classmethod
+    def write_osu_friends_remove(cls, user_id: int) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, user_id)
+        yield PacketType.OsuFriendsRemove, stream.data
+
+    @classmethod
+    def read_bancho_friends_list(cls, stream: MemoryStream) -> List[int]:
+        return read_list_s32(stream)
+
+    @classmethod
+    def read_user_presence_tail(cls, stream: MemoryStream, info: UserInfo) -> None:
+        super().read_user_presence_tail(stream, info)
+        info.presence.permissions = Permissions(read_u8(stream))
@@ -18,3 +18,7 @@ class b487(b470):
         stream = MemoryStream()
         write_s32(stream, version or cls.protocol_version)
         yield PacketType.BanchoProtocolNegotiation, stream.data
+
+    @classmethod
+    def read_bancho_protocol_negotiation(cls, stream: MemoryStream) -> int:
+        return read_s32(stream)
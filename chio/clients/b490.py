@@ -1,3 +1,4 @@
+from typing import Iterable, Tuple
 from .b489 import b489
 from ..constants import *
 from ..types import *
@@ -21,9 +22,12 @@ class b490(b489):
         if beatmap_update:
             write_string(stream, status.text)
             write_string(stream, status.beatmap_checksum)
-            write_u16(stream, status.mods)
-            write_u8(stream, status.mode)
-            write_s32(stream, status.beatmap_id)
+            write_struct(
+                stream, StatusBeatmap,
+                status.mods,
+                status.mode,
+                status.beatmap_id
+            )
 
         return stream.data
 
@@ -36,9 +40,9 @@ class b490(b489):
         if beatmap_update:
             status.text = read_string(stream)
             status.beatmap_checksum = read_string(stream)
-            status.mods = Mods(read_u16(stream))
-            status.mode = Mode(read_u8(stream))
-            status.beatmap_id = read_s32(stream)
+            status.mods, status.mode, status.beatmap_id = read_struct(stream, StatusBeatmap)
+            status.mods = Mods(status.mods)
+            status.mode = Mode(status.mode)
 
         return status
     
@@ -48,3 +52,18 @@ class b490(b489):
             [read_string(stream) for _ in range(read_u32(stream))],
             [read_s32(stream) for _ in range(read_u32(stream))]
         )
+
+    @classmethod
+    def write_osu_beatmap_info_request(cls, request: BeatmapInfoRequest) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_u32(stream, len(request.filenames))
+
+        for filename in request.filenames:
+            write_string(stream, filename)
+
+        write_u32(stream, len(request.ids))
+
+        for beatmap_id in request.ids:
+            write_s32(stream, beatmap_id)
+
+        yield PacketType.OsuBeatmapInfoRequest, stream.data
@@ -18,12 +18,15 @@ class b504(b490):
         write_u32(stream, len(reply.beatmaps))
 
         for info in reply.beatmaps:
-            write_s16(stream, info.index)
-            write_s32(stream, info.beatmap_id)
-            write_s32(stream, info.beatmapset_id)
-            write_s32(stream, info.thread_id)
-            write_s8(stream, cls.convert_ranked_status(info.ranked_status))
-            write_s8(stream, info.osu_rank)
+            write_struct(
+                stream, BeatmapInfoRanks,
+                info.index,
+                info.beatmap_id,
+                info.beatmapset_id,
+                info.thread_id,
+                cls.convert_ranked_status(info.ranked_status),
+                info.osu_rank
+            )
 
             if cls.protocol_version >= 2:
                 write_s8(stream, info.fruits_rank)
@@ -44,12 +47,15 @@ class b504(b490):
         # NOTE: See b365 for the level overflow bug
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Statistics)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, min(info.stats.tscore, 26931190827))
-        write_u16(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsRankShort,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            min(info.stats.tscore, 26931190827),
+            info.stats.rank
+        )
         yield PacketType.BanchoUserStats, stream.data
     
     @classmethod
@@ -63,15 +69,47 @@ class b504(b490):
         # NOTE: See b365 for the level overflow bug
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Full)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, min(info.stats.tscore, 26931190827))
-        write_u16(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, StatsRankShort,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            min(info.stats.tscore, 26931190827),
+            info.stats.rank
+        )
         write_string(stream, info.name)
         write_string(stream, info.avatar_filename)
         write_u8(stream, info.presence.timezone+24)
         write_string(stream, info.presence.country_string)
         write_u8(stream, info.presence.permissions)
         yield PacketType.BanchoUserStats, stream.data
+
+    @classmethod
+    def read_bancho_beatmap_info_reply(cls, stream: MemoryStream) -> BeatmapInfoReply:
+        reply = BeatmapInfoReply()
+
+        for _ in range(read_u32(stream)):
+            (
+                index,
+                beatmap_id,
+                beatmapset_id,
+                thread_id,
+                ranked_status,
+                osu_rank
+            ) = read_struct(stream, BeatmapInfoRanks)
+
+            info = BeatmapInfo(
+                index, beatmap_id, beatmapset_id, thread_id,
+                RankedStatus(ranked_status), "",
+                Rank(osu_rank)
+            )
+
+            if cls.protocol_version >= 2:
+                info.fruits_rank = Rank(read_s8(stream))
+                info.taiko_rank = Rank(read_s8(stream))
+
+            info.checksum = read_string(stream)
+            reply.beatmaps.append(info)
+
+        return reply
@@ -16,10 +16,13 @@ class b535(b504):
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderLegacy,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.beatmap_text)
         write_s32(stream, match.beatmap_id)
@@ -44,10 +47,9 @@ class b535(b504):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u8(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeaderLegacy)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.beatmap_text = read_string(stream)
         match.beatmap_id = read_s32(stream)
@@ -81,37 +83,28 @@ class b535(b504):
 
     @classmethod
     def write_score_frame(cls, stream: MemoryStream, frame: ScoreFrame) -> None:
-        write_s32(stream, frame.time)
-        write_u8(stream, frame.id)
-        write_u16(stream, frame.total_300)
-        write_u16(stream, frame.total_100)
-        write_u16(stream, frame.total_50)
-        write_u16(stream, frame.total_geki)
-        write_u16(stream, frame.total_katu)
-        write_u16(stream, frame.total_miss)
-        write_u32(stream, frame.total_score)
-        write_u16(stream, frame.max_combo)
-        write_u16(stream, frame.current_combo)
-        write_boolean(stream, frame.perfect)
-        write_u8(stream, frame.hp)
-        write_u8(stream, frame.tag_byte)
+        write_struct(
+            stream, ScoreFrameTagged,
+            frame.time,
+            frame.id,
+            frame.total_300,
+            frame.total_100,
+            frame.total_50,
+            frame.total_geki,
+            frame.total_katu,
+            frame.total_miss,
+            frame.total_score,
+            frame.max_combo,
+            frame.current_combo,
+            frame.perfect,
+            frame.hp,
+            frame.tag_byte
+        )
 
     @classmethod
     def read_score_frame(cls, stream: MemoryStream) -> ScoreFrame:
         frame = ScoreFrame(
-            time=read_s32(stream),
-            id=read_u8(stream),
-            total_300=read_u16(stream),
-            total_100=read_u16(stream),
-            total_50=read_u16(stream),
-            total_geki=read_u16(stream),
-            total_katu=read_u16(stream),
-            total_miss=read_u16(stream),
-            total_score=read_u32(stream),
-            max_combo=read_u16(stream),
-            current_combo=read_u16(stream),
-            perfect=read_boolean(stream),
-            hp=read_u8(stream),
+            *read_struct(stream, ScoreFrameTimed),
             tag_byte=0
         )
 
@@ -127,3 +120,7 @@ class b535(b504):
         # This is currently only used to refresh the title image, without sending the link
         # over the packet, i.e. it's still using `/web/osu-title-image.php` under the hood.
         yield PacketType.BanchoTitleUpdate, b""
+
+    @classmethod
+    def read_bancho_title_update(cls, stream: MemoryStream) -> TitleUpdate:
+        return TitleUpdate()
@@ -1,3 +1,4 @@
+from typing import Iterable, Tuple
 from .b535 import b535
 from ..constants import *
 from ..types import *
@@ -13,10 +14,13 @@ class b558(b535):
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderLegacy,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.beatmap_text)
         write_s32(stream, match.beatmap_id)
@@ -45,10 +49,9 @@ class b558(b535):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u8(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeaderLegacy)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.beatmap_text = read_string(stream)
         match.beatmap_id = read_s32(stream)
@@ -79,3 +82,7 @@ class b558(b535):
     @classmethod
     def read_match_change_team(cls, stream: MemoryStream) -> None:
         pass
+
+    @classmethod
+    def write_osu_match_change_team(cls) -> Iterable[Tuple[PacketType, bytes]]:
+        yield PacketType.OsuMatchChangeTeam, b""
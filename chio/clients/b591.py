@@ -1,3 +1,4 @@
+from typing import Iterable, Tuple
 from .b558 import b558
 from ..constants import *
 from ..types import *
@@ -12,10 +13,13 @@ class b591(b558):
     @classmethod
     def write_match(cls, match: Match) -> bytes:
         stream = MemoryStream()
-        write_u8(stream, match.id)
-        write_boolean(stream, match.in_progress)
-        write_u8(stream, match.type)
-        write_u16(stream, match.mods.value)
+        write_struct(
+            stream, MatchHeaderLegacy,
+            match.id,
+            match.in_progress,
+            match.type,
+            match.mods.value
+        )
         write_string(stream, match.name)
         write_string(stream, match.password)
         write_string(stream, match.beatmap_text)
@@ -45,10 +49,9 @@ class b591(b558):
     @classmethod
     def read_match(cls, stream: MemoryStream) -> Match:
         match = Match()
-        match.id = read_u8(stream)
-        match.in_progress = read_boolean(stream)
-        match.type = MatchType(read_u8(stream))
-        match.mods = Mods(read_u16(stream))
+        match.id, match.in_progress, match.type, match.mods = read_struct(stream, MatchHeaderLegacy)
+        match.type = MatchType(match.type)
+        match.mods = Mods(match.mods)
         match.name = read_string(stream)
         match.password = read_string(stream)
         match.beatmap_text = read_string(stream)
@@ -80,3 +83,10 @@ class b591(b558):
     @classmethod
     def read_match_join(cls, stream: MemoryStream) -> MatchJoin:
         return MatchJoin(read_s32(stream), read_string(stream))
+
+    @classmethod
+    def write_osu_match_join(cls, join: MatchJoin) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, join.match_id)
+        write_string(stream, join.password)
+        yield PacketType.OsuMatchJoin, stream.data
@@ -1,4 +1,6 @@
+from typing import Iterable, Tuple
 from .b591 import b591
+from ..constants import *
 from ..io import *
 
 class b613(b591):
@@ -10,3 +12,9 @@ class b613(b591):
     @classmethod
     def read_channel_leave(cls, stream: MemoryStream) -> str:
         return read_string(stream)
+
+    @classmethod
+    def write_osu_channel_leave(cls, channel: str) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_string(stream, channel)
+        yield PacketType.OsuChannelLeave, stream.data
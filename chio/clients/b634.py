@@ -18,3 +18,13 @@ class b634(b613):
     @classmethod
     def read_receive_updates(cls, stream: MemoryStream) -> PresenceFilter:
         return PresenceFilter(read_s32(stream))
+
+    @classmethod
+    def write_osu_receive_updates(cls, filter: PresenceFilter) -> Iterable[Tuple[PacketType, bytes]]:
+        stream = MemoryStream()
+        write_s32(stream, filter)
+        yield PacketType.OsuReceiveUpdates, stream.data
+
+    @classmethod
+    def read_bancho_monitor(cls, stream: MemoryStream) -> None:
+        pass
@@ -21,12 +21,15 @@ class b695(b659):
 
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Statistics)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, Stats,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
         yield PacketType.BanchoUserStats, stream.data
 
     @classmethod
@@ -39,15 +42,28 @@ class b695(b659):
 
         write_u32(stream, info.id)
         write_u8(stream, Completeness.Full)
-        stream.write(cls.write_status_update(info.status))
-        write_u64(stream, info.stats.rscore)
-        write_f32(stream, info.stats.accuracy)
-        write_u32(stream, info.stats.playcount)
-        write_u64(stream, info.stats.tscore)
-        write_u32(stream, info.stats.rank)
+        stream.write(cls.encode_status_update(info.status))
+        write_struct(
+            stream, Stats,
+            info.stats.rscore,
+            info.stats.accuracy,
+            info.stats.playcount,
+            info.stats.tscore,
+            info.stats.rank
+        )
         write_string(stream, info.name)
         write_string(stream, info.avatar_filename)
         write_u8(stream, info.presence.timezone+24)
         write_string(stream, info.presence.country_string)
         write_u8(stream, info.presence.permissions)
         yield PacketType.BanchoUserStats, stream.data
+
+    @classmethod
+    def read_stats(cls, stream: MemoryStream, stats: UserStats) -> None:
+        (
+            stats.rscore,
+            stats.accuracy,
+            stats.playcount,
+            stats.tscore,
+            stats.rank
+        ) = read_struct(stream, Stats)
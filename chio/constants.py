@@ -175,6 +175,14 @@ class PacketType(IntEnum):
         name = name.replace("bancho_", "write_")
         return name
 
+    @cached_property
+    def client_handler_name(self) -> str:
+        # Handlers for the client side keep the full packet name,
+        # e.g. "write_osu_user_status" & "read_bancho_user_stats"
+        name = CaseConvertPattern.sub("_", self.name).lower()
+        prefix = "write_" if self.is_client_packet else "read_"
+        return prefix + name
+
 class Status(IntEnum):
     Idle         = 0
     Afk          = 1
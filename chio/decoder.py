@@ -0,0 +1,110 @@
+
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple
+from .constants import PacketType
+from .io import decompress
+
+if TYPE_CHECKING:
+    from .chio import BanchoIO, PacketFrame
+
+class PacketDecoder:
+    """
+    PacketDecoder is a sans-IO packet framer, that accepts raw chunks of
+    data as they arrive from the socket, and yields every packet that was
+    received completely. Incomplete packets stay buffered until the rest
+    of their body arrives through the next `feed` calls.
+    """
+
+    # Leftover bytes are only moved to the front of the buffer once the consumed
+    # part grows past this size, so that small reads don't copy the buffer every time
+    compact_threshold: int = 65536
+
+    def __init__(self, client: "BanchoIO") -> None:
+        self.client = client
+        self.buffer = bytearray()
+        self.offset = 0
+        self.header: Optional["PacketFrame"] = None
+
+    def __len__(self) -> int:
+        return len(self.buffer) - self.offset
+
+    @property
+    def pending(self) -> bool:
+        """Whether a packet was received partially"""
+        return self.header is not None or len(self) > 0
+
+    @property
+    def remaining(self) -> int:
+        """The number of bytes that are missing to complete the next header or body"""
+        if self.header is None:
+            return max(self.client.header_size - len(self), 0)
+
+        return max(self.header.length - len(self), 0)
+
+    def feed(self, data: bytes) -> Iterator[Tuple[PacketType, Any]]:
+        """
+        Append a chunk of received data to the buffer, and yield the packet type
+        and decoded data of every packet that can be decoded completely.
+        """
+        self.buffer += data
+        return self.read_packets()
+
+    def read_packets(self) -> Iterator[Tuple[PacketType, Any]]:
+        """
+        Yield every packet that is available inside the buffer.
+        """
+        while True:
+            packet = self.read_packet()
+
+            if packet is None:
+                break
+
+            yield packet
+
+    def read_packet(self) -> Optional[Tuple[PacketType, Any]]:
+        """
+        Decode the next packet from the buffer, or return `None` if
+        it was not received completely yet.
+        """
+        if self.header is None:
+            if len(self) < self.client.header_size:
+                return None
+
+            self.header = self.read_header()
+            self.offset += self.client.header_size
+
+        packet, compression, packet_length = self.header.packet, self.header.compressed, self.header.length
+
+        if len(self) < packet_length:
+            return None
+
+        packet_data = self.buffer[self.offset:self.offset + packet_length]
+        self.offset += packet_length
+        self.header = None
+        self.compact()
+
+        if compression:
+            packet_data = decompress(packet_data)
+
+        return packet, self.client.decode_packet(packet, packet_data)
+
+    def read_header(self) -> "PacketFrame":
+        return self.client.peek_header(self.buffer, self.offset)
+
+    def compact(self) -> None:
+        if self.offset == len(self.buffer):
+            # Everything was consumed, so there is nothing to move
+            self.buffer.clear()
+            self.offset = 0
+            return
+
+        if self.offset >= self.compact_threshold:
+            del self.buffer[:self.offset]
+            self.offset = 0
+
+    def clear(self) -> None:
+        """
+        Discard all buffered data, including any partially received packet.
+        """
+        self.buffer.clear()
+        self.offset = 0
+        self.header = None
@@ -0,0 +1,214 @@
+
+from typing import Any, Iterable, Iterator, List, Optional
+from functools import lru_cache
+from itertools import repeat
+from types import ModuleType
+from struct import error
+from array import array
+
+from .primitives import ReplayFrameButtons, ReplayFrameLegacy
+from .constants import ButtonState
+from .types import ReplayFrame
+
+__all__ = [
+    "ReplayFrameArray",
+    "resolve_numpy"
+]
+
+LeftButtons = ButtonState.Left1 | ButtonState.Left2
+RightButtons = ButtonState.Right1 | ButtonState.Right2
+
+# Array typecodes of every column, along with their numpy equivalents
+ColumnTypes = {
+    "button_state": ("B", "u1"),
+    "legacy_byte": ("B", "u1"),
+    "mouse_x": ("f", "<f4"),
+    "mouse_y": ("f", "<f4"),
+    "time": ("i", "<i4")
+}
+
+@lru_cache(maxsize=None)
+def resolve_numpy() -> Optional[ModuleType]:
+    """
+    Import numpy on first use, as it is an optional dependency,
+    which also takes a considerable amount of time to import.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+class ReplayFrameArray:
+    """
+    ReplayFrameArray stores replay frames as a struct of arrays, one for each field of
+    `ReplayFrame`. It can be used in place of the frame list of a `ReplayFrameBundle`,
+    and is decoded & encoded in a single pass, instead of frame by frame.
+    The columns are numpy arrays if numpy is installed, and `array.array`s otherwise.
+    """
+
+    def __init__(self, frames: Iterable[ReplayFrame] = ()) -> None:
+        frames = list(frames)
+        self.button_state = self.create_column("button_state", [frame.button_state for frame in frames])
+        self.legacy_byte = self.create_column("legacy_byte", [frame.legacy_byte for frame in frames])
+        self.mouse_x = self.create_column("mouse_x", [frame.mouse_x for frame in frames])
+        self.mouse_y = self.create_column("mouse_y", [frame.mouse_y for frame in frames])
+        self.time = self.create_column("time", [frame.time for frame in frames])
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __iter__(self) -> Iterator[ReplayFrame]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> ReplayFrame:
+        if index < 0:
+            index += len(self)
+
+        return ReplayFrame(
+            ButtonState(int(self.button_state[index])),
+            int(self.legacy_byte[index]),
+            float(self.mouse_x[index]),
+            float(self.mouse_y[index]),
+            int(self.time[index])
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ReplayFrameArray, list)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"<ReplayFrameArray ({len(self)} frames)>"
+
+    @property
+    def frames(self) -> List[ReplayFrame]:
+        return list(self)
+
+    @staticmethod
+    def create_column(name: str, values: Iterable[Any]) -> Any:
+        typecode, dtype = ColumnTypes[name]
+        numpy = resolve_numpy()
+
+        if numpy is not None:
+            return numpy.array(values, dtype=dtype)
+
+        return array(typecode, values)
+
+    @classmethod
+    def from_columns(cls, **columns: Iterable[Any]) -> "ReplayFrameArray":
+        frames = cls.__new__(cls)
+
+        for name in ColumnTypes:
+            setattr(frames, name, cls.create_column(name, columns[name]))
+
+        return frames
+
+    @classmethod
+    def from_bytes(cls, data: bytes, legacy: bool = False) -> "ReplayFrameArray":
+        """
+        Decode replay frames from the `ReplayFrameButtons` layout, or from
+        the `ReplayFrameLegacy` layout with two mouse button booleans.
+        """
+        structure = ReplayFrameLegacy if legacy else ReplayFrameButtons
+
+        if len(data) % structure.size:
+            raise error(f"unpack requires a multiple of {structure.size} bytes")
+
+        numpy = resolve_numpy()
+
+        if numpy is not None:
+            return cls.from_numpy_bytes(numpy, data, legacy)
+
+        columns = list(zip(*structure.iter_unpack(data))) or [()] * 5
+        buttons, legacy_buttons, mouse_x, mouse_y, time = columns
+
+        if legacy:
+            # The booleans for the left & right mouse buttons
+            buttons = [left | right << 1 for left, right in zip(buttons, legacy_buttons)]
+        else:
+            # The legacy boolean is still read as the right mouse button
+            buttons = [button | right << 1 for button, right in zip(buttons, legacy_buttons)]
+
+        return cls.from_columns(
+            button_state=buttons,
+            legacy_byte=repeat(0, len(buttons)),
+            mouse_x=mouse_x,
+            mouse_y=mouse_y,
+            time=time
+        )
+
+    @classmethod
+    def from_numpy_bytes(cls, numpy: ModuleType, data: bytes, legacy: bool) -> "ReplayFrameArray":
+        records = numpy.frombuffer(data, dtype=cls.numpy_dtype(numpy))
+        buttons = records["button_state"]
+        right = (records["legacy_byte"] != 0).astype("u1") << 1
+
+        if legacy:
+            # The boolean for the left mouse button
+            buttons = (buttons != 0).astype("u1")
+
+        frames = cls.__new__(cls)
+        frames.button_state = buttons | right
+        frames.legacy_byte = numpy.zeros(len(records), dtype="u1")
+        frames.mouse_x = records["mouse_x"].copy()
+        frames.mouse_y = records["mouse_y"].copy()
+        frames.time = records["time"].copy()
+        return frames
+
+    def to_bytes(self, legacy: bool = False) -> bytes:
+        """
+        Encode the replay frames into the `ReplayFrameButtons` layout, or
+        into the `ReplayFrameLegacy` layout with two mouse button booleans.
+        """
+        numpy = resolve_numpy()
+
+        if numpy is not None and not isinstance(self.time, array):
+            return self.to_numpy_bytes(numpy, legacy)
+
+        if legacy:
+            return b"".join(map(
+                ReplayFrameLegacy.pack,
+                [bool(button & LeftButtons) for button in self.button_state],
+                [bool(button & RightButtons) for button in self.button_state],
+                self.mouse_x,
+                self.mouse_y,
+                self.time
+            ))
+
+        return b"".join(map(
+            ReplayFrameButtons.pack,
+            self.button_state,
+            repeat(False, len(self)),
+            self.mouse_x,
+            self.mouse_y,
+            self.time
+        ))
+
+    def to_numpy_bytes(self, numpy: ModuleType, legacy: bool) -> bytes:
+        records = numpy.zeros(len(self), dtype=self.numpy_dtype(numpy))
+        records["mouse_x"] = self.mouse_x
+        records["mouse_y"] = self.mouse_y
+        records["time"] = self.time
+
+        if legacy:
+            records["button_state"] = (self.button_state & LeftButtons) != 0
+            records["legacy_byte"] = (self.button_state & RightButtons) != 0
+        else:
+            records["button_state"] = self.button_state
+
+        return records.tobytes()
+
+    @staticmethod
+    def numpy_dtype(numpy: ModuleType) -> Any:
+        # Both layouts share the same size, only the meaning of the first two bytes differs
+        return numpy.dtype([
+            ("button_state", "u1"),
+            ("legacy_byte", "u1"),
+            ("mouse_x", "<f4"),
+            ("mouse_y", "<f4"),
+            ("time", "<i4")
+        ])
@@ -1,11 +1,9 @@
 
 from gzip import decompress, compress
 from abc import ABC, abstractmethod
-from struct import pack, unpack
-from typing import List
-
-import traceback
-import logging
+from struct import Struct
+from typing import Any, List, Optional, Tuple
+from .primitives import *
 
 class Stream(ABC):
     """
@@ -45,88 +43,143 @@ class AsyncStream(ABC):
 
 class MemoryStream(Stream):
     """
-    Stream implementation that uses an in-memory buffer.
+    Stream implementation that uses a growable in-memory buffer.
+
+    Writes are appended to the end of the buffer, while reads advance
+    the `position` cursor, which can be moved freely with `seek()`.
     """
 
     def __init__(self, data: bytes = b"", endian: str = "<") -> None:
-        self.data = data
+        self.buffer = bytearray(data)
         self.position = 0
         self.struct_endian = endian
+        self.snapshot: Optional[bytes] = None
 
-    def __del__(self):
-        self.clear()
+    def __len__(self) -> int:
+        return len(self.buffer)
 
     @property
     def endian(self) -> str:
         return self.struct_endian
 
+    @property
+    def data(self) -> bytes:
+        """
+        The whole buffer as bytes. The copy is kept until the
+        buffer changes, so repeated accesses don't copy it again.
+        """
+        if self.snapshot is None:
+            self.snapshot = bytes(self.buffer)
+
+        return self.snapshot
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self.buffer = bytearray(value)
+        self.snapshot = None
+
     def write(self, data: bytes) -> None:
-        self.data += data
+        self.buffer += data
+        self.snapshot = None
 
     def read(self, size: int = -1) -> bytes:
-        if size == -1:
-            size = len(self.data) - self.position
+        if size < 0:
+            size = len(self.buffer) - self.position
 
-        data = self.data[self.position:self.position + size]
+        data = bytes(self.buffer[self.position:self.position + size])
         self.position += size
         return data
-    
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """
+        Read a number of bytes from the stream, without copying them.
+        The buffer cannot be resized while the returned view is alive.
+        """
+        if size < 0:
+            size = len(self.buffer) - self.position
+
+        view = memoryview(self.buffer)[self.position:self.position + size]
+        self.position += size
+        return view
+
+    def seek(self, position: int) -> int:
+        self.position = max(0, min(position, len(self.buffer)))
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def getbuffer(self) -> memoryview:
+        """
+        Return a writable view over the whole buffer, without copying it.
+        Changes made through the view are not reflected by `data` if it was accessed before.
+        """
+        self.snapshot = None
+        return memoryview(self.buffer)
+
+    def getvalue(self) -> bytes:
+        """Return the whole buffer as bytes."""
+        return bytes(self.buffer)
+
     def clear(self) -> None:
-        self.data = b""
+        self.buffer = bytearray()
         self.position = 0
+        self.snapshot = None
 
     def available(self) -> int:
-        return len(self.data) - self.position
-
-logger = logging.getLogger('chio.py')
+        return len(self.buffer) - self.position
 
-def clamp(value: int, min_value: int, max_value: int) -> int:
-    clamped = max(min_value, min(value, max_value))
+def read_struct(stream: Stream, structure: Struct) -> Tuple[Any, ...]:
+    """Read a fixed-width run of values, described by a precompiled struct"""
+    if isinstance(stream, MemoryStream):
+        values = structure.unpack_from(stream.buffer, stream.position)
+        stream.position += structure.size
+        return values
 
-    if clamped != value:
-        stack = traceback.extract_stack()
-        caller = stack[-3]
-        logger.warning(
-            f"Value '{value}' was clamped to '{clamped}' "
-            f"({caller.filename}:{caller.lineno} in '{caller.name}')"
-        )
+    return structure.unpack(stream.read(structure.size))
 
-    return clamped
+def write_struct(stream: Stream, structure: Struct, *values) -> None:
+    """Write a fixed-width run of values, described by a precompiled struct"""
+    stream.write(pack(structure, *values))
 
 def read_s8(stream: Stream) -> int:
-    return stream.read(1)[0]
+    return read_struct(stream, U8)[0]
 
 def read_u8(stream: Stream) -> int:
-    return stream.read(1)[0]
+    return read_struct(stream, U8)[0]
 
 def read_u16(stream: Stream) -> int:
-    return unpack("<H", stream.read(2))[0]
+    return read_struct(stream, U16)[0]
 
 def read_s16(stream: Stream) -> int:
-    return unpack("<h", stream.read(2))[0]
+    return read_struct(stream, S16)[0]
 
 def read_u32(stream: Stream) -> int:
-    return unpack("<I", stream.read(4))[0]
+    return read_struct(stream, U32)[0]
 
 def read_s32(stream: Stream) -> int:
-    return unpack("<i", stream.read(4))[0]
+    return read_struct(stream, S32)[0]
 
 def read_u64(stream: Stream) -> int:
-    return unpack("<Q", stream.read(8))[0]
+    return read_struct(stream, U64)[0]
 
 def read_s64(stream: Stream) -> int:
-    return unpack("<q", stream.read(8))[0]
+    return read_struct(stream, S64)[0]
 
 def read_boolean(stream: Stream) -> bool:
     return bool(read_u8(stream))
 
 def read_f32(stream: Stream) -> float:
-    return unpack("<f", stream.read(4))[0]
+    return read_struct(stream, F32)[0]
 
 def read_f64(stream: Stream) -> float:
-    return unpack("<d", stream.read(8))[0]
+    return read_struct(stream, F64)[0]
 
 def read_gzip(stream: Stream, size: int = -1) -> bytes:
+    if isinstance(stream, MemoryStream):
+        with stream.read_view(size) as view:
+            return decompress(view)
+
     return decompress(stream.read(size))
 
 def read_uleb128(stream: Stream) -> int:
@@ -149,7 +202,12 @@ def read_string(stream: Stream) -> str:
         return ""
 
     size = read_uleb128(stream)
-    return stream.read(size).decode()
+
+    if isinstance(stream, MemoryStream):
+        with stream.read_view(size) as view:
+            return str(view, "utf-8")
+
+    return bytes(stream.read(size)).decode()
 
 def read_bool_list(stream: Stream, size: int = 8) -> List[bool]:
     byte = read_u8(stream)
@@ -162,37 +220,37 @@ def read_list_s16(stream: Stream) -> List[int]:
     return [read_s32(stream) for _ in range(read_u16(stream))]
 
 def write_s8(stream: Stream, value: int) -> None:
-    stream.write(pack("<b", clamp(value, -0x80, 0x7F)))
+    stream.write(pack(S8, value))
 
 def write_u8(stream: Stream, value: int) -> None:
-    stream.write(pack("<B", clamp(value, 0x00, 0xFF)))
+    stream.write(pack(U8, value))
 
 def write_s16(stream: Stream, value: int) -> None:
-    stream.write(pack("<h", clamp(value, -0x8000, 0x7FFF)))
+    stream.write(pack(S16, value))
 
 def write_u16(stream: Stream, value: int) -> None:
-    stream.write(pack("<H", clamp(value, 0x0000, 0xFFFF)))
+    stream.write(pack(U16, value))
 
 def write_s32(stream: Stream, value: int) -> None:
-    stream.write(pack("<i", clamp(value, -0x80000000, 0x7FFFFFFF)))
+    stream.write(pack(S32, value))
 
 def write_u32(stream: Stream, value: int) -> None:
-    stream.write(pack("<I", clamp(value, 0x00000000, 0xFFFFFFFF)))
+    stream.write(pack(U32, value))
 
 def write_s64(stream: Stream, value: int) -> None:
-    stream.write(pack("<q", clamp(value, -0x8000000000000000, 0x7FFFFFFFFFFFFFFF)))
+    stream.write(pack(S64, value))
 
 def write_u64(stream: Stream, value: int) -> None:
-    stream.write(pack("<Q", clamp(value, 0x0000000000000000, 0xFFFFFFFFFFFFFFFF)))
+    stream.write(pack(U64, value))
 
 def write_boolean(stream: Stream, value: bool) -> None:
     write_u8(stream, int(bool(value)))
 
 def write_f32(stream: Stream, value: float) -> None:
-    stream.write(pack("<f", value))
+    stream.write(pack(F32, value))
 
 def write_f64(stream: Stream, value: float) -> None:
-    stream.write(pack("<d", value))
+    stream.write(pack(F64, value))
 
 def write_gzip(stream: Stream, data: bytes) -> None:
     stream.write(compress(data))
@@ -210,7 +268,7 @@ def write_uleb128(stream: Stream, value: int) -> None:
         if value != 0:
             ret[-1] |= 0x80
 
-    stream.write(bytes(ret))
+    stream.write(ret)
 
 def write_string(stream: Stream, value: str) -> None:
     if not value:
@@ -0,0 +1,65 @@
+
+from typing import TYPE_CHECKING, Any, Type
+from .constants import PacketType
+from .io import MemoryStream
+
+if TYPE_CHECKING:
+    from .chio import BanchoIO
+
+# Placeholder for packets that were not decoded yet
+Undecoded = object()
+
+class LazyPacket:
+    """
+    LazyPacket holds the decompressed body of a client packet, which is only
+    decoded by the reader of its client once any of its fields are accessed.
+    This allows packets that are only routed, logged or dropped by the server
+    to skip decoding entirely, while the raw bytes stay available in `data`.
+
+    Fields of the decoded object can be accessed on the packet directly,
+    while packets that decode into e.g. a string or list are available
+    through `value`.
+    """
+    __slots__ = ("client", "packet", "data", "_value")
+
+    def __init__(self, client: Type["BanchoIO"], packet: PacketType, data: bytes) -> None:
+        self.client = client
+        self.packet = packet
+        self.data = memoryview(data)
+        self._value = Undecoded
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.value, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyPacket):
+            return self.value == other.value
+
+        return self.value == other
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.data)
+
+    def __repr__(self) -> str:
+        if not self.decoded:
+            return f"<LazyPacket {self.packet.name} ({len(self.data)} bytes)>"
+
+        return f"<LazyPacket {self.packet.name} {self.value!r}>"
+
+    __hash__ = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._value is not Undecoded
+
+    @property
+    def value(self) -> Any:
+        """The decoded packet, which is read on first access"""
+        if self._value is Undecoded:
+            packet_reader = self.client.packet_handler(self.packet)
+            self._value = packet_reader(MemoryStream(self.data))
+
+        return self._value
@@ -0,0 +1,622 @@
+
+"""
+Load simulator, that connects a mix of simulated clients of different versions to a
+local bancho server. Every client logs in, chats, plays, spectates and joins matches
+using the wire format of its version, while the round-trip latency & throughput of
+every packet is recorded.
+
+Usage:
+    python -m chio.loadgen --port 13381 --clients 1000 --mix "20160404+:40,20130101-20131231:30,-1787:30"
+"""
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from time import perf_counter, perf_counter_ns
+from collections import Counter, deque
+from hashlib import md5
+from random import Random
+
+import argparse
+import asyncio
+import json
+
+from .constants import ButtonState, Mode, Mods, PacketType, ReplayAction, SlotStatus, Status
+from .types import Match, MatchJoin, MatchSlot, Message, ReplayFrame, ReplayFrameBundle, ScoreFrame, UserStatus
+from .utils import client_versions, select_client
+from .chio import BanchoIO
+
+# Prefix of chat messages sent by simulated clients, followed by the time they were sent at
+MessagePrefix = "loadgen "
+
+# Server packets that answer a client packet, used to measure their round-trip latency
+ResponsePackets: Dict[PacketType, Tuple[PacketType, ...]] = {
+    PacketType.OsuStatusUpdateRequest: (PacketType.BanchoUserStats,),
+    PacketType.OsuChannelJoin: (PacketType.BanchoChannelJoinSuccess, PacketType.BanchoChannelRevoked),
+    PacketType.OsuMatchCreate: (PacketType.BanchoMatchJoinSuccess, PacketType.BanchoMatchJoinFail)
+}
+
+# Actions of simulated clients along with their default weights
+DefaultActions: Dict[str, float] = {
+    "chat": 4,
+    "status": 2,
+    "play": 2,
+    "spectate": 1,
+    "multiplayer": 1
+}
+
+def parse_mix(mix: str) -> List[Tuple[int, int, float]]:
+    """
+    Parse a client mix like "20160404+:40,20130101-20131231:30,-1787:30" into a list of
+    inclusive version ranges & their weights. Ranges can either be a single version,
+    "start-end", "start+" for every later version or "-end" for every earlier version.
+    """
+    ranges = []
+
+    for entry in mix.split(","):
+        versions, _, weight = entry.strip().rpartition(":")
+
+        if not versions:
+            versions, weight = weight, "1"
+
+        if versions.endswith("+"):
+            start, end = int(versions[:-1]), client_versions()[-1]
+        elif versions.startswith("-"):
+            start, end = client_versions()[0], int(versions[1:])
+        elif "-" in versions:
+            start, end = map(int, versions.split("-", 1))
+        else:
+            start = end = int(versions)
+
+        ranges.append((start, end, float(weight)))
+
+    return ranges
+
+def select_versions(mix: Iterable[Tuple[int, int, float]], count: int, seed: Optional[int] = None) -> List[int]:
+    """
+    Pick the versions of `count` clients from a mix. Every range receives its share of the
+    clients, and each client gets one of the known client versions inside of its range.
+    """
+    mix = list(mix)
+    random = Random(seed)
+    total_weight = sum(weight for *_, weight in mix)
+    shares = [count * weight / total_weight for *_, weight in mix]
+    counts = [int(share) for share in shares]
+
+    # Hand out the remaining clients to the largest remainders
+    remainders = sorted(range(len(mix)), key=lambda index: counts[index] - shares[index])
+
+    for index in remainders[:count - sum(counts)]:
+        counts[index] += 1
+
+    versions = []
+
+    for (start, end, _), amount in zip(mix, counts):
+        candidates = [version for version in client_versions() if start <= version <= end]
+
+        if not candidates:
+            # Versions in between two clients are still valid
+            candidates = [start]
+
+        versions.extend(random.choice(candidates) for _ in range(amount))
+
+    random.shuffle(versions)
+    return versions
+
+@dataclass
+class PacketStats:
+    sent: int = 0
+    received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency_count: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_samples: List[float] = field(default_factory=list)
+
+    @property
+    def latency_mean(self) -> float:
+        return self.latency_total / self.latency_count if self.latency_count else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        if not self.latency_samples:
+            return 0.0
+
+        samples = sorted(self.latency_samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+class LoadReport:
+    """
+    LoadReport collects the packet counts, sizes & latencies of a simulation. Latencies
+    are kept as a uniform sample of at most `max_samples` values per packet, to
+    calculate their percentiles.
+    """
+
+    def __init__(self, max_samples: int = 10000, seed: Optional[int] = None) -> None:
+        self.max_samples = max_samples
+        self.random = Random(seed)
+        self.packets: Dict[PacketType, PacketStats] = {}
+        self.versions: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.logins = 0
+        self.login_failures = 0
+        self.started = perf_counter()
+        self.finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or perf_counter()) - self.started
+
+    def stats(self, packet: PacketType) -> PacketStats:
+        if packet not in self.packets:
+            self.packets[packet] = PacketStats()
+
+        return self.packets[packet]
+
+    def record_sent(self, packet: PacketType, size: int) -> None:
+        stats = self.stats(packet)
+        stats.sent += 1
+        stats.bytes_sent += size
+
+    def record_received(self, packet: PacketType, size: int) -> None:
+        stats = self.stats(packet)
+        stats.received += 1
+        stats.bytes_received += size
+
+    def record_latency(self, packet: PacketType, latency: float) -> None:
+        stats = self.stats(packet)
+        stats.latency_count += 1
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
+
+        if len(stats.latency_samples) < self.max_samples:
+            stats.latency_samples.append(latency)
+            return
+
+        # Reservoir sampling, so that every latency has the same chance to be kept
+        index = self.random.randrange(stats.latency_count)
+
+        if index < self.max_samples:
+            stats.latency_samples[index] = latency
+
+    def record_error(self, error: BaseException) -> None:
+        self.errors[type(error).__name__] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed or 1.0
+        return {
+            "elapsed": self.elapsed,
+            "logins": self.logins,
+            "login_failures": self.login_failures,
+            "versions": {str(version): count for version, count in sorted(self.versions.items())},
+            "errors": dict(self.errors),
+            "packets": {
+                packet.name: {
+                    "sent": stats.sent,
+                    "received": stats.received,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "packets_per_second": (stats.sent + stats.received) / elapsed,
+                    "latency_count": stats.latency_count,
+                    "latency_mean": stats.latency_mean,
+                    "latency_p50": stats.latency_percentile(50),
+                    "latency_p99": stats.latency_percentile(99),
+                    "latency_max": stats.latency_max
+                }
+                for packet, stats in sorted(self.packets.items(), key=lambda item: item[0].name)
+            }
+        }
+
+    def format(self) -> str:
+        elapsed = self.elapsed or 1.0
+        lines = [
+            f"{self.logins} logins, {self.login_failures} failed, {sum(self.errors.values())} errors in {self.elapsed:.1f}s",
+            f"{'packet':<32}{'sent':>10}{'received':>10}{'pkt/s':>10}{'KiB/s':>10}{'mean':>10}{'p50':>10}{'p99':>10}{'max':>10}"
+        ]
+
+        for packet, stats in sorted(self.packets.items(), key=lambda item: item[0].name):
+            throughput = (stats.bytes_sent + stats.bytes_received) / elapsed / 1024
+            latencies = "".join(
+                f"{value * 1000:>8.2f}ms" if stats.latency_count else f"{'-':>10}"
+                for value in (
+                    stats.latency_mean,
+                    stats.latency_percentile(50),
+                    stats.latency_percentile(99),
+                    stats.latency_max
+                )
+            )
+            lines.append(
+                f"{packet.name:<32}{stats.sent:>10}{stats.received:>10}"
+                f"{(stats.sent + stats.received) / elapsed:>10.1f}{throughput:>10.1f}{latencies}"
+            )
+
+        for name, count in self.errors.most_common():
+            lines.append(f"error: {name} ({count}x)")
+
+        return "\n".join(lines)
+
+@dataclass
+class LoadConfig:
+    host: str = "127.0.0.1"
+    port: int = 13381
+    clients: int = 100
+    mix: List[Tuple[int, int, float]] = field(default_factory=lambda: [(client_versions()[0], client_versions()[-1], 1.0)])
+    duration: float = 60.0
+    ramp_up: float = 10.0
+    interval: float = 1.0
+    frames: int = 16
+    username: str = "loadgen{index}"
+    password: str = "loadgen"
+    actions: Dict[str, float] = field(default_factory=lambda: dict(DefaultActions))
+    login_timeout: float = 30.0
+    seed: Optional[int] = None
+
+class SimulatedClient:
+    """
+    SimulatedClient is a single connection to the server, that behaves like the
+    given client version, by using the client-side codec of its client class.
+    """
+
+    def __init__(self, generator: "LoadGenerator", index: int, version: int) -> None:
+        self.generator = generator
+        self.config = generator.config
+        self.report = generator.report
+        self.index = index
+        self.version = version
+        self.io: BanchoIO = select_client(version)
+        self.username = self.config.username.format(index=index)
+        self.random = Random(None if self.config.seed is None else self.config.seed + index)
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.receiver: Optional[asyncio.Future] = None
+        self.user_id: Optional[int] = None
+        self.logged_in = asyncio.Event()
+        self.match_joined = asyncio.Event()
+        self.pending: Dict[Tuple[PacketType, Any], Deque[List[Any]]] = {}
+
+    def login_request(self) -> bytes:
+        """
+        Returns the initial login request. Override this for servers that expect a different format.
+        """
+        password = md5(self.config.password.encode()).hexdigest()
+        client_hash = md5(self.username.encode()).hexdigest()
+        return f"{self.username}\n{password}\nb{self.version}|0|0|{client_hash}:|0\n".encode()
+
+    @property
+    def active(self) -> bool:
+        """Whether the simulation is still running, and the server didn't close the connection"""
+        return self.generator.running and self.receiver is not None and not self.receiver.done()
+
+    def milliseconds(self) -> int:
+        """Returns the time since the simulation started, as it's sent inside of replay & score frames"""
+        return int((perf_counter() - self.report.started) * 1000)
+
+    async def send(self, packet: PacketType, *args) -> bool:
+        """
+        Sends a client packet, if the client version implements it.
+        """
+        if not self.io.implements_client_packet(packet):
+            return False
+
+        packet_data = self.io.write_client_packet_to_bytes(packet, *args)
+        self.report.record_sent(packet, len(packet_data))
+        self.writer.write(packet_data)
+        await self.writer.drain()
+        return True
+
+    async def request(self, packet: PacketType, *args, key: Any = None) -> bool:
+        """
+        Sends a client packet and waits for one of its `ResponsePackets`
+        in the background, to record its round-trip latency.
+        """
+        entry = [packet, perf_counter(), False]
+
+        for response in ResponsePackets[packet]:
+            self.pending.setdefault((response, key), deque()).append(entry)
+
+        return await self.send(packet, *args)
+
+    def resolve(self, response: PacketType, key: Any = None) -> None:
+        pending = self.pending.get((response, key))
+
+        while pending:
+            entry = pending.popleft()
+
+            if entry[2]:
+                # Already answered by another response
+                continue
+
+            entry[2] = True
+            self.report.record_latency(entry[0], perf_counter() - entry[1])
+            break
+
+    async def run(self) -> None:
+        try:
+            self.reader, self.writer = await asyncio.open_connection(self.config.host, self.config.port)
+            self.pending.setdefault((PacketType.BanchoLoginReply, None), deque()).append(
+                [PacketType.BanchoLoginReply, perf_counter(), False]
+            )
+            self.writer.write(self.login_request())
+            self.receiver = asyncio.ensure_future(self.receive())
+            self.receiver.add_done_callback(self.receiver_done)
+
+            try:
+                await asyncio.wait_for(self.logged_in.wait(), self.config.login_timeout)
+
+                if self.user_id is not None:
+                    await self.simulate()
+
+                    if not self.receiver.done():
+                        await self.send(PacketType.OsuExit, False)
+            finally:
+                self.receiver.cancel()
+                self.generator.online.discard(self.user_id)
+                self.writer.close()
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as error:
+            self.report.record_error(error)
+
+    def receiver_done(self, receiver: asyncio.Future) -> None:
+        if receiver.cancelled():
+            return
+
+        if receiver.exception() is not None:
+            # The connection was closed, or a packet couldn't be handled
+            self.report.record_error(receiver.exception())
+
+        # Stop waiting for a login reply, that won't arrive anymore
+        self.logged_in.set()
+
+    async def receive(self) -> None:
+        while True:
+            header = await self.reader.readexactly(self.io.header_size)
+            packet_id, compression, packet_length = self.io.read_packet_header(header)
+            packet_data = await self.reader.readexactly(packet_length)
+
+            try:
+                packet, value = self.io.decode_server_packet(packet_id, compression, packet_data)
+            except Exception as error:
+                # Unknown or malformed packets are skipped
+                self.report.record_error(error)
+                continue
+
+            self.report.record_received(packet, self.io.header_size + packet_length)
+            await self.packet_received(packet, value)
+
+    async def packet_received(self, packet: PacketType, value: Any) -> None:
+        if packet == PacketType.BanchoLoginReply:
+            self.resolve(packet)
+
+            if value > 0:
+                self.user_id = value
+                self.report.logins += 1
+                self.generator.online.add(value)
+            else:
+                self.report.login_failures += 1
+
+            self.logged_in.set()
+
+        elif packet == PacketType.BanchoPing:
+            await self.send(PacketType.OsuPong)
+
+        elif packet == PacketType.BanchoUserStats:
+            self.resolve(packet, value.id)
+
+        elif packet in (PacketType.BanchoChannelJoinSuccess, PacketType.BanchoChannelRevoked):
+            self.resolve(packet, value)
+
+        elif packet in (PacketType.BanchoMatchJoinSuccess, PacketType.BanchoMatchJoinFail):
+            self.resolve(packet)
+            self.match_joined.set()
+
+        elif packet == PacketType.BanchoMessage and value.content.startswith(MessagePrefix):
+            # Chat messages of other simulated clients contain the time they were sent at
+            sent_at = int(value.content[len(MessagePrefix):])
+            self.report.record_latency(PacketType.OsuMessage, (perf_counter_ns() - sent_at) / 1e9)
+
+        elif packet == PacketType.BanchoSpectateFrames and value.frames:
+            self.record_frame_latency(PacketType.OsuSpectateFrames, value.frames[-1].time)
+
+        elif packet == PacketType.BanchoMatchScoreUpdate:
+            self.record_frame_latency(PacketType.OsuMatchScoreUpdate, value.time)
+
+    def record_frame_latency(self, packet: PacketType, time: int) -> None:
+        if time <= 0:
+            # Older clients don't send the time of score frames
+            return
+
+        self.report.record_latency(packet, (self.milliseconds() - time) / 1000)
+
+    async def wait(self, intervals: float = 1.0) -> None:
+        await asyncio.sleep(self.random.expovariate(1 / (self.config.interval * intervals)))
+
+    async def simulate(self) -> None:
+        await self.send(PacketType.OsuUserStatus, UserStatus(Status.Idle))
+        await self.request(PacketType.OsuChannelJoin, "#osu", key="#osu")
+        await self.request(PacketType.OsuStatusUpdateRequest, key=self.user_id)
+
+        actions = list(self.config.actions)
+        weights = [self.config.actions[action] for action in actions]
+
+        while self.active:
+            await self.wait()
+            action = self.random.choices(actions, weights)[0]
+            await getattr(self, f"simulate_{action}")()
+
+    async def simulate_chat(self) -> None:
+        await self.send(PacketType.OsuMessage, Message(self.username, f"{MessagePrefix}{perf_counter_ns()}", "#osu"))
+
+    async def simulate_status(self) -> None:
+        await self.send(PacketType.OsuUserStatus, UserStatus(Status.Idle, mode=self.random.choice(list(Mode))))
+        await self.request(PacketType.OsuStatusUpdateRequest, key=self.user_id)
+
+    async def simulate_play(self) -> None:
+        status = UserStatus(Status.Playing, "Artist - Title [Insane]", Mods.Hidden, beatmap_checksum="0" * 32, beatmap_id=75)
+        await self.send(PacketType.OsuUserStatus, status)
+
+        for sequence in range(self.random.randint(3, 10)):
+            if not self.active:
+                break
+
+            await self.send(PacketType.OsuSpectateFrames, self.create_bundle(sequence))
+            await self.wait(0.5)
+
+        await self.send(PacketType.OsuUserStatus, UserStatus(Status.Idle))
+
+    async def simulate_spectate(self) -> None:
+        targets = list(self.generator.online - {self.user_id})
+
+        if not targets:
+            return
+
+        await self.send(PacketType.OsuStartSpectating, self.random.choice(targets))
+        await self.wait(5)
+        await self.send(PacketType.OsuStopSpectating)
+
+    async def simulate_multiplayer(self) -> None:
+        if not self.io.implements_client_packet(PacketType.OsuMatchCreate):
+            return
+
+        await self.send(PacketType.OsuLobbyJoin)
+        self.match_joined.clear()
+        await self.request(PacketType.OsuMatchCreate, self.create_match())
+
+        try:
+            await asyncio.wait_for(self.match_joined.wait(), self.config.interval * 10)
+        except asyncio.TimeoutError:
+            pass
+
+        for _ in range(self.random.randint(3, 10)):
+            if not self.active:
+                break
+
+            await self.send(PacketType.OsuMatchScoreUpdate, self.create_score_frame())
+            await self.wait(0.5)
+
+        await self.send(PacketType.OsuMatchPart)
+        await self.send(PacketType.OsuLobbyPart)
+
+    def create_bundle(self, sequence: int) -> ReplayFrameBundle:
+        time = self.milliseconds()
+        frames = [
+            ReplayFrame(
+                ButtonState.Left1 if index % 2 else ButtonState.NoButton, 0,
+                self.random.uniform(0, 512), self.random.uniform(0, 384),
+                time - (self.config.frames - index - 1) * 16
+            )
+            for index in range(self.config.frames)
+        ]
+        return ReplayFrameBundle(ReplayAction.Standard, frames, self.create_score_frame(), extra=0, sequence=sequence)
+
+    def create_score_frame(self) -> ScoreFrame:
+        return ScoreFrame(
+            self.milliseconds(), 0, self.random.randint(0, 1000), 10, 1, 20, 5, 2,
+            self.random.randint(0, 10**7), 300, 120, False, 200, 0
+        )
+
+    def create_match(self) -> Match:
+        slots = [MatchSlot() for _ in range(self.io.slot_size)]
+        slots[0] = MatchSlot(self.user_id, SlotStatus.NotReady)
+        return Match(
+            name=f"{self.username}'s game",
+            beatmap_text="Artist - Title [Insane]",
+            beatmap_id=75,
+            beatmap_checksum="0" * 32,
+            slots=slots,
+            host_id=self.user_id
+        )
+
+class LoadGenerator:
+    """
+    LoadGenerator spawns the simulated clients of a mix of versions over the ramp-up time,
+    lets them run for the configured duration, and collects their results into a `LoadReport`.
+    """
+
+    client_class = SimulatedClient
+
+    def __init__(self, config: LoadConfig) -> None:
+        self.config = config
+        self.report = LoadReport(seed=config.seed)
+        self.online: set = set()
+        self.running = False
+
+    async def run(self) -> LoadReport:
+        versions = select_versions(self.config.mix, self.config.clients, self.config.seed)
+        self.report.versions.update(versions)
+        self.report.started = perf_counter()
+        self.running = True
+
+        clients = [self.client_class(self, index, version) for index, version in enumerate(versions)]
+        delay = self.config.ramp_up / max(len(clients), 1)
+        tasks = []
+
+        for client in clients:
+            tasks.append(asyncio.ensure_future(client.run()))
+            await asyncio.sleep(delay)
+
+        await asyncio.sleep(max(0.0, self.config.duration - (perf_counter() - self.report.started)))
+        self.running = False
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.report.finished = perf_counter()
+        return self.report
+
+def parse_actions(actions: str) -> Dict[str, float]:
+    result = {}
+
+    for entry in actions.split(","):
+        name, _, weight = entry.strip().partition(":")
+
+        if name not in DefaultActions:
+            raise ValueError(f"Unknown action '{name}'")
+
+        result[name] = float(weight or 1)
+
+    return result
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m chio.loadgen", description="Simulate a mix of bancho clients against a local server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=13381)
+    parser.add_argument("--clients", type=int, default=100, help="Number of simulated clients")
+    parser.add_argument("--mix", default=f"{client_versions()[0]}+:1", help="Client versions & weights, e.g. \"20160404+:40,-1787:60\"")
+    parser.add_argument("--duration", type=float, default=60.0, help="Duration of the simulation in seconds")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Time in seconds over which the clients connect")
+    parser.add_argument("--interval", type=float, default=1.0, help="Mean time in seconds between the actions of a client")
+    parser.add_argument("--frames", type=int, default=16, help="Number of replay frames per spectate packet")
+    parser.add_argument("--username", default="loadgen{index}", help="Username format of the clients")
+    parser.add_argument("--password", default="loadgen")
+    parser.add_argument("--actions", default=",".join(f"{name}:{weight:g}" for name, weight in DefaultActions.items()))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", default=None, help="Write the report as json to this file")
+    parser.add_argument("--uvloop", action="store_true", help="Use uvloop as the event loop, if it is installed")
+    args = parser.parse_args(arguments)
+
+    config = LoadConfig(
+        host=args.host,
+        port=args.port,
+        clients=args.clients,
+        mix=parse_mix(args.mix),
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        interval=args.interval,
+        frames=args.frames,
+        username=args.username,
+        password=args.password,
+        actions=parse_actions(args.actions),
+        seed=args.seed
+    )
+
+    if args.uvloop:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            print("uvloop is not installed, using the default event loop")
+
+    report = asyncio.run(LoadGenerator(config).run())
+    print(report.format())
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report.to_dict(), file, indent=4)
+
+if __name__ == "__main__":
+    main()
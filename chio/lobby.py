@@ -0,0 +1,136 @@
+
+from typing import Dict, Hashable, Iterable, Iterator, Tuple, Type, Union
+from .analysis import EquivalenceTable, refresh_equivalence_table, resolve_client_class
+from .constants import PacketType
+from .io import Stream, AsyncStream
+from .types import Match
+from .chio import BanchoIO
+
+# Packets that are encoded from a single match
+MatchPackets = frozenset((
+    PacketType.BanchoMatchNew,
+    PacketType.BanchoMatchUpdate,
+    PacketType.BanchoMatchJoinSuccess,
+    PacketType.BanchoMatchStart
+))
+
+class LobbySnapshot:
+    """
+    LobbySnapshot keeps track of every open match, and caches their encoded
+    bytes for every group of clients that encode the match packets the same way.
+    The cached bytes of a match are reused until any of its fields or slots have
+    changed, e.g. for every lobby join and for `BanchoMatchUpdate` broadcasts.
+
+    The slot size & protocol version of a client are part of its equivalence
+    class, so clients that e.g. differ in freemod or 16-slot support never
+    share the same bytes.
+    """
+
+    def __init__(self) -> None:
+        self.matches: Dict[int, Match] = {}
+        self.encoded: Dict[int, Dict[Tuple[PacketType, int], Tuple[Hashable, bytes]]] = {}
+        self.tables: Dict[PacketType, EquivalenceTable] = {}
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def __contains__(self, match_id: int) -> bool:
+        return match_id in self.matches
+
+    def __iter__(self) -> Iterator[Match]:
+        return iter(self.matches.values())
+
+    def add(self, match: Match) -> None:
+        """Add a match to the lobby, or replace the one with the same id"""
+        self.matches[match.id] = match
+        self.encoded[match.id] = {}
+
+    def remove(self, match_id: int) -> None:
+        """Remove a match from the lobby, if it exists"""
+        self.matches.pop(match_id, None)
+        self.encoded.pop(match_id, None)
+
+    def clear(self) -> None:
+        self.matches.clear()
+        self.encoded.clear()
+
+    def encode_match(
+        self,
+        client: Union[BanchoIO, Type[BanchoIO]],
+        match: Union[Match, int],
+        packet: PacketType = PacketType.BanchoMatchNew
+    ) -> bytes:
+        """Return the encoded packet of a single match for the given client"""
+        if packet not in MatchPackets:
+            raise ValueError(f"Packet '{packet.name}' is not a match packet")
+
+        if isinstance(match, int):
+            match = self.matches[match]
+
+        client_class = resolve_client_class(client)
+        class_id = self.resolve_table(packet).class_id(client_class)
+        if self.matches.get(match.id) is match:
+            encoded = self.encoded[match.id]
+        else:
+            # Matches outside of the lobby are encoded without being cached
+            encoded = {}
+
+        revision = match.revision
+        cached = encoded.get((packet, class_id))
+
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        packet_data = client_class.encode_packet(packet, match)
+        encoded[(packet, class_id)] = (revision, packet_data)
+        return packet_data
+
+    def encode(self, client: Union[BanchoIO, Type[BanchoIO]]) -> bytes:
+        """Return the encoded `BanchoMatchNew` packets of every match, which are sent on lobby join"""
+        return b"".join(
+            self.encode_match(client, match)
+            for match in self.matches.values()
+        )
+
+    def encode_for_clients(
+        self,
+        clients: Iterable[BanchoIO],
+        match: Union[Match, int],
+        packet: PacketType = PacketType.BanchoMatchUpdate
+    ) -> Dict[Type[BanchoIO], bytes]:
+        """Encode a match packet for multiple clients, and return the encoded bytes for each client class"""
+        result: Dict[Type[BanchoIO], bytes] = {}
+
+        for client in clients:
+            client_class = resolve_client_class(client)
+
+            if client_class not in result:
+                result[client_class] = self.encode_match(client_class, match, packet)
+
+        return result
+
+    def write(self, client: Union[BanchoIO, Type[BanchoIO]], stream: Stream) -> None:
+        """Write every match of the lobby to the stream, at once"""
+        data = self.encode(client)
+
+        if data:
+            stream.write(data)
+
+    async def write_async(self, client: Union[BanchoIO, Type[BanchoIO]], stream: AsyncStream) -> None:
+        """Write every match of the lobby to the stream at once, asynchronously"""
+        data = self.encode(client)
+
+        if data:
+            await stream.write(data)
+
+    def resolve_table(self, packet: PacketType) -> EquivalenceTable:
+        table, changed = refresh_equivalence_table(packet, self.tables.get(packet))
+
+        if changed:
+            self.tables[packet] = table
+
+            for encoded in self.encoded.values():
+                for key in [key for key in encoded if key[0] == packet]:
+                    del encoded[key]
+
+        return table
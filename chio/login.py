@@ -0,0 +1,136 @@
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Type, Union
+from .analysis import resolve_client_class
+from .constants import LoginError, PacketType
+from .io import Stream, AsyncStream
+from .types import Channel, UserInfo
+from .chio import BanchoIO, BanchoIOMeta
+
+class LoginBundle:
+    """
+    LoginBundle composes the complete login response of a client into a single buffer.
+    The parts that are the same for every login, i.e. the protocol negotiation and the
+    channel listing, are cached as a template for each client class, until any of the
+    channels or clients have changed. Version differences, like the missing protocol
+    negotiation of older clients, are handled by the writers of each client.
+    """
+
+    def __init__(self, channels: Iterable[Channel] = (), autojoin: Optional[Iterable[str]] = None) -> None:
+        self.channels: List[Channel] = list(channels)
+        self.autojoin: Optional[Tuple[str, ...]] = tuple(autojoin) if autojoin is not None else None
+        self.templates: Dict[Type[BanchoIO], Tuple[Hashable, bytes, bytes, bool]] = {}
+
+    @property
+    def revision(self) -> Hashable:
+        return (
+            BanchoIOMeta.revision,
+            self.autojoin,
+            tuple((id(channel), channel.revision) for channel in self.channels)
+        )
+
+    def add_channel(self, channel: Channel) -> None:
+        self.channels.append(channel)
+
+    def remove_channel(self, name: str) -> None:
+        self.channels = [channel for channel in self.channels if channel.name != name]
+
+    def is_autojoin(self, client: Type[BanchoIO], channel: Channel) -> bool:
+        autojoin = self.autojoin if self.autojoin is not None else client.autojoin_channels
+        return channel.name in autojoin
+
+    def template(self, client: Union[BanchoIO, Type[BanchoIO]]) -> Tuple[bytes, bytes, bool]:
+        """
+        Return the cached protocol negotiation & channel listing of a client,
+        and whether its presence packets already contain the user stats.
+        """
+        client_class = resolve_client_class(client)
+        revision = self.revision
+        cached = self.templates.get(client_class)
+
+        if cached is not None and cached[0] == revision:
+            return cached[1], cached[2], cached[3]
+
+        negotiation = client_class.write_packet_to_bytes(PacketType.BanchoProtocolNegotiation)
+        channels = b"".join(
+            client_class.write_packet_to_bytes(
+                PacketType.BanchoChannelAvailableAutojoin
+                if self.is_autojoin(client_class, channel) else
+                PacketType.BanchoChannelAvailable,
+                channel
+            )
+            for channel in self.channels
+        )
+        channels += client_class.write_packet_to_bytes(PacketType.BanchoChannelInfoComplete)
+
+        # Older clients receive their presence as user stats, e.g. b282 & b338
+        presence_writer = client_class.packet_handler(PacketType.BanchoUserPresence)
+        presence_stats = presence_writer is not None and any(
+            packet == PacketType.BanchoUserStats
+            for packet, _ in presence_writer(UserInfo())
+        )
+
+        self.templates[client_class] = (revision, negotiation, channels, presence_stats)
+        return negotiation, channels, presence_stats
+
+    def encode(
+        self,
+        client: Union[BanchoIO, Type[BanchoIO]],
+        info: UserInfo,
+        friends: Iterable[int] = (),
+        silence_seconds: Optional[int] = None
+    ) -> bytes:
+        """
+        Encode the login response of a successful login, for the given user.
+        Packets that the client does not implement are left out.
+        """
+        client_class = resolve_client_class(client)
+        negotiation, channels, presence_stats = self.template(client_class)
+
+        parts = [
+            negotiation,
+            client_class.write_packet_to_bytes(PacketType.BanchoLoginReply, info.id),
+            client_class.write_packet_to_bytes(PacketType.BanchoLoginPermissions, info.presence.permissions),
+            client_class.write_packet_to_bytes(PacketType.BanchoUserPresence, info)
+        ]
+
+        if not presence_stats:
+            parts.append(client_class.write_packet_to_bytes(PacketType.BanchoUserStats, info))
+
+        parts.append(client_class.write_packet_to_bytes(PacketType.BanchoFriendsList, friends))
+        parts.append(channels)
+
+        if silence_seconds is not None:
+            parts.append(client_class.write_packet_to_bytes(PacketType.BanchoSilenceInfo, silence_seconds))
+
+        # Joining the parts allocates the response once, at its final size
+        return b"".join(parts)
+
+    def encode_error(self, client: Union[BanchoIO, Type[BanchoIO]], error: LoginError) -> bytes:
+        """
+        Encode the login response of a failed login. Clients from b20130801 onwards
+        receive an announcement for inactive accounts, since they would show a ban.
+        """
+        client_class = resolve_client_class(client)
+        return client_class.write_packet_to_bytes(PacketType.BanchoLoginReply, error)
+
+    def write(
+        self,
+        client: Union[BanchoIO, Type[BanchoIO]],
+        stream: Stream,
+        info: UserInfo,
+        friends: Iterable[int] = (),
+        silence_seconds: Optional[int] = None
+    ) -> None:
+        """Write the login response of a successful login to the stream, at once"""
+        stream.write(self.encode(client, info, friends, silence_seconds))
+
+    async def write_async(
+        self,
+        client: Union[BanchoIO, Type[BanchoIO]],
+        stream: AsyncStream,
+        info: UserInfo,
+        friends: Iterable[int] = (),
+        silence_seconds: Optional[int] = None
+    ) -> None:
+        """Write the login response of a successful login to the stream at once, asynchronously"""
+        await stream.write(self.encode(client, info, friends, silence_seconds))
@@ -28,17 +28,38 @@ def patch(packet: PacketType, version: int) -> Callable:
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        client = ClientDict[version]
-        setattr(client, packet.handler_name, wrapper)
+        # Handlers are classmethods, so they need to be replaced on the
+        # client class itself, which also rebuilds its packet tables
+        client = resolve_patched_client(version)
+        setattr(client, packet.handler_name, classmethod(wrapper))
         return wrapper
     return decorator
 
+def resolve_patched_client(version: int) -> type:
+    """
+    Return the client class that patches for the given version are applied to.
+    Every patched version gets its own subclass of its client, so that other
+    versions using or inheriting from the same client class are left untouched.
+    """
+    client = type(ClientDict[version])
+
+    if client.__dict__.get("patched_version") == version:
+        return client
+
+    patched_client = type(client)(
+        client.__name__,
+        (client,),
+        {"__module__": client.__module__, "__qualname__": client.__qualname__, "patched_version": version}
+    )
+    ClientDict[version] = patched_client()
+    return patched_client
+
 def set_protocol_version(protocol_version: int, version: int) -> None:
     """Override the protocol version for a specific client version."""
-    client = ClientDict[version]
+    client = resolve_patched_client(version)
     client.protocol_version = protocol_version
 
 def set_slot_size(slot_size: int, version: int) -> None:
     """Override the slot size for a specific client version."""
-    client = ClientDict[version]
+    client = resolve_patched_client(version)
     client.slot_size = slot_size
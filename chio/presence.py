@@ -0,0 +1,270 @@
+
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+from .analysis import EquivalenceTable, refresh_equivalence_table, resolve_client_class
+from .constants import PacketType
+from .io import Stream, AsyncStream
+from .types import UserInfo
+from .chio import BanchoIO
+
+# Packets that are encoded from a single user info, or a list of them
+SnapshotPackets = frozenset((
+    PacketType.BanchoUserPresenceBundle,
+    PacketType.BanchoUserPresence,
+    PacketType.BanchoUserStats
+))
+
+class PresenceSegments:
+    """
+    PresenceSegments holds the encoded presences of every user for a single
+    equivalence class, concatenated into one buffer. Each user owns a segment
+    of the buffer, which is overwritten in place if its size did not change.
+    Otherwise the old segment becomes a tombstone, which is skipped when the
+    buffer is sent out, until it gets removed by the next compaction.
+    """
+
+    def __init__(self, client: Type[BanchoIO], packet: PacketType) -> None:
+        self.client = client
+        self.packet = packet
+        self.buffer = bytearray()
+        self.entries: Dict[int, Tuple[int, int]] = {}
+        self.tombstones: List[Tuple[int, int]] = []
+        self.garbage: int = 0
+        self.data: Optional[bytes] = b""
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def encode_user(self, info: UserInfo) -> bytes:
+        if self.packet == PacketType.BanchoUserPresenceBundle:
+            return self.client.encode_packet(self.packet, [info])
+
+        # Reuse the bytes cached on the info itself, if its cache is enabled
+        packet_data = self.client.cached_packet(self.packet, (info,))
+
+        if packet_data is None:
+            packet_data = self.client.encode_packet(self.packet, info)
+
+        return packet_data
+
+    def add(self, info: UserInfo) -> None:
+        segment = self.encode_user(info)
+        entry = self.entries.pop(info.id, None)
+        self.data = None
+
+        if entry is not None:
+            offset, length = entry
+
+            if length == len(segment):
+                self.buffer[offset:offset + length] = segment
+                self.entries[info.id] = entry
+                return
+
+            # Leave a tombstone, and append the new segment at the end
+            self.tombstones.append(entry)
+            self.garbage += length
+
+        self.entries[info.id] = (len(self.buffer), len(segment))
+        self.buffer += segment
+
+        if self.garbage > len(self.buffer) // 2:
+            self.compact()
+
+    def remove(self, user_id: int) -> None:
+        entry = self.entries.pop(user_id, None)
+
+        if entry is None:
+            return
+
+        self.tombstones.append(entry)
+        self.garbage += entry[1]
+        self.data = None
+
+        if self.garbage > len(self.buffer) // 2:
+            self.compact()
+
+    def compact(self) -> None:
+        """Remove every tombstone from the buffer"""
+        buffer = bytearray()
+        entries = {}
+
+        for user_id, (offset, length) in self.entries.items():
+            entries[user_id] = (len(buffer), length)
+            buffer += self.buffer[offset:offset + length]
+
+        self.buffer = buffer
+        self.entries = entries
+        self.tombstones.clear()
+        self.garbage = 0
+
+    def encode(self) -> bytes:
+        if self.data is not None:
+            return self.data
+
+        if not self.tombstones:
+            self.data = bytes(self.buffer)
+            return self.data
+
+        # Copy everything in between the tombstones
+        view = memoryview(self.buffer)
+        chunks = []
+        position = 0
+
+        for offset, length in sorted(self.tombstones):
+            chunks.append(view[position:offset])
+            position = offset + length
+
+        chunks.append(view[position:])
+        self.data = b"".join(chunks)
+        view.release()
+        return self.data
+
+class PresenceBundle:
+    """
+    PresenceBundle is used for clients that receive a list of user ids on
+    login (b20121224+), and request the presences they need by themselves.
+    """
+
+    def __init__(self, client: Type[BanchoIO]) -> None:
+        self.client = client
+        self.users: Dict[int, UserInfo] = {}
+        self.data: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def add(self, info: UserInfo) -> None:
+        if info.id not in self.users:
+            self.data = None
+
+        self.users[info.id] = info
+
+    def remove(self, user_id: int) -> None:
+        if self.users.pop(user_id, None) is not None:
+            self.data = None
+
+    def encode(self) -> bytes:
+        if self.data is None:
+            self.data = self.client.encode_packet(
+                PacketType.BanchoUserPresenceBundle,
+                list(self.users.values())
+            )
+
+        return self.data
+
+class PresenceSnapshot:
+    """
+    PresenceSnapshot keeps the presences of every online user pre-encoded, once
+    for every group of clients that encode the packet the same way. Adding, updating
+    and removing a user only re-encodes that single user, so that a login can be
+    served with a single write, instead of encoding every presence again.
+
+    By default it holds the `BanchoUserPresenceBundle` that is sent on login.
+    A snapshot of `BanchoUserPresence` can be used to answer `OsuPresenceRequestAll`.
+    """
+
+    def __init__(self, packet: PacketType = PacketType.BanchoUserPresenceBundle) -> None:
+        if packet not in SnapshotPackets:
+            raise ValueError(f"Packet '{packet.name}' is not a presence packet")
+
+        self.packet = packet
+        self.users: Dict[int, UserInfo] = {}
+        self.classes: Dict[int, Union[PresenceSegments, PresenceBundle]] = {}
+        self.table: Optional[EquivalenceTable] = None
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.users
+
+    def __iter__(self) -> Iterator[UserInfo]:
+        return iter(self.users.values())
+
+    def add(self, info: UserInfo) -> None:
+        """Add a user to the snapshot, or re-encode its presence if it already exists"""
+        self.users[info.id] = info
+
+        for presences in self.resolve_classes().values():
+            presences.add(info)
+
+    def update(self, info: UserInfo) -> None:
+        """Re-encode the presence of a user"""
+        self.add(info)
+
+    def remove(self, user_id: int) -> None:
+        """Remove a user from the snapshot, if it exists"""
+        if self.users.pop(user_id, None) is None:
+            return
+
+        for presences in self.resolve_classes().values():
+            presences.remove(user_id)
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.classes.clear()
+
+    def encode(self, client: Union[BanchoIO, Type[BanchoIO]]) -> bytes:
+        """Return the encoded presences of every user for the given client"""
+        client_class = resolve_client_class(client)
+        classes = self.resolve_classes()
+        class_id = self.table.class_id(client_class)
+
+        if class_id not in classes:
+            classes[class_id] = self.create_presences(client_class)
+
+        return classes[class_id].encode()
+
+    def write(self, client: Union[BanchoIO, Type[BanchoIO]], stream: Stream) -> None:
+        """Write the presences of every user to the stream, at once"""
+        data = self.encode(client)
+
+        if data:
+            stream.write(data)
+
+    async def write_async(self, client: Union[BanchoIO, Type[BanchoIO]], stream: AsyncStream) -> None:
+        """Write the presences of every user to the stream at once, asynchronously"""
+        data = self.encode(client)
+
+        if data:
+            await stream.write(data)
+
+    def resolve_classes(self) -> Dict[int, Union[PresenceSegments, PresenceBundle]]:
+        self.table, changed = refresh_equivalence_table(self.packet, self.table)
+
+        if changed:
+            self.classes.clear()
+
+        return self.classes
+
+    def create_presences(self, client: Type[BanchoIO]) -> Union[PresenceSegments, PresenceBundle]:
+        presences = (
+            PresenceSegments(client, self.packet)
+            if self.is_segmented(client, self.packet) else
+            PresenceBundle(client)
+        )
+
+        for info in self.users.values():
+            presences.add(info)
+
+        return presences
+
+    @staticmethod
+    def is_segmented(client: Type[BanchoIO], packet: PacketType) -> bool:
+        """
+        Check if a client encodes the presence bundle as one packet per user, e.g. b282 which
+        only knows about stats updates, in which case the bundle can be split up into segments.
+        """
+        if packet != PacketType.BanchoUserPresenceBundle:
+            return True
+
+        packet_writer = client.packet_handler(packet)
+
+        if not packet_writer:
+            return True
+
+        # The frames are compared before compression, since gzip
+        # would include the time they were compressed at
+        infos: List[UserInfo] = [UserInfo(id=1, name="a"), UserInfo(id=2, name="b")]
+        bundle = list(packet_writer(infos))
+        segments = [frame for info in infos for frame in packet_writer([info])]
+        return bundle == segments
@@ -0,0 +1,189 @@
+
+from struct import Struct, error as StructError
+from typing import Any, Dict, Optional, Tuple
+
+import traceback
+import logging
+import re
+
+__all__ = [
+    "S8", "U8", "S16", "U16", "S32", "U32", "S64", "U64",
+    "F32", "F64", "Bool",
+    "PacketHeader",
+    "PacketHeaderCompressed",
+    "StatsLegacy",
+    "StatsRankShort",
+    "Stats",
+    "StatsSignedPP",
+    "StatsUnsignedPP",
+    "PresenceLocale",
+    "PresenceTail",
+    "PresenceTailRanked",
+    "PresenceTailModes",
+    "PresenceCompact",
+    "StatusBeatmap",
+    "StatusBeatmapFullMods",
+    "ReplayFrameLegacy",
+    "ReplayFrameButtons",
+    "ScoreFrameBase",
+    "ScoreFrameTimed",
+    "ScoreFrameTagged",
+    "ScoreFrameScoreV2",
+    "ScoreFramePortions",
+    "MatchHeaderLegacy",
+    "MatchHeader",
+    "MatchHeaderFullMods",
+    "MatchFooter",
+    "BeatmapInfoLegacy",
+    "BeatmapInfoRanks",
+    "BeatmapInfoModeRanks",
+    "clamp",
+    "pack",
+    "pack_into",
+    "unpack_from",
+    "logger"
+]
+
+logger = logging.getLogger('chio.py')
+
+# Fixed-width integer & floating point types
+S8  = Struct("<b")
+U8  = Struct("<B")
+S16 = Struct("<h")
+U16 = Struct("<H")
+S32 = Struct("<i")
+U32 = Struct("<I")
+S64 = Struct("<q")
+U64 = Struct("<Q")
+F32 = Struct("<f")
+F64 = Struct("<d")
+Bool = Struct("<?")
+
+# Packet headers: packet id, (compression,) body length
+PacketHeader = Struct("<HI")
+PacketHeaderCompressed = Struct("<H?I")
+
+# User stats: ranked score, accuracy, playcount, total score, rank (, pp)
+StatsLegacy     = Struct("<QdIQI")
+StatsRankShort  = Struct("<QfIQH")
+Stats           = Struct("<QfIQI")
+StatsSignedPP   = Struct("<QfIQIh")
+StatsUnsignedPP = Struct("<QfIQIH")
+
+# User presence: avatar extension, timezone, country
+PresenceLocale = Struct("<BBB")
+
+# User presence: permissions, longitude, latitude (, rank (, mode))
+PresenceTail       = Struct("<Bff")
+PresenceTailRanked = Struct("<Bffi")
+PresenceTailModes  = Struct("<BffiB")
+
+# User presence (b20121203+): timezone, country, permissions, longitude, latitude, rank, mode
+PresenceCompact = Struct("<BBBffiB")
+
+# User status: mods, mode, beatmap id
+StatusBeatmap         = Struct("<HBi")
+StatusBeatmapFullMods = Struct("<IBi")
+
+# Replay frames: buttons, legacy byte, mouse x, mouse y, time
+ReplayFrameLegacy  = Struct("<??ffi")
+ReplayFrameButtons = Struct("<B?ffi")
+
+# Score frames: (time,) id, 300s, 100s, 50s, gekis, katus, misses,
+# total score, max combo, current combo, perfect, hp (, tag (, scorev2))
+ScoreFrameBase     = Struct("<BHHHHHHIHH?B")
+ScoreFrameTimed    = Struct("<iBHHHHHHIHH?B")
+ScoreFrameTagged   = Struct("<iBHHHHHHIHH?BB")
+ScoreFrameScoreV2  = Struct("<iBHHHHHHIHH?BB?")
+ScoreFramePortions = Struct("<dd")
+
+# Match: id, in progress, type, mods
+MatchHeaderLegacy   = Struct("<B?BH")
+MatchHeader         = Struct("<H?BH")
+MatchHeaderFullMods = Struct("<H?BI")
+
+# Match: host id, mode, scoring type, team type
+MatchFooter = Struct("<iBBB")
+
+# Beatmap info: index, beatmap id, beatmapset id, thread id, ranked status,
+# osu! rank (, fruits rank, taiko rank)
+BeatmapInfoLegacy    = Struct("<hiii?b")
+BeatmapInfoRanks     = Struct("<hiiibb")
+BeatmapInfoModeRanks = Struct("<hiiibbbb")
+
+FormatPattern = re.compile(r"(\d*)([xcbB?hHiIlLqQnNefdspP])")
+FormatBounds: Dict[str, Optional[Tuple[int, int]]] = {
+    "b": (-0x80, 0x7F),
+    "B": (0x00, 0xFF),
+    "h": (-0x8000, 0x7FFF),
+    "H": (0x0000, 0xFFFF),
+    "i": (-0x80000000, 0x7FFFFFFF),
+    "I": (0x00000000, 0xFFFFFFFF),
+    "q": (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF),
+    "Q": (0x0000000000000000, 0xFFFFFFFFFFFFFFFF)
+}
+StructBounds: Dict[str, Tuple[Optional[Tuple[int, int]], ...]] = {}
+
+def clamp(value: int, min_value: int, max_value: int, stacklevel: int = 3) -> int:
+    clamped = max(min_value, min(value, max_value))
+
+    if clamped != value:
+        stack = traceback.extract_stack()
+        caller = stack[-stacklevel]
+        logger.warning(
+            f"Value '{value}' was clamped to '{clamped}' "
+            f"({caller.filename}:{caller.lineno} in '{caller.name}')"
+        )
+
+    return clamped
+
+def resolve_bounds(structure: Struct) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """Resolve the integer bounds of every field inside a struct"""
+    if structure.format in StructBounds:
+        return StructBounds[structure.format]
+
+    bounds = []
+
+    for count, code in FormatPattern.findall(structure.format):
+        bounds.extend([FormatBounds.get(code)] * int(count or 1))
+
+    StructBounds[structure.format] = tuple(bounds)
+    return StructBounds[structure.format]
+
+def clamp_values(structure: Struct, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    clamped = []
+
+    # The caller of the `write_*` function is five frames up
+    for value, bounds in zip(values, resolve_bounds(structure)):
+        clamped.append(clamp(value, *bounds, stacklevel=5) if bounds else value)
+
+    return tuple(clamped)
+
+def pack(structure: Struct, *values) -> bytes:
+    """
+    Pack the given values with a precompiled struct. Integers that
+    are out of range get clamped, like in the `write_*` functions.
+    """
+    try:
+        return structure.pack(*values)
+    except StructError:
+        return structure.pack(*clamp_values(structure, values))
+
+def pack_into(structure: Struct, buffer: bytearray, offset: int, *values) -> int:
+    """
+    Pack the given values into a writable buffer at the given offset,
+    and return the offset after the packed values.
+    """
+    try:
+        structure.pack_into(buffer, offset, *values)
+    except StructError:
+        structure.pack_into(buffer, offset, *clamp_values(structure, values))
+
+    return offset + structure.size
+
+def unpack_from(structure: Struct, buffer: bytes, offset: int = 0) -> Tuple[Tuple[Any, ...], int]:
+    """
+    Unpack the values of a precompiled struct from a buffer at
+    the given offset, and return them with the offset after them.
+    """
+    return structure.unpack_from(buffer, offset), offset + structure.size
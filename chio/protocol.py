@@ -0,0 +1,42 @@
+
+from typing import Any, Optional
+from asyncio import BaseTransport, Protocol, Transport
+from .constants import PacketType
+from .decoder import PacketDecoder
+from .chio import BanchoIO
+
+class BanchoProtocol(Protocol):
+    """
+    BanchoProtocol is an asyncio protocol, that decodes the packets of a
+    single connection as they arrive. Every packet that was completed by
+    a network read is passed to `packet_received`, in the same loop pass.
+    It only relies on the transport interface, so it also works with uvloop.
+    """
+
+    def __init__(self, client: BanchoIO) -> None:
+        self.client = client
+        self.decoder = PacketDecoder(client)
+        self.transport: Optional[Transport] = None
+
+    def connection_made(self, transport: BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+        self.decoder.clear()
+
+    def data_received(self, data: bytes) -> None:
+        for packet, packet_data in self.decoder.feed(data):
+            self.packet_received(packet, packet_data)
+
+    def packet_received(self, packet: PacketType, data: Any) -> None:
+        """
+        Called for every decoded packet. Override this to handle them.
+        """
+        ...
+
+    def write_packet(self, packet: PacketType, *args) -> None:
+        """
+        Encodes a packet and writes it to the transport.
+        """
+        self.transport.write(self.client.write_packet_to_bytes(packet, *args))
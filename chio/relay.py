@@ -0,0 +1,254 @@
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+from .analysis import equivalence_table, resolve_client_class
+from .constants import ButtonState, Mods, PacketType, ReplayAction, SlotStatus, SlotTeam
+from .types import Match, MatchSlot, ReplayFrame, ReplayFrameBundle, ScoreFrame
+from .chio import BanchoIO, BanchoIOMeta
+from .io import MemoryStream, decompress
+
+# Client packets that can be converted straight into a server packet for another client
+TranscodePackets: Dict[PacketType, PacketType] = {
+    PacketType.OsuSpectateFrames: PacketType.BanchoSpectateFrames,
+    PacketType.OsuMatchCreate: PacketType.BanchoMatchNew,
+    PacketType.OsuMatchChangeSettings: PacketType.BanchoMatchUpdate
+}
+
+# Cached layout comparisons between two client classes for a
+# client packet, along with the client revision they were computed for
+PacketLayouts: Dict[Tuple[type, type, PacketType], Tuple[int, bool]] = {}
+
+def create_probe_bundles(client: Type[BanchoIO]) -> List[ReplayFrameBundle]:
+    """
+    Bundles that cover every optional part of the spectate frames layout, i.e. the
+    score frame, the extra field of protocol 18 and the sequence of b20160404.
+    """
+    frames = [
+        ReplayFrame(ButtonState.Left1 | ButtonState.Right2, 0, 256.5, 192.25, 1000),
+        ReplayFrame(ButtonState.Smoke, 0, -12.0, 400.0, 1016)
+    ]
+    # The time of the score frame is not sent by every client, so it's left at zero
+    score_frame = ScoreFrame(
+        0, 3, 100, 10, 1, 20, 5, 2, 1234567, 300, 120, False, 200, 0,
+        using_scorev2=True, combo_portion=0.5, bonus_portion=0.25
+    )
+    return [
+        ReplayFrameBundle(ReplayAction.Standard, frames, None, 7, 5),
+        ReplayFrameBundle(ReplayAction.Skip, frames, score_frame, 7, 5)
+    ]
+
+def create_probe_matches(client: Type[BanchoIO]) -> List[Match]:
+    """
+    Matches that cover the slot layout of the client, with & without freemod.
+    """
+    matches = []
+
+    for freemod in (False, True):
+        slots = [MatchSlot() for _ in range(client.slot_size)]
+        slots[0] = MatchSlot(2, SlotStatus.NotReady, SlotTeam.Red, Mods.Hidden)
+        slots[1] = MatchSlot(3, SlotStatus.Ready, SlotTeam.Blue, Mods.HardRock)
+        slots[-1] = MatchSlot(status=SlotStatus.Locked)
+        matches.append(Match(
+            id=12, in_progress=False, mods=Mods.NoMod, name="Probe", password="secret",
+            beatmap_text="Artist - Title [Insane]", beatmap_id=75, beatmap_checksum="a" * 32,
+            slots=slots, host_id=2, freemod=freemod, seed=1234
+        ))
+
+    return matches
+
+# Probes for every server packet, based on the client that sends the packet
+ProbeFactories: Dict[PacketType, Callable[[Type[BanchoIO]], List[Any]]] = {
+    PacketType.BanchoSpectateFrames: create_probe_bundles,
+    PacketType.BanchoMatchNew: create_probe_matches,
+    PacketType.BanchoMatchUpdate: create_probe_matches
+}
+
+def encode_body(client: Type[BanchoIO], packet: PacketType, *args) -> Optional[bytes]:
+    """Encode the body of a server packet without its header, if it consists of exactly one packet"""
+    packet_writer = client.packet_handler(packet)
+
+    if not packet_writer:
+        return None
+
+    packets = list(packet_writer(*args))
+
+    if len(packets) != 1 or packets[0][0] != packet:
+        return None
+
+    return packets[0][1]
+
+def decode_body(client: Type[BanchoIO], packet: PacketType, packet_data: bytes) -> Any:
+    """Decode the body of a client packet without its header"""
+    return client.packet_handler(packet)(MemoryStream(packet_data))
+
+def layouts_match(
+    source: Union[BanchoIO, Type[BanchoIO]],
+    target: Union[BanchoIO, Type[BanchoIO]],
+    packet: PacketType = PacketType.OsuSpectateFrames
+) -> bool:
+    """
+    Check if the body of a client packet sent by the source client can be forwarded to
+    the target client as it is, inside of the server packet from `TranscodePackets`.
+    This is verified with probes, whose body sent by the source client needs to
+    produce the same body after decoding it and encoding it for the target client.
+    """
+    source_class = resolve_client_class(source)
+    target_class = resolve_client_class(target)
+    cached = PacketLayouts.get((source_class, target_class, packet))
+
+    if cached is not None and cached[0] == BanchoIOMeta.revision:
+        return cached[1]
+
+    output_packet = TranscodePackets[packet]
+    table = equivalence_table(output_packet)
+
+    if source_class is target_class or table.class_id(source_class) == table.class_id(target_class):
+        # Clients are assumed to send their packets in the same layout as they receive them
+        result = source_class.implements_packet(packet)
+    else:
+        result = source_class.implements_packet(packet) and all(
+            compare_probe(source_class, target_class, packet, output_packet, probe)
+            for probe in ProbeFactories[output_packet](source_class)
+        )
+
+    PacketLayouts[(source_class, target_class, packet)] = (BanchoIOMeta.revision, result)
+    return result
+
+def compare_probe(
+    source: Type[BanchoIO],
+    target: Type[BanchoIO],
+    packet: PacketType,
+    output_packet: PacketType,
+    probe: Any
+) -> bool:
+    packet_data = encode_body(source, output_packet, probe)
+
+    if packet_data is None:
+        return False
+
+    decoded = decode_body(source, packet, packet_data)
+
+    if isinstance(decoded, Match) and len(decoded.slots) != target.slot_size:
+        # Matches with a different amount of slots can't share a layout,
+        # and would only get clamped by the writers of older clients
+        return False
+
+    return encode_body(target, output_packet, decoded) == packet_data
+
+def spectate_layouts_match(
+    source: Union[BanchoIO, Type[BanchoIO]],
+    target: Union[BanchoIO, Type[BanchoIO]]
+) -> bool:
+    """
+    Check if the spectate frames sent by the source client
+    can be forwarded to the target client as they are.
+    """
+    return layouts_match(source, target, PacketType.OsuSpectateFrames)
+
+def relay_packet(
+    data: bytes,
+    source: Union[BanchoIO, Type[BanchoIO]],
+    target: Union[BanchoIO, Type[BanchoIO]],
+    packet: PacketType,
+    decoded: Optional[Any] = None
+) -> bytes:
+    """
+    Convert the decompressed body of a client packet sent by the source client into the
+    server packet from `TranscodePackets` for the target client. If both clients use the
+    same layout, the body is only wrapped into a new header, otherwise it gets decoded &
+    encoded again. Returns an empty bytestring if the target does not implement the packet.
+    """
+    source_class = resolve_client_class(source)
+    target_class = resolve_client_class(target)
+    output_packet = TranscodePackets.get(packet)
+
+    if output_packet is None:
+        raise ValueError(f"Packet '{packet.name}' can not be transcoded")
+
+    if not target_class.implements_packet(output_packet):
+        return b""
+
+    if layouts_match(source_class, target_class, packet):
+        stream = MemoryStream()
+        target_class.write_packet_frame(stream, output_packet, data)
+        return stream.data
+
+    if decoded is None:
+        decoded = decode_body(source_class, packet, data)
+
+    return target_class.write_packet_to_bytes(output_packet, decoded)
+
+def relay_spectate_frames(
+    data: bytes,
+    source: Union[BanchoIO, Type[BanchoIO]],
+    target: Union[BanchoIO, Type[BanchoIO]],
+    bundle: Optional[ReplayFrameBundle] = None
+) -> bytes:
+    """
+    Convert the decompressed body of an `OsuSpectateFrames` packet sent by the source
+    client into a `BanchoSpectateFrames` packet for the target client. If both clients
+    use the same layout, the body is only wrapped into a new header. Otherwise it gets
+    decoded & encoded again, e.g. for b282 spectators or the sequence of b20160404.
+    """
+    return relay_packet(data, source, target, PacketType.OsuSpectateFrames, bundle)
+
+def relay_spectate_frames_for_clients(
+    data: bytes,
+    source: Union[BanchoIO, Type[BanchoIO]],
+    clients: Iterable[Union[BanchoIO, Type[BanchoIO]]]
+) -> Dict[Type[BanchoIO], bytes]:
+    """
+    Convert the body of an `OsuSpectateFrames` packet for every spectator, and return the
+    encoded bytes for each client class. The body is only decoded once, if at all, and
+    every packet is only encoded once per group of equivalent clients.
+    """
+    source_class = resolve_client_class(source)
+    table = equivalence_table(PacketType.BanchoSpectateFrames)
+    encoded: Dict[int, bytes] = {}
+    result: Dict[Type[BanchoIO], bytes] = {}
+    bundle: Optional[ReplayFrameBundle] = None
+
+    for client in clients:
+        client_class = resolve_client_class(client)
+
+        if client_class in result:
+            continue
+
+        class_id = table.class_id(client_class)
+
+        if class_id not in encoded:
+            if bundle is None and not spectate_layouts_match(source_class, client_class):
+                bundle = decode_body(source_class, PacketType.OsuSpectateFrames, data)
+
+            encoded[class_id] = relay_spectate_frames(data, source_class, client_class, bundle)
+
+        result[client_class] = encoded[class_id]
+
+    return result
+
+def transcode(
+    packet_bytes: bytes,
+    from_client: Union[BanchoIO, Type[BanchoIO]],
+    to_client: Union[BanchoIO, Type[BanchoIO]]
+) -> bytes:
+    """
+    Convert the packets sent by one client, including their headers, into the matching
+    server packets for another client, see `TranscodePackets`. The bodies are forwarded
+    as they are, whenever both clients use the same layout for a packet.
+    """
+    source_class = resolve_client_class(from_client)
+    output = MemoryStream()
+    offset = 0
+
+    for frame in source_class.iter_frames(packet_bytes):
+        packet_data = frame.data(packet_bytes)
+
+        if frame.compressed:
+            packet_data = decompress(packet_data)
+
+        output.write(relay_packet(packet_data, source_class, to_client, frame.packet))
+        offset = frame.end
+
+    if offset != len(packet_bytes):
+        raise ValueError(f"Incomplete packet at offset '{offset}'")
+
+    return output.data
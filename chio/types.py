@@ -1,11 +1,12 @@
 
 from .constants import *
-from dataclasses import dataclass, field
-from functools import cached_property
-from typing import List, Optional
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from operator import attrgetter
 from hashlib import md5
 
 __all__ = [
+    "Tracked",
     "UserInfo",
     "UserPresence",
     "UserStats",
@@ -22,11 +23,98 @@ __all__ = [
     "MatchSlot",
     "Match",
     "MatchJoin",
-    "TitleUpdate"
+    "TitleUpdate",
+    "slotted",
+    "SlottedUserInfo",
+    "SlottedUserPresence",
+    "SlottedUserStats",
+    "SlottedUserStatus",
+    "SlottedMessage",
+    "SlottedReplayFrame",
+    "SlottedScoreFrame",
+    "SlottedMatchSlot",
+    "SlottedMatch"
 ]
 
+# Getters for the field values of every tracked class, which make up their revision,
+# by the class and the names of the fields that were left out
+RevisionGetters: Dict[Tuple[type, Tuple[str, ...]], Callable[[Any], Hashable]] = {}
+
+def revision_fields(cls: type, exclude: Tuple[str, ...] = ()) -> List[str]:
+    """
+    Return the names of every field of a dataclass, where nested dataclasses, e.g.
+    the status of a user info, are replaced by the dotted names of their fields.
+    """
+    names = []
+
+    for item in fields(cls):
+        if item.name in exclude:
+            continue
+
+        if is_dataclass(item.default_factory):
+            names.extend(f"{item.name}.{name}" for name in revision_fields(item.default_factory))
+            continue
+
+        names.append(item.name)
+
+    return names
+
+def revision_getter(cls: type, exclude: Tuple[str, ...] = ()) -> Callable[[Any], Hashable]:
+    """Return a getter for the field values of a dataclass, which are read in a single call"""
+    getter = RevisionGetters.get((cls, exclude))
+
+    if getter is None:
+        getter = RevisionGetters[(cls, exclude)] = attrgetter(*revision_fields(cls, exclude))
+
+    return getter
+
+class Tracked:
+    """
+    Tracked objects can cache encoded representations of themselves. Once `enable_cache`
+    was called, they are reused until the revision of the object changes. The revision
+    consists of the field values, which are only read when a cache is used, so that
+    assigning fields does not come with any overhead.
+    """
+    __slots__ = ()
+    _encoded: Optional[Dict[Hashable, Tuple[Hashable, Any]]] = None
+
+    @property
+    def revision(self) -> Hashable:
+        return revision_getter(type(self))(self)
+
+    @property
+    def cache_enabled(self) -> bool:
+        # Slotted variants don't fall back to the class attribute
+        return getattr(self, "_encoded", None) is not None
+
+    def enable_cache(self) -> None:
+        if not self.cache_enabled:
+            object.__setattr__(self, "_encoded", {})
+
+    def disable_cache(self) -> None:
+        object.__setattr__(self, "_encoded", None)
+
+    def cached(self, key: Hashable, encode: Callable[..., Any], *args) -> Any:
+        """
+        Return the cached value for the given key, or call `encode` with the
+        arguments if the object has changed since then. Nothing is cached,
+        as long as the cache of this object is not enabled.
+        """
+        if not self.cache_enabled:
+            return encode(*args)
+
+        revision = self.revision
+        cached = self._encoded.get(key)
+
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        value = encode(*args)
+        self._encoded[key] = (revision, value)
+        return value
+
 @dataclass
-class UserPresence:
+class UserPresence(Tracked):
     is_irc: bool = False
     timezone: int = 0
     country_index: int = 0
@@ -51,7 +139,7 @@ class UserPresence:
         )
 
 @dataclass
-class UserStats:
+class UserStats(Tracked):
     rank: int = 0
     rscore: int = 0
     tscore: int = 0
@@ -60,7 +148,7 @@ class UserStats:
     pp: int = 0
 
 @dataclass
-class UserStatus:
+class UserStatus(Tracked):
     action: Status = Status.Idle
     text: str = ""
     mods: Mods = Mods.NoMod
@@ -79,13 +167,17 @@ class UserStatus:
         self.update_stats = False
 
 @dataclass
-class UserInfo:
+class UserInfo(Tracked):
     id: int = 0
     name: str = ""
     presence: UserPresence = field(default_factory=UserPresence)
     status: UserStatus = field(default_factory=UserStatus)
     stats: UserStats = field(default_factory=UserStats)
 
+    def enable_cache(self) -> None:
+        Tracked.enable_cache(self)
+        self.status.enable_cache()
+
     @property
     def avatar_filename(self) -> str:
         return f"{self.id}_000.png"
@@ -101,11 +193,19 @@ class Message:
     content: str
     target: str
     sender_id: int = -1
+    _formatted_content = None
 
-    @cached_property
+    @property
     def content_markdown_formatted(self) -> str:
         """Return the message content in the legacy, markdown-ish format"""
-        return ChatLinkModern.sub(r"(\2)[\1]", self.content)
+        formatted = getattr(self, "_formatted_content", None)
+
+        # Cached for as long as the content stays the same
+        if formatted is None or formatted[0] is not self.content:
+            formatted = (self.content, ChatLinkModern.sub(r"(\2)[\1]", self.content))
+            object.__setattr__(self, "_formatted_content", formatted)
+
+        return formatted[1]
 
     @property
     def is_direct_message(self) -> bool:
@@ -113,7 +213,7 @@ class Message:
         return not self.target.startswith("#")
 
 @dataclass
-class Channel:
+class Channel(Tracked):
     name: str
     topic: str = ""
     owner: str = "BanchoBot"
@@ -267,7 +367,7 @@ class ReplayFrameBundle:
     sequence: Optional[int] = None
 
 @dataclass
-class MatchSlot:
+class MatchSlot(Tracked):
     user_id: int = -1
     status: SlotStatus = SlotStatus.Open
     team: SlotTeam = SlotTeam.Neutral
@@ -284,7 +384,7 @@ class MatchSlot:
         self.mods = Mods.NoMod
 
 @dataclass
-class Match:
+class Match(Tracked):
     id: int = 0
     in_progress: bool = False
     type: MatchType = MatchType.Standard
@@ -302,6 +402,15 @@ class Match:
     freemod: bool = False
     seed: int = 0
 
+    @property
+    def revision(self) -> Hashable:
+        # Slots are compared by position, so that moving,
+        # adding or removing any of them is noticed as well
+        return (
+            revision_getter(type(self), ("slots",))(self),
+            tuple(slot.revision for slot in self.slots)
+        )
+
 @dataclass
 class MatchJoin:
     match_id: int = -1
@@ -311,3 +420,71 @@ class MatchJoin:
 class TitleUpdate:
     image_url: str = ""
     redirect_url: str = ""
+
+# Slotted variants of the types above, which are created on demand
+SlottedTypes: Dict[type, type] = {}
+
+def slotted(cls: type) -> type:
+    """
+    Return a variant of a dataclass, that stores its fields inside of `__slots__`
+    instead of a `__dict__`. It keeps the same fields and defaults, so it can be used
+    with every client. Nested dataclasses that are created by default factories are
+    replaced with their slotted variants as well.
+    """
+    if cls in SlottedTypes:
+        return SlottedTypes[cls]
+
+    # Defaults are moved into the generated __init__ by the dataclass, while
+    # private attributes, e.g. caches, get a slot of their own
+    field_names = tuple(item.name for item in fields(cls))
+    private_names = tuple(
+        name
+        for base in cls.__mro__
+        for name, value in vars(base).items()
+        if name.startswith("_") and not name.startswith("__")
+        and not callable(value) and not hasattr(value, "__get__")
+    )
+    generated_names = (
+        "__init__", "__repr__", "__eq__", "__hash__", "__match_args__",
+        "__dataclass_fields__", "__dataclass_params__", "__dict__", "__weakref__"
+    )
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in generated_names and name not in private_names
+    }
+    namespace["__annotations__"] = dict(cls.__annotations__)
+
+    for item in fields(cls):
+        if item.default_factory is MISSING:
+            continue
+
+        default_factory = item.default_factory
+
+        if is_dataclass(default_factory):
+            default_factory = slotted(default_factory)
+
+        namespace[item.name] = field(default_factory=default_factory)
+
+    name = f"Slotted{cls.__name__}"
+    namespace["__qualname__"] = name
+    template = dataclass(type(name, cls.__bases__, namespace))
+
+    namespace = {
+        name: value
+        for name, value in vars(template).items()
+        if name not in field_names and name not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = (*field_names, *dict.fromkeys(private_names))
+    SlottedTypes[cls] = type(name, cls.__bases__, namespace)
+    return SlottedTypes[cls]
+
+SlottedUserPresence = slotted(UserPresence)
+SlottedUserStats = slotted(UserStats)
+SlottedUserStatus = slotted(UserStatus)
+SlottedUserInfo = slotted(UserInfo)
+SlottedMessage = slotted(Message)
+SlottedReplayFrame = slotted(ReplayFrame)
+SlottedScoreFrame = slotted(ScoreFrame)
+SlottedMatchSlot = slotted(MatchSlot)
+SlottedMatch = slotted(Match)
@@ -1,8 +1,31 @@
 
-from .clients import ClientDict, LowestVersion, HighestVersion
+from typing import Dict, List, Tuple, Type
+from functools import lru_cache
+from bisect import bisect_left
+from .clients import ClientDict
 from .constants import CountryAcronyms
 from .chio import BanchoIO
 
+# Sorted upper bounds of every version range inside `ClientDict`,
+# which is updated in place by `client_versions` once it changes
+ClientVersions: List[int] = sorted(ClientDict)
+ClientVersionsRevision = ClientDict.revision
+
+def client_versions() -> List[int]:
+    """
+    Return the sorted upper bounds of every version range inside `ClientDict`, and
+    discard the cached client selections, if versions were added or replaced since.
+    """
+    global ClientVersionsRevision
+
+    if ClientVersionsRevision != ClientDict.revision:
+        ClientVersions[:] = sorted(ClientDict)
+        ClientVersionsRevision = ClientDict.revision
+        select_cached_client.cache_clear()
+        resolve_client_version_ranges.cache_clear()
+
+    return ClientVersions
+
 def resolve_country_index(country_acronym: str) -> int:
     """
     Resolve the country index from the acronym.
@@ -15,26 +38,50 @@ def resolve_country_index(country_acronym: str) -> int:
 
 def select_client(version: int) -> BanchoIO:
     """Select the appropriate client based on the version provided."""
-    if version in ClientDict:
-        return ClientDict[version]
-    
-    if version < LowestVersion:
-        return ClientDict[LowestVersion]
-    
-    if version > HighestVersion:
-        return ClientDict[HighestVersion]
-    
-    for client_version, client in ClientDict.items():
-        if version < client_version:
-            return client
-
-    # This should never happen, but just in case
-    return ClientDict[HighestVersion]
+    client_versions()
+    return select_cached_client(version)
+
+@lru_cache(maxsize=1024)
+def select_cached_client(version: int) -> BanchoIO:
+    if version <= ClientVersions[0]:
+        return ClientDict[ClientVersions[0]]
+
+    if version >= ClientVersions[-1]:
+        return ClientDict[ClientVersions[-1]]
+
+    # Versions in between two entries use the client of the next higher one
+    index = bisect_left(ClientVersions, version)
+    return ClientDict[ClientVersions[index]]
+
+def client_version_ranges() -> Dict[Type[BanchoIO], Tuple[Tuple[int, int], ...]]:
+    """
+    Return the inclusive version ranges, that each client class is selected for.
+    Versions outside of the lowest and highest version are clamped to those.
+    """
+    client_versions()
+    return resolve_client_version_ranges()
+
+@lru_cache(maxsize=None)
+def resolve_client_version_ranges() -> Dict[Type[BanchoIO], Tuple[Tuple[int, int], ...]]:
+    ranges: Dict[Type[BanchoIO], List[Tuple[int, int]]] = {}
+    start = ClientVersions[0]
+
+    for version in ClientVersions:
+        client_ranges = ranges.setdefault(type(ClientDict[version]), [])
+
+        if client_ranges and client_ranges[-1][1] == start - 1:
+            # Merge with the previous range of the same client
+            start = client_ranges.pop()[0]
+
+        client_ranges.append((start, version))
+        start = version + 1
+
+    return {client: tuple(client_ranges) for client, client_ranges in ranges.items()}
 
 def select_latest_client() -> BanchoIO:
     """Select the latest client available."""
-    return ClientDict[HighestVersion]
+    return ClientDict[client_versions()[-1]]
 
 def select_initial_client() -> BanchoIO:
     """Select the oldest client available."""
-    return ClientDict[LowestVersion]
+    return ClientDict[client_versions()[0]]
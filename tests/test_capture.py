@@ -0,0 +1,104 @@
+from chio.capture import CaptureReader, CaptureWriter, RecordKind
+from chio.constants import PacketType
+from chio.types import Message
+from chio.io import MemoryStream
+from chio.utils import select_client
+
+import pytest
+
+Versions = (282, 334, 20160404)
+
+def record_session(capture: CaptureWriter, version: int, data: bytes, chunk_size: int) -> int:
+    inner = MemoryStream()
+    inner.write(data)
+    inner.seek(0)
+
+    stream = capture.stream(inner, version, "127.0.0.1")
+
+    for _ in range(0, len(data), chunk_size):
+        stream.read(chunk_size)
+
+    stream.write(select_client(version).write_packet_to_bytes(PacketType.BanchoPing))
+    stream.close()
+    return stream.session
+
+def client_packets(version: int, amount: int = 3) -> bytes:
+    io = select_client(version)
+    return b"".join(
+        io.write_client_packet_to_bytes(PacketType.OsuMessage, Message("user", "x" * index * 10, "#osu"))
+        for index in range(amount)
+    ) + io.write_client_packet_to_bytes(PacketType.OsuPong)
+
+def incoming_types(reader: CaptureReader, session: int):
+    return [p.packet for p in reader.packets(session=session, direction=RecordKind.Incoming)]
+
+@pytest.mark.parametrize("version", Versions)
+@pytest.mark.parametrize("chunk_size", (1, 2, 5, 4096))
+def test_split_headers(tmp_path, version, chunk_size):
+    path = tmp_path / "traffic.cap"
+
+    with CaptureWriter(path) as capture:
+        session = record_session(capture, version, client_packets(version), chunk_size)
+
+    with CaptureReader(path) as reader:
+        assert reader.invalid_streams == 0
+        assert incoming_types(reader, session) == [PacketType.OsuMessage] * 3 + [PacketType.OsuPong]
+
+        for captured in reader.packets(session=session):
+            assert captured.decode()[0] == captured.packet
+
+@pytest.mark.parametrize("version", Versions)
+@pytest.mark.parametrize("username", (b"a", b"someone"))
+@pytest.mark.parametrize("chunk_size", (1, 3, 4096))
+def test_login_request(tmp_path, version, username, chunk_size):
+    path = tmp_path / "traffic.cap"
+    login = username + b"\n" + b"0" * 32 + b"\nb%d|0|0|hash:|0\n" % version
+
+    with CaptureWriter(path) as capture:
+        session = record_session(capture, version, login + client_packets(version), chunk_size)
+
+    with CaptureReader(path) as reader:
+        assert reader.invalid_streams == 0
+        assert incoming_types(reader, session) == [PacketType.OsuMessage] * 3 + [PacketType.OsuPong]
+
+def test_seek_to_packet_time(tmp_path):
+    path = tmp_path / "traffic.cap"
+
+    with CaptureWriter(path) as capture:
+        for version in Versions:
+            record_session(capture, version, client_packets(version, 20), 7)
+
+    with CaptureReader(path) as reader:
+        packets = list(reader.packets())
+        assert packets
+
+        for captured in packets:
+            assert round(captured.time, 6) == round(captured.time_ns / 1e9, 6)
+            assert captured in reader.packets(start=captured.time)
+            assert captured not in reader.packets(end=captured.time)
+            assert all(p.time >= captured.time for p in reader.packets(start=captured.time))
+
+def test_reopen_truncates_partial_record(tmp_path):
+    path = tmp_path / "traffic.cap"
+
+    with CaptureWriter(path) as capture:
+        first = record_session(capture, 334, client_packets(334), 4096)
+        last_time = capture.last_time
+
+    with open(path, "ab") as file:
+        file.write(b"\x01\x02\x00")
+
+    with CaptureReader(path) as reader:
+        amount = len(reader)
+
+    with CaptureWriter(path) as capture:
+        assert capture.last_time == last_time
+        second = record_session(capture, 334, client_packets(334), 4096)
+
+    assert second == first + 1
+
+    with CaptureReader(path) as reader:
+        assert reader.invalid_streams == 0
+        assert len(reader) == amount * 2
+        assert incoming_types(reader, second) == [PacketType.OsuMessage] * 3 + [PacketType.OsuPong]
+        assert [r.time_ns for r in reader.records()] == sorted(r.time_ns for r in reader.records())